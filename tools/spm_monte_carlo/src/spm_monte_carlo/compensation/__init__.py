@@ -3,10 +3,18 @@
 from .plan import CompensationPlan
 from .engine import CompensationEngine
 from .calculator import TierCalculator, BonusCalculator
+from .compiled import CompiledTiers
+from .formula import Formula
+from .periodic import PeriodicEngine
+from .sweep import TierSweep
 
 __all__ = [
     'CompensationPlan',
     'CompensationEngine',
     'TierCalculator',
-    'BonusCalculator'
+    'BonusCalculator',
+    'CompiledTiers',
+    'Formula',
+    'PeriodicEngine',
+    'TierSweep'
 ]
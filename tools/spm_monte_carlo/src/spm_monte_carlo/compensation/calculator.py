@@ -2,10 +2,13 @@
 
 import pandas as pd
 import numpy as np
-from typing import List
+from collections import ChainMap
+from typing import List, Mapping, Optional
 import logging
 
 from .plan import CommissionTier, Bonus
+from .compiled import CompiledTiers
+from .formula import Formula
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +24,12 @@ class TierCalculator:
         """
         Calculate commission based on tiered structure.
 
+        Sales-based percentage tiers pay marginally on the sales inside
+        their band, unless retroactive; quota-based and flat tiers pay when
+        attainment falls in their range (quota_min, quota_max]. The tiers
+        are compiled into a piecewise-linear schedule (see
+        ``CompiledTiers``) and evaluated for all rows at once.
+
         Args:
             performance: DataFrame with performance data
             tiers: List of commission tiers
@@ -34,58 +43,24 @@ class TierCalculator:
             if col not in performance.columns:
                 raise ValueError(f"Missing required column: {col}")
 
-        # Calculate quota attainment
-        quota_attainment = performance['actual_sales'] / performance['quota']
-
-        # Initialize commission
-        commission = pd.Series(0.0, index=performance.index)
-
-        # Sort tiers by quota_min
-        sorted_tiers = sorted(tiers, key=lambda t: t.quota_min)
-
-        for tier in sorted_tiers:
-            # Find rows in this tier range
-            in_tier = (quota_attainment > tier.quota_min) & (quota_attainment <= tier.quota_max)
-
-            if not in_tier.any():
-                continue
-
-            # Calculate base for this tier
-            if tier.applies_to == 'total_sales':
-                # Commission on total sales within tier range
-                tier_min_sales = performance['quota'] * tier.quota_min
-                tier_max_sales = performance['quota'] * tier.quota_max
-
-                # Sales in this tier
-                sales_in_tier = np.minimum(
-                    performance['actual_sales'] - tier_min_sales,
-                    tier_max_sales - tier_min_sales
-                ).clip(lower=0)
-
-                if tier.rate_type == 'percentage':
-                    tier_commission = sales_in_tier * tier.rate_value
-                else:  # flat
-                    tier_commission = pd.Series(tier.rate_value, index=performance.index)
-
-                commission[in_tier] += tier_commission[in_tier]
-
-            elif tier.applies_to == 'quota':
-                # Commission on quota amount
-                if tier.rate_type == 'percentage':
-                    tier_commission = performance['quota'] * tier.rate_value
-                else:
-                    tier_commission = pd.Series(tier.rate_value, index=performance.index)
-
-                commission[in_tier] += tier_commission[in_tier]
-
-            logger.debug(f"Calculated {tier.tier_name} for {in_tier.sum()} reps")
-
-        return commission
+        commission = CompiledTiers(tiers).commission(
+            performance['quota'].to_numpy(), performance['actual_sales'].to_numpy()
+        )
+        return pd.Series(commission, index=performance.index)
 
 
 class BonusCalculator:
     """Calculate bonuses based on triggers."""
 
+    # Supported trigger conditions
+    CONDITIONS = {
+        '>=': np.greater_equal,
+        '>': np.greater,
+        '<=': np.less_equal,
+        '<': np.less,
+        '==': np.equal
+    }
+
     @staticmethod
     def calculate(
         performance: pd.DataFrame,
@@ -101,16 +76,38 @@ class BonusCalculator:
         Returns:
             Series with bonus amounts
         """
-        # Initialize bonus
-        total_bonus = pd.Series(0.0, index=performance.index)
+        total_bonus = np.zeros(len(performance))
+        BonusCalculator.calculate_arrays(performance, bonuses, total_bonus)
+        return pd.Series(total_bonus, index=performance.index)
+
+    @staticmethod
+    def calculate_arrays(
+        metrics: Mapping[str, np.ndarray],
+        bonuses: List[Bonus],
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Add triggered bonuses into a buffer.
 
+        Args:
+            metrics: Mapping of metric name to per-row values (a DataFrame
+                     works); quota_attainment is derived from actual_sales
+                     and quota when absent
+            bonuses: List of bonus definitions
+            out: Per-row buffer the bonus amounts are added to
+
+        Returns:
+            out
+        """
         for bonus in bonuses:
             # Check if metric exists
-            if bonus.trigger_metric not in performance.columns:
+            if bonus.trigger_metric not in metrics:
                 # Try to calculate it
                 if bonus.trigger_metric == 'quota_attainment':
-                    if 'actual_sales' in performance.columns and 'quota' in performance.columns:
-                        metric_values = performance['actual_sales'] / performance['quota']
+                    if 'actual_sales' in metrics and 'quota' in metrics:
+                        metric_values = (
+                            np.asarray(metrics['actual_sales']) / np.asarray(metrics['quota'])
+                        )
                     else:
                         logger.warning(
                             f"Cannot calculate {bonus.trigger_metric} for bonus {bonus.bonus_name}"
@@ -122,34 +119,47 @@ class BonusCalculator:
                     )
                     continue
             else:
-                metric_values = performance[bonus.trigger_metric]
+                metric_values = np.asarray(metrics[bonus.trigger_metric])
 
             # Evaluate trigger condition
-            if bonus.trigger_condition == '>=':
-                triggered = metric_values >= bonus.trigger_value
-            elif bonus.trigger_condition == '>':
-                triggered = metric_values > bonus.trigger_value
-            elif bonus.trigger_condition == '<=':
-                triggered = metric_values <= bonus.trigger_value
-            elif bonus.trigger_condition == '<':
-                triggered = metric_values < bonus.trigger_value
-            elif bonus.trigger_condition == '==':
-                triggered = metric_values == bonus.trigger_value
-            else:
+            condition = BonusCalculator.CONDITIONS.get(bonus.trigger_condition)
+            if condition is None:
                 logger.warning(f"Unknown trigger condition: {bonus.trigger_condition}")
                 continue
+            triggered = condition(metric_values, bonus.trigger_value)
 
             # Apply payout
-            if triggered.any():
-                if bonus.payout_type == 'flat':
-                    total_bonus[triggered] += bonus.payout_value
-                else:
-                    # Formula-based payout (simplified for now)
-                    total_bonus[triggered] += bonus.payout_value
+            if bonus.payout_type == 'formula':
+                payout = BonusCalculator._formula_payout(metrics, bonus)
+                if payout is None:
+                    continue
+            else:
+                payout = bonus.payout_value
+
+            np.add(out, payout, out=out, where=triggered)
+            logger.debug(f"Applied bonus '{bonus.bonus_name}' to {triggered.sum()} reps")
+
+        return out
+
+    @staticmethod
+    def _formula_payout(
+        metrics: Mapping[str, np.ndarray],
+        bonus: Bonus
+    ) -> Optional[np.ndarray]:
+        """Per-row payout of a formula bonus (None if a metric is missing)."""
+        formula = Formula.compile(str(bonus.payout_value))
 
-                logger.debug(f"Applied bonus '{bonus.bonus_name}' to {triggered.sum()} reps")
+        if 'quota_attainment' in formula.variables and 'quota_attainment' not in metrics \
+                and 'actual_sales' in metrics and 'quota' in metrics:
+            attainment = np.asarray(metrics['actual_sales']) / np.asarray(metrics['quota'])
+            metrics = ChainMap({'quota_attainment': attainment}, metrics)
 
-        return total_bonus
+        missing = sorted(name for name in formula.variables if name not in metrics)
+        if missing:
+            logger.warning(f"Metrics {missing} not found for bonus {bonus.bonus_name}")
+            return None
+
+        return formula.evaluate(metrics)
 
 
 class SPIFCalculator:
@@ -167,18 +177,36 @@ class SPIFCalculator:
         Returns:
             Series with SPIF amounts
         """
-        total_spif = pd.Series(0.0, index=performance.index)
+        total_spif = np.zeros(len(performance))
+        SPIFCalculator.calculate_arrays(performance, spifs, total_spif)
+        return pd.Series(total_spif, index=performance.index)
 
+    @staticmethod
+    def calculate_arrays(
+        metrics: Mapping[str, np.ndarray],
+        spifs: List,
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Add earned SPIFs into a buffer.
+
+        Args:
+            metrics: Mapping of metric name to per-row values (a DataFrame works)
+            spifs: List of SPIF definitions
+            out: Per-row buffer the SPIF amounts are added to
+
+        Returns:
+            out
+        """
         for spif in spifs:
-            if spif.metric not in performance.columns:
+            if spif.metric not in metrics:
                 logger.warning(f"Metric '{spif.metric}' not found for SPIF {spif.spif_name}")
                 continue
 
             # Check if target is met
-            met_target = performance[spif.metric] >= spif.target
+            met_target = np.asarray(metrics[spif.metric]) >= spif.target
 
-            if met_target.any():
-                total_spif[met_target] += spif.payout
-                logger.debug(f"Applied SPIF '{spif.spif_name}' to {met_target.sum()} reps")
+            np.add(out, spif.payout, out=out, where=met_target)
+            logger.debug(f"Applied SPIF '{spif.spif_name}' to {met_target.sum()} reps")
 
-        return total_spif
+        return out
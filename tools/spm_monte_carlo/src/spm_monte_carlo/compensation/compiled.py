@@ -0,0 +1,171 @@
+"""Compiled piecewise-linear commission schedules."""
+
+import numpy as np
+from typing import List, Optional
+import logging
+
+from .plan import CommissionTier
+
+logger = logging.getLogger(__name__)
+
+# Tier bases that pay commission
+APPLIES_TO = ['total_sales', 'incremental_sales', 'quota']
+
+
+class CompiledTiers:
+    """
+    Commission tiers compiled into sorted breakpoint and coefficient arrays.
+
+    Tiers combine in three ways:
+
+    - Marginal (``total_sales`` and ``incremental_sales``): each tier pays
+      its rate on the sales that fall inside its attainment band, so a rep
+      above a tier keeps the full payout of every band below.
+    - Retroactive (``total_sales`` with ``retroactive=True``): the tier
+      containing attainment pays its rate on all sales.
+    - Step (``quota`` tiers and flat rates): the tier containing
+      attainment pays its rate on quota, or its flat amount.
+
+    The distinct tier boundaries split quota attainment into segments
+    ``(breakpoints[i - 1], breakpoints[i]]``. ``cumulative`` holds the
+    marginal payout per unit of quota at each breakpoint, so within a
+    segment commission is linear in sales and quota:
+
+        slope * actual_sales + quota * per_quota + flat
+
+    Segment ``i`` is found for every row with one ``np.searchsorted``
+    call and its coefficients are gathered from the arrays, so every tier
+    type costs the same O(n log k) lookup with no per-tier masks. Index 0
+    is the segment below every tier; index ``len(breakpoints)`` is the
+    segment above every tier, which keeps the full marginal payout.
+
+    Example:
+        >>> compiled = plan.compile()
+        >>> commission = compiled.commission(quota, actual_sales)
+    """
+
+    def __init__(self, tiers: List[CommissionTier]):
+        """
+        Compile tiers.
+
+        Args:
+            tiers: Commission tiers (any order; overlapping tiers add up)
+        """
+        # Tiers with an empty attainment range never pay
+        paying = [
+            t for t in tiers
+            if t.applies_to in APPLIES_TO and t.quota_min < t.quota_max
+        ]
+        marginal = [t for t in paying if self.is_marginal(t)]
+
+        self.breakpoints = np.unique(
+            [t.quota_min for t in paying] + [t.quota_max for t in paying]
+        ).astype(float)
+
+        # Marginal payout per unit of quota at each breakpoint
+        self.cumulative = np.zeros(len(self.breakpoints))
+        for tier in marginal:
+            self.cumulative += tier.rate_value * np.clip(
+                self.breakpoints - tier.quota_min, 0, tier.quota_max - tier.quota_min
+            )
+
+        n_segments = len(self.breakpoints) + 1
+        self.slope = np.zeros(n_segments)
+        self.per_quota = np.zeros(n_segments)
+        self.flat = np.zeros(n_segments)
+
+        for i in range(1, len(self.breakpoints)):
+            low, high = self.breakpoints[i - 1], self.breakpoints[i]
+            covering = [t for t in paying if t.quota_min <= low and high <= t.quota_max]
+            self._fill(i, covering, low)
+
+        if len(self.breakpoints):
+            self.per_quota[-1] = self.cumulative[-1]
+
+        logger.debug(f"Compiled {len(tiers)} tiers into {self.n_segments} segments")
+
+    @staticmethod
+    def is_marginal(tier: CommissionTier) -> bool:
+        """Whether a tier pays its rate on the sales inside its band."""
+        if tier.rate_type != 'percentage':
+            return False
+        if tier.applies_to == 'incremental_sales':
+            return True
+        return tier.applies_to == 'total_sales' and not tier.retroactive
+
+    def _fill(self, i: int, tiers: List[CommissionTier], segment_min: float):
+        """Set segment i's coefficients from the tiers covering it."""
+        marginal_rate = sum(t.rate_value for t in tiers if self.is_marginal(t))
+        retroactive_rate = sum(
+            t.rate_value for t in tiers
+            if t.applies_to == 'total_sales' and t.retroactive and t.rate_type == 'percentage'
+        )
+        quota_rate = sum(
+            t.rate_value for t in tiers
+            if t.applies_to == 'quota' and t.rate_type == 'percentage'
+        )
+
+        # Marginal payout continues linearly from the segment's lower breakpoint
+        self.slope[i] = marginal_rate + retroactive_rate
+        self.per_quota[i] = (
+            self.cumulative[i - 1] - marginal_rate * segment_min + quota_rate
+        )
+        self.flat[i] = sum(t.rate_value for t in tiers if t.rate_type != 'percentage')
+
+    @property
+    def n_segments(self) -> int:
+        """Number of paying segments."""
+        return max(len(self.breakpoints) - 1, 0)
+
+    def segments(self, attainment: np.ndarray) -> np.ndarray:
+        """
+        Segment index of every attainment value.
+
+        Args:
+            attainment: Quota attainment per row
+
+        Returns:
+            Integer array; 0 is below and len(breakpoints) above every tier
+        """
+        return np.searchsorted(self.breakpoints, attainment, side='left')
+
+    def commission(
+        self,
+        quota: np.ndarray,
+        actual_sales: np.ndarray,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Commission for every row.
+
+        Args:
+            quota: Quota per row
+            actual_sales: Actual sales per row
+            out: Float buffer of the row shape to write into (optional)
+
+        Returns:
+            Commission array (``out`` when given)
+        """
+        quota = np.asarray(quota, dtype=float)
+        actual_sales = np.asarray(actual_sales, dtype=float)
+        if out is None:
+            out = np.empty(np.broadcast_shapes(quota.shape, actual_sales.shape))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            index = self.segments(actual_sales / quota)
+
+            np.multiply(actual_sales, self.slope[index], out=out)
+            out += quota * self.per_quota[index]
+            if self.flat.any():
+                out += self.flat[index]
+
+        # Undefined attainment (missing sales or quota) falls in no tier
+        np.copyto(out, 0.0, where=np.isnan(out))
+        return out
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"CompiledTiers(segments={self.n_segments}, "
+            f"breakpoints={self.breakpoints.tolist()})"
+        )
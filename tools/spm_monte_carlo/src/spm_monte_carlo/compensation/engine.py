@@ -1,7 +1,9 @@
 """Compensation calculation engine."""
 
 import pandas as pd
-from typing import Optional
+import numpy as np
+from collections import ChainMap
+from typing import Optional, Dict, Mapping
 import logging
 
 from .plan import CompensationPlan
@@ -9,6 +11,9 @@ from .calculator import TierCalculator, BonusCalculator, SPIFCalculator
 
 logger = logging.getLogger(__name__)
 
+# Columns calculate() adds, in order
+PAYOUT_COMPONENTS = ['commission', 'bonuses', 'spifs', 'total_payout']
+
 
 class CompensationEngine:
     """Main compensation calculation orchestrator."""
@@ -38,43 +43,24 @@ class CompensationEngine:
         """
         logger.info(f"Calculating compensation for {len(performance)} reps")
 
-        # Create result DataFrame
-        results = performance.copy()
+        for col in ['actual_sales', 'quota']:
+            if col not in performance.columns:
+                raise ValueError(f"Missing required column: {col}")
+
+        # Create result DataFrame (shallow: input columns are shared, not copied)
+        results = performance.copy(deep=False)
 
         # Ensure quota_attainment is calculated
         if 'quota_attainment' not in results.columns:
             results['quota_attainment'] = results['actual_sales'] / results['quota']
 
-        # Calculate commission
-        if self.plan.commission_tiers:
-            results['commission'] = self.tier_calculator.calculate(
-                performance, self.plan.commission_tiers
-            )
-        else:
-            results['commission'] = 0.0
-
-        # Calculate bonuses
-        if self.plan.bonuses:
-            results['bonuses'] = self.bonus_calculator.calculate(
-                performance, self.plan.bonuses
-            )
-        else:
-            results['bonuses'] = 0.0
-
-        # Calculate SPIFs
-        if self.plan.spifs:
-            results['spifs'] = self.spif_calculator.calculate(
-                performance, self.plan.spifs
-            )
-        else:
-            results['spifs'] = 0.0
-
-        # Total payout
-        results['total_payout'] = (
-            results['commission'] +
-            results['bonuses'] +
-            results.get('spifs', 0.0)
+        payouts = self.calculate_arrays(
+            performance['actual_sales'].to_numpy(),
+            performance['quota'].to_numpy(),
+            metrics=results
         )
+        for component, values in payouts.items():
+            results[component] = values
 
         logger.info(
             f"Total payout: ${results['total_payout'].sum():,.0f} "
@@ -83,6 +69,62 @@ class CompensationEngine:
 
         return results
 
+    def calculate_arrays(
+        self,
+        actual_sales: np.ndarray,
+        quota: np.ndarray,
+        metrics: Optional[Mapping[str, np.ndarray]] = None,
+        out: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calculate compensation components for per-row arrays.
+
+        The array-level entry point behind ``calculate``: inputs are read
+        in place and each component is written into a caller-provided
+        buffer when one is given, so repeated calls (e.g. one per batch)
+        can reuse the same memory.
+
+        Args:
+            actual_sales: Actual sales per row
+            quota: Quota per row
+            metrics: Further metrics bonuses and SPIFs trigger on, as a
+                     mapping of name to per-row values (a DataFrame works)
+            out: Dict of buffers for any of commission, bonuses, spifs
+                 and total_payout (missing ones are allocated)
+
+        Returns:
+            Dict of {component: array}, the ``out`` buffers where given
+        """
+        shape = np.broadcast_shapes(np.shape(actual_sales), np.shape(quota))
+        out = dict(out or {})
+        for component in PAYOUT_COMPONENTS:
+            if component not in out:
+                out[component] = np.empty(shape)
+
+        values = ChainMap(
+            {'actual_sales': actual_sales, 'quota': quota},
+            metrics if metrics is not None else {}
+        )
+
+        if self.plan.commission_tiers:
+            self.plan.compile().commission(quota, actual_sales, out=out['commission'])
+        else:
+            out['commission'].fill(0.0)
+
+        out['bonuses'].fill(0.0)
+        if self.plan.bonuses:
+            self.bonus_calculator.calculate_arrays(values, self.plan.bonuses, out['bonuses'])
+
+        out['spifs'].fill(0.0)
+        if self.plan.spifs:
+            self.spif_calculator.calculate_arrays(values, self.plan.spifs, out['spifs'])
+
+        total = out['total_payout']
+        np.add(out['commission'], out['bonuses'], out=total)
+        np.add(total, out['spifs'], out=total)
+
+        return out
+
     def calculate_batch(
         self,
         scenarios: pd.DataFrame,
@@ -91,6 +133,10 @@ class CompensationEngine:
         """
         Calculate compensation for multiple scenarios.
 
+        Every payout rule depends only on its own row, so all scenarios are
+        evaluated in one vectorized pass; group_by only orders the output
+        by group (stable within a group), as a per-group evaluation would.
+
         Args:
             scenarios: DataFrame with multiple scenarios
             group_by: Column to group by (e.g., 'scenario_id')
@@ -99,15 +145,17 @@ class CompensationEngine:
             DataFrame with compensation for all scenarios
         """
         if group_by and group_by in scenarios.columns:
-            # Process each scenario separately
-            results_list = []
+            keys = scenarios[group_by]
+
+            # Rows without a group key belong to no scenario
+            if keys.isna().any():
+                scenarios = scenarios[keys.notna()]
+                keys = scenarios[group_by]
 
-            for scenario_id, group in scenarios.groupby(group_by):
-                scenario_results = self.calculate(group)
-                scenario_results[group_by] = scenario_id
-                results_list.append(scenario_results)
+            if not keys.is_monotonic_increasing:
+                scenarios = scenarios.iloc[np.argsort(keys.to_numpy(), kind='stable')]
 
-            return pd.concat(results_list, ignore_index=True)
+            return self.calculate(scenarios).reset_index(drop=True)
         else:
             # Process all at once
             return self.calculate(scenarios)
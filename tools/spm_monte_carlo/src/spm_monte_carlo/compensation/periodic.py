@@ -0,0 +1,167 @@
+"""Multi-period compensation evaluation on (scenario x rep x period) tensors."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict
+import logging
+
+from .plan import CompensationPlan
+from .calculator import TierCalculator, BonusCalculator, SPIFCalculator
+
+logger = logging.getLogger(__name__)
+
+PERIODS_PER_YEAR = {
+    'monthly': 12,
+    'quarterly': 4,
+    'annual': 1
+}
+
+# Metrics summed over a payout window; the rest are averaged
+SUMMED_METRICS = ['quota', 'actual_sales', 'deal_count']
+
+
+class PeriodicEngine:
+    """
+    Evaluate a plan over simulated periods with payout timing.
+
+    Performance arrives as tensors whose last axis is the period. Every
+    component is evaluated on its own window: commission tiers at the
+    plan's ``frequency``, each bonus at its ``frequency`` and SPIFs once
+    a year. Window metrics are reductions along the period axis (sales,
+    quota and deal counts summed, attainment recomputed from the sums),
+    and the payout of each window lands in its last period.
+
+    Example:
+        >>> engine = PeriodicEngine(plan, periods_per_year=12)
+        >>> payouts = engine.calculate(tensors)
+        >>> payouts['total_payout'].sum(axis=1)   # (scenario, period) totals
+    """
+
+    def __init__(self, plan: CompensationPlan, periods_per_year: int = 12):
+        """
+        Initialize engine.
+
+        Args:
+            plan: CompensationPlan instance
+            periods_per_year: Simulated periods per plan year
+                              (12 = monthly, 4 = quarterly)
+        """
+        self.plan = plan
+        self.periods_per_year = periods_per_year
+
+    def window(self, frequency: str) -> int:
+        """
+        Periods per payout window for a frequency.
+
+        Args:
+            frequency: 'monthly', 'quarterly', or 'annual'
+
+        Returns:
+            Number of simulated periods in one window
+
+        Raises:
+            ValueError: If the frequency is unknown or finer than the periods
+        """
+        if frequency not in PERIODS_PER_YEAR:
+            raise ValueError(
+                f"Unknown frequency: {frequency}. Choose from: {list(PERIODS_PER_YEAR.keys())}"
+            )
+
+        windows_per_year = PERIODS_PER_YEAR[frequency]
+        if self.periods_per_year % windows_per_year != 0:
+            raise ValueError(
+                f"Cannot pay {frequency} with {self.periods_per_year} periods per year"
+            )
+        return self.periods_per_year // windows_per_year
+
+    def aggregate(self, tensors: Dict[str, np.ndarray], window: int) -> pd.DataFrame:
+        """
+        Reduce period tensors to one row per payout window.
+
+        Args:
+            tensors: Dict of {metric: array with periods on the last axis};
+                     arrays not shaped like actual_sales are ignored
+            window: Periods per window
+
+        Returns:
+            DataFrame of window metrics, rows in C order of
+            (..., window index)
+        """
+        shape = np.shape(tensors['actual_sales'])
+        n_periods = shape[-1]
+        if n_periods % window != 0:
+            raise ValueError(
+                f"{n_periods} periods do not divide into windows of {window}"
+            )
+
+        performance = {}
+        for metric, values in tensors.items():
+            if np.shape(values) != shape:
+                continue
+            grouped = values.reshape(values.shape[:-1] + (n_periods // window, window))
+            reduced = grouped.sum(axis=-1) if metric in SUMMED_METRICS else grouped.mean(axis=-1)
+            performance[metric] = reduced.ravel()
+
+        performance = pd.DataFrame(performance, copy=False)
+        performance['quota_attainment'] = performance['actual_sales'] / performance['quota']
+        return performance
+
+    def calculate(self, tensors: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """
+        Calculate compensation for every period.
+
+        Args:
+            tensors: Dict of {metric: array of shape (..., n_periods)};
+                     needs quota and actual_sales
+
+        Returns:
+            Dict with commission, bonuses, spifs and total_payout arrays
+            of the input shape, non-zero only in payout periods
+        """
+        shape = np.shape(tensors['actual_sales'])
+        payouts = {
+            component: np.zeros(shape)
+            for component in ['commission', 'bonuses', 'spifs']
+        }
+
+        if self.plan.commission_tiers:
+            window = self.window(self.plan.frequency)
+            performance = self.aggregate(tensors, window)
+            amounts = TierCalculator.calculate(performance, self.plan.commission_tiers)
+            self._pay(payouts['commission'], amounts.to_numpy(), window)
+
+        frequencies = sorted({bonus.frequency for bonus in self.plan.bonuses})
+        for frequency in frequencies:
+            window = self.window(frequency)
+            bonuses = [b for b in self.plan.bonuses if b.frequency == frequency]
+            performance = self.aggregate(tensors, window)
+            amounts = BonusCalculator.calculate(performance, bonuses)
+            self._pay(payouts['bonuses'], amounts.to_numpy(), window)
+
+        if self.plan.spifs:
+            window = self.window('annual')
+            performance = self.aggregate(tensors, window)
+            amounts = SPIFCalculator.calculate(performance, self.plan.spifs)
+            self._pay(payouts['spifs'], amounts.to_numpy(), window)
+
+        payouts['total_payout'] = payouts['commission'] + payouts['bonuses'] + payouts['spifs']
+
+        logger.info(
+            f"Evaluated {shape[-1]} periods for {int(np.prod(shape[:-1]))} scenario-reps"
+        )
+
+        return payouts
+
+    @staticmethod
+    def _pay(target: np.ndarray, amounts: np.ndarray, window: int):
+        """Add window amounts to the last period of each window, in place."""
+        n_periods = target.shape[-1]
+        grouped = target.reshape(target.shape[:-1] + (n_periods // window, window))
+        grouped[..., -1] += amounts.reshape(grouped.shape[:-1])
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"PeriodicEngine(plan='{self.plan.plan_id}', "
+            f"periods_per_year={self.periods_per_year})"
+        )
@@ -1,13 +1,50 @@
 """Compensation plan definition and builder."""
 
 import pandas as pd
-from typing import Optional, List, Dict, Any
-from dataclasses import dataclass, field
+import numpy as np
+from typing import Optional, List, Dict, Any, Union
+from dataclasses import dataclass, field, astuple
 import logging
 
+from .formula import Formula
+
 logger = logging.getLogger(__name__)
 
 
+# Excel spellings of a yes/no cell
+TRUE_VALUES = {'true', 'yes', 'y', '1'}
+FALSE_VALUES = {'false', 'no', 'n', '0', ''}
+
+
+def _parse_flag(value: Any, column: str) -> bool:
+    """
+    Read a yes/no cell.
+
+    Args:
+        value: Cell value (blank/None means False)
+        column: Column name, for the error message
+
+    Returns:
+        Parsed flag
+
+    Raises:
+        ValueError: If the value is not a recognizable yes/no
+    """
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return False
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, (int, float, np.integer, np.floating)) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        text = value.strip().lower()
+        if text in TRUE_VALUES:
+            return True
+        if text in FALSE_VALUES:
+            return False
+    raise ValueError(f"Column '{column}' must be true/false, yes/no or 1/0, got {value!r}")
+
+
 @dataclass
 class CommissionTier:
     """Commission tier definition."""
@@ -17,6 +54,7 @@ class CommissionTier:
     rate_value: float
     rate_type: str = 'percentage'
     applies_to: str = 'total_sales'
+    retroactive: bool = False
 
 
 @dataclass
@@ -26,7 +64,7 @@ class Bonus:
     trigger_metric: str
     trigger_value: float
     trigger_condition: str
-    payout_value: float
+    payout_value: Union[float, str]
     payout_type: str = 'flat'
     frequency: str = 'quarterly'
 
@@ -46,20 +84,29 @@ class SPIF:
 class CompensationPlan:
     """Compensation plan builder and container."""
 
-    def __init__(self, plan_id: str, name: Optional[str] = None):
+    def __init__(
+        self,
+        plan_id: str,
+        name: Optional[str] = None,
+        frequency: str = 'monthly'
+    ):
         """
         Initialize compensation plan.
 
         Args:
             plan_id: Unique plan identifier
             name: Plan name (optional)
+            frequency: Commission payout frequency
+                       ('monthly', 'quarterly', or 'annual')
         """
         self.plan_id = plan_id
         self.name = name or plan_id
+        self.frequency = frequency
         self.commission_tiers: List[CommissionTier] = []
         self.bonuses: List[Bonus] = []
         self.spifs: List[SPIF] = []
         self.metadata: Dict[str, Any] = {}
+        self._compiled = None
 
     def add_commission_tier(
         self,
@@ -68,11 +115,18 @@ class CompensationPlan:
         rate: float,
         tier_name: Optional[str] = None,
         rate_type: str = 'percentage',
-        applies_to: str = 'total_sales'
+        applies_to: str = 'total_sales',
+        retroactive: bool = False
     ) -> 'CompensationPlan':
         """
         Add a commission tier.
 
+        Percentage tiers on total_sales or incremental_sales are marginal:
+        each pays its rate on the sales inside its band, on top of the
+        bands below. A retroactive total_sales tier instead pays its rate
+        on all sales once attainment reaches it. Quota-based and flat
+        tiers pay when attainment falls in their band.
+
         Args:
             quota_min: Minimum quota % for tier
             quota_max: Maximum quota % for tier
@@ -80,10 +134,15 @@ class CompensationPlan:
             tier_name: Tier identifier
             rate_type: 'percentage' or 'flat'
             applies_to: 'quota', 'total_sales', or 'incremental_sales'
+            retroactive: Pay the rate on all sales, not just the band
+                         (total_sales percentage tiers only)
 
         Returns:
             Self for method chaining
         """
+        if retroactive and (applies_to != 'total_sales' or rate_type != 'percentage'):
+            raise ValueError("retroactive applies only to percentage tiers on total_sales")
+
         if tier_name is None:
             tier_name = f"Tier {len(self.commission_tiers) + 1}"
 
@@ -93,10 +152,12 @@ class CompensationPlan:
             quota_max=quota_max,
             rate_value=rate,
             rate_type=rate_type,
-            applies_to=applies_to
+            applies_to=applies_to,
+            retroactive=retroactive
         )
 
         self.commission_tiers.append(tier)
+        self._compiled = None
         logger.info(f"Added commission tier: {tier_name}")
 
         return self
@@ -105,8 +166,9 @@ class CompensationPlan:
         self,
         name: str,
         trigger: str,
-        payout: float,
-        frequency: str = 'quarterly'
+        payout: Union[float, str],
+        frequency: str = 'quarterly',
+        payout_type: str = 'flat'
     ) -> 'CompensationPlan':
         """
         Add a bonus component.
@@ -114,8 +176,11 @@ class CompensationPlan:
         Args:
             name: Bonus name
             trigger: Trigger expression (e.g., "quota_attainment >= 1.0")
-            payout: Payout amount
+            payout: Payout amount, or a formula over scenario metrics
+                    (e.g., "0.01 * (actual_sales - quota)") when
+                    payout_type is 'formula'
             frequency: 'monthly', 'quarterly', or 'annual'
+            payout_type: 'flat' or 'formula'
 
         Returns:
             Self for method chaining
@@ -129,12 +194,19 @@ class CompensationPlan:
         else:
             raise ValueError(f"Invalid trigger expression: {trigger}")
 
+        if payout_type == 'formula':
+            # Reject invalid formulas now rather than mid-simulation
+            Formula.compile(str(payout))
+        elif payout_type != 'flat':
+            raise ValueError(f"Unknown payout type: {payout_type}")
+
         bonus = Bonus(
             bonus_name=name,
             trigger_metric=metric,
             trigger_value=value,
             trigger_condition=condition,
             payout_value=payout,
+            payout_type=payout_type,
             frequency=frequency
         )
 
@@ -180,11 +252,31 @@ class CompensationPlan:
 
         return self
 
+    def compile(self) -> 'CompiledTiers':
+        """
+        Compile the commission tiers for vectorized evaluation.
+
+        The result is cached and reused until the tiers change (tiers
+        added, or their fields edited in place), so per-batch callers pay
+        for compilation once.
+
+        Returns:
+            CompiledTiers with sorted breakpoint and rate arrays
+        """
+        from .compiled import CompiledTiers
+
+        key = tuple(astuple(tier) for tier in self.commission_tiers)
+        cached = getattr(self, '_compiled', None)
+        if cached is None or cached[0] != key:
+            self._compiled = (key, CompiledTiers(self.commission_tiers))
+        return self._compiled[1]
+
     def to_dict(self) -> Dict[str, Any]:
         """Export plan as dictionary."""
         return {
             'plan_id': self.plan_id,
             'name': self.name,
+            'frequency': self.frequency,
             'commission_tiers': [vars(tier) for tier in self.commission_tiers],
             'bonuses': [vars(bonus) for bonus in self.bonuses],
             'spifs': [vars(spif) for spif in self.spifs],
@@ -197,7 +289,8 @@ class CompensationPlan:
             # Plan overview
             overview = pd.DataFrame([{
                 'plan_id': self.plan_id,
-                'plan_name': self.name
+                'plan_name': self.name,
+                'frequency': self.frequency
             }])
             overview.to_excel(writer, sheet_name='Plan_Overview', index=False)
 
@@ -241,7 +334,8 @@ class CompensationPlan:
         overview = plan_data['overview'].iloc[0]
         plan = CompensationPlan(
             plan_id=overview['plan_id'],
-            name=overview.get('plan_name', overview['plan_id'])
+            name=overview.get('plan_name', overview['plan_id']),
+            frequency=overview.get('frequency', 'monthly')
         )
 
         # Load commission tiers
@@ -253,18 +347,22 @@ class CompensationPlan:
                     rate=row['rate_value'],
                     tier_name=row['tier_name'],
                     rate_type=row['rate_type'],
-                    applies_to=row['applies_to']
+                    applies_to=row['applies_to'],
+                    retroactive=_parse_flag(row.get('retroactive'), 'retroactive')
                 )
 
         # Load bonuses
         if 'bonuses' in plan_data:
             for _, row in plan_data['bonuses'].iterrows():
                 trigger = f"{row['trigger_metric']} {row['trigger_condition']} {row['trigger_value']}"
+                # Blank cells mean a flat payout
+                payout_type = row.get('payout_type')
                 plan.add_bonus(
                     name=row['bonus_name'],
                     trigger=trigger,
                     payout=row['payout_value'],
-                    frequency=row['frequency']
+                    frequency=row['frequency'],
+                    payout_type=payout_type if pd.notna(payout_type) else 'flat'
                 )
 
         logger.info(f"Loaded plan '{plan.plan_id}' from {file_path}")
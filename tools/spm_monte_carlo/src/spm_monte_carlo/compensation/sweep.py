@@ -0,0 +1,146 @@
+"""Commission tiers evaluated along a parameter axis."""
+
+import itertools
+from dataclasses import replace
+import pandas as pd
+import numpy as np
+from typing import Dict, List, Sequence, Tuple, Union
+import logging
+
+from .plan import CommissionTier
+from .compiled import CompiledTiers
+
+logger = logging.getLogger(__name__)
+
+# Tier fields that can be swept
+SWEEP_FIELDS = ['quota_min', 'quota_max', 'rate_value']
+
+
+class TierSweep:
+    """
+    Evaluate many variants of a plan's commission tiers at once.
+
+    Variants are rows of a parameter table whose columns are named
+    ``'<tier_name>.<field>'`` (field: quota_min, quota_max or rate_value);
+    parameters not in the table keep the plan's values. Each variant's
+    tiers are compiled into a ``CompiledTiers`` schedule and evaluated
+    for all rows with its vectorized kernel, the same one
+    ``TierCalculator`` and the engine use, so a variant pays exactly
+    what the plan with those tier values would.
+
+    Example:
+        >>> sweep = TierSweep(plan.commission_tiers)
+        >>> points = TierSweep.grid({'Tier 4.rate_value': [0.05, 0.06, 0.07]})
+        >>> commission = sweep.calculate(quota, actual_sales, points)  # (3, n_rows)
+    """
+
+    def __init__(self, tiers: List[CommissionTier]):
+        """
+        Initialize sweep.
+
+        Args:
+            tiers: Commission tiers of the plan being varied
+        """
+        if not tiers:
+            raise ValueError("A tier sweep needs at least one commission tier")
+
+        self.tiers = tiers
+        self._index = {tier.tier_name: k for k, tier in enumerate(tiers)}
+
+        if len(self._index) != len(tiers):
+            raise ValueError("Swept tiers need distinct tier names")
+
+    @staticmethod
+    def grid(parameters: Dict[Union[str, Tuple[str, ...]], Sequence[float]]) -> pd.DataFrame:
+        """
+        Cartesian product of parameter values.
+
+        A tuple key sets several parameters to the same value, e.g. a
+        breakpoint shared by two tiers:
+        ``{('Tier 3.quota_max', 'Tier 4.quota_min'): [1.2, 1.3]}``.
+
+        Args:
+            parameters: Dict of {parameter name(s): values}
+
+        Returns:
+            DataFrame with one row per combination and one column per
+            parameter name
+        """
+        keys = [key if isinstance(key, tuple) else (key,) for key in parameters]
+        combinations = list(itertools.product(*parameters.values()))
+
+        columns = {}
+        for i, names in enumerate(keys):
+            for name in names:
+                columns[name] = [float(combo[i]) for combo in combinations]
+
+        return pd.DataFrame(columns)
+
+    def parameter_arrays(self, points: pd.DataFrame) -> Dict[str, np.ndarray]:
+        """
+        Tier parameters of every variant.
+
+        Args:
+            points: Parameter table, one row per variant
+
+        Returns:
+            Dict of {field: array of shape (n_points, n_tiers)}
+
+        Raises:
+            ValueError: If a column does not name a tier field
+        """
+        n_points = len(points)
+        arrays = {
+            field: np.tile(
+                np.array([getattr(tier, field) for tier in self.tiers], dtype=float),
+                (n_points, 1)
+            )
+            for field in SWEEP_FIELDS
+        }
+
+        for column in points.columns:
+            tier_name, _, field = str(column).rpartition('.')
+            if tier_name not in self._index or field not in SWEEP_FIELDS:
+                raise ValueError(
+                    f"Unknown sweep parameter: {column}. Use '<tier_name>.<field>' "
+                    f"with tiers {list(self._index)} and fields {SWEEP_FIELDS}"
+                )
+            arrays[field][:, self._index[tier_name]] = points[column].to_numpy(dtype=float)
+
+        return arrays
+
+    def calculate(
+        self,
+        quota: np.ndarray,
+        actual_sales: np.ndarray,
+        points: pd.DataFrame
+    ) -> np.ndarray:
+        """
+        Commission of every variant for every row.
+
+        Args:
+            quota: Quota per row
+            actual_sales: Actual sales per row
+            points: Parameter table, one row per variant
+
+        Returns:
+            Array of shape (n_points, n_rows)
+        """
+        quota = np.asarray(quota, dtype=float)
+        actual_sales = np.asarray(actual_sales, dtype=float)
+
+        params = self.parameter_arrays(points)
+        commission = np.empty((len(points), len(quota)))
+
+        for p in range(len(points)):
+            tiers = [
+                replace(tier, **{field: params[field][p, k] for field in SWEEP_FIELDS})
+                for k, tier in enumerate(self.tiers)
+            ]
+            CompiledTiers(tiers).commission(quota, actual_sales, out=commission[p])
+
+        return commission
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"TierSweep(tiers={list(self._index)})"
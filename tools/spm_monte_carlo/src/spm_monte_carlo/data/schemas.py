@@ -76,6 +76,9 @@ COMMISSION_TIERS_SCHEMA = {
         'rate_value',
         'applies_to'
     ],
+    'optional_columns': [
+        'retroactive'
+    ],
     'column_types': {
         'plan_id': 'string',
         'tier_name': 'string',
@@ -83,7 +86,8 @@ COMMISSION_TIERS_SCHEMA = {
         'quota_max': 'numeric',
         'rate_type': 'string',
         'rate_value': 'numeric',
-        'applies_to': 'string'
+        'applies_to': 'string',
+        'retroactive': 'boolean'
     },
     'constraints': {
         'quota_min': {'min': 0},
@@ -57,7 +57,24 @@ class SimulationError(SPMMonteCarloException):
 
 class ConvergenceError(SimulationError):
     """Simulation failed to converge."""
-    pass
+
+    def __init__(
+        self,
+        message: str,
+        iterations: Optional[int] = None,
+        precision: Optional[Dict[str, float]] = None
+    ):
+        """
+        Initialize convergence error.
+
+        Args:
+            message: Error message
+            iterations: Iterations run before giving up
+            precision: Achieved relative precision per metric
+        """
+        super().__init__(message)
+        self.iterations = iterations
+        self.precision = precision or {}
 
 
 class ConfigurationError(SPMMonteCarloException):
@@ -2,11 +2,43 @@
 
 from .simulator import MonteCarloSimulator
 from .results import SimulationResults
+from .periodic import PeriodicResults
+from .comparison import PlanComparison
+from .sweep import PlanSweep, SweepResults
+from .optimizer import PlanOptimizer, OptimizationResult
+from .scenarios import ScenarioGenerator
+from .scenario_store import ScenarioStore
+from .streams import RandomStreams
+from .executor import SimulationExecutor
+from .scenario_file import ScenarioFile
+from .cache import ScenarioCache
+from .accumulators import ScenarioAccumulator, StreamingAccumulator, MemmapAccumulator
+from .convergence import ConvergenceMonitor
+from .checkpoint import RunCheckpoint
+from .profiling import PipelineProfiler
 from .sampling import SamplingStrategy, MonteCarloSampling, LatinHypercubeSampling
 
 __all__ = [
     'MonteCarloSimulator',
     'SimulationResults',
+    'PeriodicResults',
+    'PlanComparison',
+    'PlanSweep',
+    'SweepResults',
+    'PlanOptimizer',
+    'OptimizationResult',
+    'ScenarioGenerator',
+    'ScenarioStore',
+    'RandomStreams',
+    'SimulationExecutor',
+    'ScenarioAccumulator',
+    'StreamingAccumulator',
+    'MemmapAccumulator',
+    'ScenarioFile',
+    'ScenarioCache',
+    'ConvergenceMonitor',
+    'RunCheckpoint',
+    'PipelineProfiler',
     'SamplingStrategy',
     'MonteCarloSampling',
     'LatinHypercubeSampling'
@@ -0,0 +1,259 @@
+"""Incremental accumulation of batched simulation results."""
+
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Union
+import logging
+
+from ..statistics.streaming import StreamingStats
+from ..exceptions import ConfigurationError
+from .results import SimulationResults
+from .scenario_file import ScenarioFile, column_path, write_manifest
+from .scenario_store import WEIGHT_COLUMN
+
+logger = logging.getLogger(__name__)
+
+
+class ScenarioAccumulator:
+    """
+    Fold batch results into preallocated columns.
+
+    Columns are allocated once for the whole run when the first batch
+    arrives and every batch is copied into its row slice, so a run holds
+    the final columns plus one batch instead of a list of batch frames
+    that is concatenated (and copied) at the end. When the row count is
+    not known in advance (adaptive runs) capacity doubles as needed.
+    Categorical columns (reps) are held as integer codes plus one copy of
+    their categories. With max_bytes set, columns are never allocated
+    past that size.
+    """
+
+    def __init__(self, total_rows: Optional[int] = None, max_bytes: Optional[int] = None):
+        """
+        Initialize accumulator.
+
+        Args:
+            total_rows: Number of scenario-rep rows the run will produce
+                        (None = unknown, grow as batches arrive)
+            max_bytes: Largest column storage to allocate (None = unlimited)
+        """
+        self.total_rows = total_rows
+        self.max_bytes = max_bytes
+        self.rows = 0
+        self._columns: Optional[Dict[str, np.ndarray]] = None
+        self._categories: Dict[str, pd.Index] = {}
+
+    def add(self, batch: pd.DataFrame):
+        """
+        Fold one batch of results in.
+
+        Args:
+            batch: Results for the next rows of the run, in order
+
+        Raises:
+            ConfigurationError: If the columns would exceed max_bytes
+        """
+        end = self.rows + len(batch)
+
+        columns = {col: self._values(batch[col]) for col in batch.columns}
+
+        if self._columns is None:
+            capacity = self.total_rows if self.total_rows is not None else len(batch)
+            self._check_size(capacity, [values.dtype for values in columns.values()])
+            self._columns = {
+                col: self._allocate(col, values.dtype, capacity)
+                for col, values in columns.items()
+            }
+
+        capacity = len(next(iter(self._columns.values())))
+        if end > capacity:
+            if self.total_rows is not None:
+                raise ValueError(
+                    f"Batch overflows accumulator ({end} > {self.total_rows} rows)"
+                )
+            dtypes = [values.dtype for values in self._columns.values()]
+            self._check_size(end, dtypes)
+            # Doubling stops at max_bytes so only the rows kept can reach it
+            self._grow(max(end, min(2 * capacity, self._max_rows(dtypes) or 2 * capacity)))
+
+        for col, values in self._columns.items():
+            values[self.rows:end] = columns[col]
+
+        self.rows = end
+
+    def _values(self, column: pd.Series) -> np.ndarray:
+        """Storage array for a column: codes for categoricals, else values."""
+        if not isinstance(column.dtype, pd.CategoricalDtype):
+            return column.to_numpy()
+
+        categories = self._categories.setdefault(column.name, column.cat.categories)
+        if not categories.equals(column.cat.categories):
+            raise ValueError(f"Categories of column '{column.name}' changed between batches")
+        return column.cat.codes.to_numpy()
+
+    def _allocate(self, column: str, dtype: np.dtype, capacity: int) -> np.ndarray:
+        """Allocate storage for one column."""
+        return np.empty(capacity, dtype=dtype)
+
+    def _max_rows(self, dtypes: List[np.dtype]) -> Optional[int]:
+        """Rows of the given column types that fit in max_bytes."""
+        if self.max_bytes is None:
+            return None
+        return int(self.max_bytes // sum(dtype.itemsize for dtype in dtypes))
+
+    def _check_size(self, capacity: int, dtypes: List[np.dtype]):
+        """Raise if columns of capacity rows would exceed max_bytes."""
+        max_rows = self._max_rows(dtypes)
+        if max_rows is not None and capacity > max_rows:
+            nbytes = capacity * sum(dtype.itemsize for dtype in dtypes)
+            raise ConfigurationError(
+                f"Keeping {capacity:,} scenario rows needs {nbytes / 2**20:,.0f} MB, over "
+                f"memory_limit_mb={self.max_bytes / 2**20:g}; use streaming=True or output_path"
+            )
+
+    def _grow(self, capacity: int):
+        """Reallocate columns with room for capacity rows."""
+        for col, values in self._columns.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[:self.rows] = values[:self.rows]
+            self._columns[col] = grown
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the preallocated columns."""
+        if self._columns is None:
+            return 0
+        return sum(values.nbytes for values in self._columns.values())
+
+    def result(self) -> pd.DataFrame:
+        """
+        Build the scenario frame from the accumulated columns.
+
+        Returns:
+            DataFrame with all rows added so far
+        """
+        if self._columns is None:
+            return pd.DataFrame()
+
+        columns = {}
+        for col, values in self._columns.items():
+            if col in self._categories:
+                columns[col] = pd.Categorical.from_codes(
+                    values[:self.rows], categories=self._categories[col]
+                )
+            else:
+                columns[col] = values[:self.rows]
+
+        return pd.DataFrame(columns, copy=False)
+
+    def to_results(self, metadata: Optional[Dict[str, Any]] = None) -> SimulationResults:
+        """Wrap the accumulated scenarios in SimulationResults."""
+        return SimulationResults(self.result(), metadata=metadata)
+
+
+class StreamingAccumulator:
+    """
+    Fold batch results into streaming statistics and drop the rows.
+
+    Memory stays flat in the number of scenarios: each batch updates
+    running moments and quantile sketches for every numeric column and
+    is then discarded.
+    """
+
+    EXCLUDED_COLUMNS = ['scenario_id']
+
+    def __init__(self, relative_accuracy: float = 0.005):
+        """
+        Initialize accumulator.
+
+        Args:
+            relative_accuracy: Quantile sketch relative accuracy
+        """
+        self.stats = StreamingStats(
+            relative_accuracy, exclude=self.EXCLUDED_COLUMNS, weight_column=WEIGHT_COLUMN
+        )
+        self.rows = 0
+
+    def add(self, batch: pd.DataFrame):
+        """
+        Fold one batch of results in.
+
+        Args:
+            batch: Results for the next rows of the run
+        """
+        self.stats.update(batch)
+        self.rows += len(batch)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the quantile sketches."""
+        return sum(col.sketch.nbytes for col in self.stats.columns.values())
+
+    def to_results(self, metadata: Optional[Dict[str, Any]] = None) -> SimulationResults:
+        """Wrap the streaming statistics in SimulationResults."""
+        return SimulationResults(stats=self.stats, metadata=metadata)
+
+
+class MemmapAccumulator(ScenarioAccumulator):
+    """
+    Write batch results into memory-mapped ``.npy`` column files.
+
+    Each column is preallocated on disk for the whole run and every batch
+    is written to its row slice, so the run can produce far more rows than
+    fit in RAM. The directory gets a manifest with the row count, column
+    types, rep lookup and run metadata, and results open it lazily.
+    """
+
+    def __init__(self, output_path: Union[str, Path], total_rows: int):
+        """
+        Initialize accumulator.
+
+        Args:
+            output_path: Directory for the column files (created if missing)
+            total_rows: Maximum rows the run can produce
+        """
+        super().__init__(total_rows)
+        self.output_path = Path(output_path)
+        self.output_path.mkdir(parents=True, exist_ok=True)
+
+    def _allocate(self, column: str, dtype: np.dtype, capacity: int) -> np.ndarray:
+        """Create a memory-mapped .npy file for one column."""
+        return np.lib.format.open_memmap(
+            column_path(self.output_path, column), mode='w+', dtype=dtype, shape=(capacity,)
+        )
+
+    def __getstate__(self) -> dict:
+        """Pickle the column file names, not their contents."""
+        state = self.__dict__.copy()
+        if self._columns is not None:
+            for values in self._columns.values():
+                values.flush()
+            state['_columns'] = list(self._columns)
+        return state
+
+    def __setstate__(self, state: dict):
+        """Reopen the column files for writing."""
+        self.__dict__.update(state)
+        if self._columns is not None:
+            self._columns = {
+                col: np.load(column_path(self.output_path, col), mmap_mode='r+')
+                for col in self._columns
+            }
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held in memory (columns live on disk)."""
+        return 0
+
+    def to_results(self, metadata: Optional[Dict[str, Any]] = None) -> SimulationResults:
+        """Flush the column files, write the manifest and open the results."""
+        dtypes = {}
+        for col, values in (self._columns or {}).items():
+            values.flush()
+            dtypes[col] = values.dtype
+
+        write_manifest(self.output_path, self.rows, dtypes, self._categories, metadata)
+        logger.info(f"Wrote {self.rows} scenario rows to {self.output_path}")
+
+        return SimulationResults(ScenarioFile(self.output_path), metadata=metadata)
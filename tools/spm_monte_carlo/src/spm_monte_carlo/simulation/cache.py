@@ -0,0 +1,198 @@
+"""Cache of generated scenario blocks."""
+
+import hashlib
+import os
+import numpy as np
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MEMORY_MB = 512
+
+
+def fingerprint(*parts) -> str:
+    """
+    Stable hex digest of arrays, numbers and strings.
+
+    Args:
+        *parts: Values to hash (arrays are hashed by dtype, shape and bytes)
+
+    Returns:
+        SHA-256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, np.ndarray):
+            digest.update(f"{part.dtype.str}{part.shape}".encode())
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode())
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+
+class ScenarioCache:
+    """
+    Generated scenario arrays kept in memory and optionally on disk.
+
+    Entries are keyed by a fingerprint of everything that determines a
+    block's draws (see ``ScenarioGenerator.fingerprint``), so a run that
+    only changes the compensation plan reuses the previous run's blocks.
+    The memory tier evicts least-recently-used entries past its byte
+    budget; the disk tier holds one ``.npz`` file per block and evicts
+    the oldest files past its own budget.
+
+    Only the disk tier is shared with worker processes; the memory tier
+    stays in the process that created the cache.
+
+    Example:
+        >>> cache = ScenarioCache(max_memory_mb=256, directory='.scenario_cache')
+        >>> sim = MonteCarloSimulator(seed=42).enable_cache(cache)
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: float = DEFAULT_MEMORY_MB,
+        directory: Optional[Union[str, Path]] = None,
+        max_disk_mb: Optional[float] = None
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_memory_mb: Memory budget (0 = no memory tier)
+            directory: Directory for the disk tier (None = memory only)
+            max_disk_mb: Disk budget (None = unbounded)
+        """
+        self.max_memory_bytes = int(max_memory_mb * 2**20)
+        self.directory = Path(directory) if directory is not None else None
+        self.max_disk_bytes = int(max_disk_mb * 2**20) if max_disk_mb is not None else None
+        self.hits = 0
+        self.misses = 0
+        self._memory: 'OrderedDict[str, Dict[str, np.ndarray]]' = OrderedDict()
+        self._memory_bytes = 0
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def __getstate__(self) -> dict:
+        """Pickle without the memory tier (it is not shared with workers)."""
+        state = self.__dict__.copy()
+        state['_memory'] = OrderedDict()
+        state['_memory_bytes'] = 0
+        return state
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes held by the memory tier."""
+        return self._memory_bytes
+
+    def get(self, key: str) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Look up a block.
+
+        Args:
+            key: Block fingerprint
+
+        Returns:
+            Dict of {name: array}, or None on a miss
+        """
+        if key in self._memory:
+            self._memory.move_to_end(key)
+            self.hits += 1
+            return self._memory[key]
+
+        path = self._path(key)
+        if path is not None and path.exists():
+            try:
+                with np.load(path) as data:
+                    arrays = {name: data[name] for name in data.files}
+            except (OSError, ValueError) as e:
+                # Another process may be writing or evicting it
+                logger.debug(f"Ignoring unreadable cache file {path}: {e}")
+            else:
+                os.utime(path)
+                self._remember(key, arrays)
+                self.hits += 1
+                return arrays
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, arrays: Dict[str, np.ndarray]):
+        """
+        Store a block.
+
+        Args:
+            key: Block fingerprint
+            arrays: Dict of {name: array}
+        """
+        self._remember(key, arrays)
+
+        path = self._path(key)
+        if path is not None and not path.exists():
+            # Write under a temporary name so readers never see a partial file
+            partial = path.with_name(f"{path.stem}.{os.getpid()}.partial")
+            with open(partial, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(partial, path)
+            self._evict_disk()
+
+    def clear(self):
+        """Drop every entry from both tiers."""
+        self._memory.clear()
+        self._memory_bytes = 0
+        if self.directory is not None:
+            for path in self.directory.glob('*.npz'):
+                path.unlink(missing_ok=True)
+
+    def _remember(self, key: str, arrays: Dict[str, np.ndarray]):
+        """Add an entry to the memory tier and evict past the budget."""
+        size = sum(values.nbytes for values in arrays.values())
+        if size > self.max_memory_bytes:
+            return
+
+        if key in self._memory:
+            self._memory_bytes -= sum(v.nbytes for v in self._memory.pop(key).values())
+
+        self._memory[key] = arrays
+        self._memory_bytes += size
+
+        while self._memory_bytes > self.max_memory_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= sum(values.nbytes for values in evicted.values())
+
+    def _evict_disk(self):
+        """Delete the least recently used files past the disk budget."""
+        if self.max_disk_bytes is None:
+            return
+
+        files = []
+        for path in self.directory.glob('*.npz'):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _path(self, key: str) -> Optional[Path]:
+        """File of a block in the disk tier."""
+        return self.directory / f"{key}.npz" if self.directory is not None else None
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ScenarioCache(entries={len(self._memory)}, "
+            f"memory_mb={self._memory_bytes / 2**20:.1f}, "
+            f"directory={self.directory}, hits={self.hits}, misses={self.misses})"
+        )
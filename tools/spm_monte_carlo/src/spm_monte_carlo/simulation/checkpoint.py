@@ -0,0 +1,93 @@
+"""Checkpoints of in-progress simulation runs."""
+
+import os
+import pickle
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Any, Union
+import logging
+
+from ..compensation.plan import CompensationPlan
+from ..exceptions import ConfigurationError
+from .scenarios import ScenarioGenerator
+from .convergence import ConvergenceMonitor
+from .profiling import PipelineProfiler
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+@dataclass
+class RunCheckpoint:
+    """
+    Everything needed to continue a run after its last completed batch.
+
+    Scenario blocks draw from streams keyed by block index, so the
+    generator (with its fitted distributions and seed) plus the index of
+    the next batch fully determine the remaining draws; no generator
+    state has to be captured. The accumulator carries the rows or
+    statistics folded in so far (memory-mapped columns are referenced by
+    path, not copied).
+    """
+    generator: ScenarioGenerator
+    plan: CompensationPlan
+    iterations: int
+    batches: List[range]
+    accumulator: Any
+    completed: int = 0
+    monitor: Optional[ConvergenceMonitor] = None
+    target_precision: Optional[float] = None
+    memory_limit_mb: Optional[float] = None
+    importance_shift: Optional[float] = None
+    profiler: Optional[PipelineProfiler] = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def finished(self) -> bool:
+        """Whether every planned batch has completed."""
+        return self.completed >= len(self.batches)
+
+    def save(self, path: Union[str, Path]):
+        """
+        Write the checkpoint atomically.
+
+        Args:
+            path: Checkpoint file
+        """
+        path = Path(path)
+        partial = path.with_name(f"{path.name}.partial")
+        with open(partial, 'wb') as f:
+            pickle.dump((CHECKPOINT_VERSION, self), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(partial, path)
+
+        logger.info(f"Checkpointed batch {self.completed}/{len(self.batches)} to {path}")
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'RunCheckpoint':
+        """
+        Read a checkpoint.
+
+        Args:
+            path: Checkpoint file
+
+        Returns:
+            RunCheckpoint
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            ConfigurationError: If the file is not a compatible checkpoint
+        """
+        with open(path, 'rb') as f:
+            payload = pickle.load(f)
+
+        if not (isinstance(payload, tuple) and len(payload) == 2
+                and isinstance(payload[1], cls)):
+            raise ConfigurationError(f"{path} is not a simulation checkpoint")
+
+        version, checkpoint = payload
+        if version != CHECKPOINT_VERSION:
+            raise ConfigurationError(
+                f"Checkpoint version {version} is not supported (expected {CHECKPOINT_VERSION})"
+            )
+        return checkpoint
@@ -0,0 +1,149 @@
+"""Paired comparison of compensation plans on common scenarios."""
+
+import pandas as pd
+import numpy as np
+from scipy.stats import norm
+from typing import List, Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class PlanComparison:
+    """
+    Plans evaluated on the same simulated scenarios.
+
+    Every plan's total payout (summed over reps) is kept per scenario.
+    Because all plans saw identical draws, the per-scenario difference
+    between two plans removes the scenario-to-scenario noise they share,
+    and its standard error is usually far below that of two independent
+    runs (reported alongside as ``unpaired_std_error``).
+
+    Example:
+        >>> comparison = sim.compare([current_plan, proposed_plan])
+        >>> comparison.differences()
+    """
+
+    def __init__(
+        self,
+        totals: pd.DataFrame,
+        baseline: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize comparison.
+
+        Args:
+            totals: DataFrame with scenario_id and one total payout column
+                    per plan_id
+            baseline: Plan differences are measured against
+                      (default: the first plan)
+            metadata: Run information
+        """
+        self.totals = totals.set_index('scenario_id') if 'scenario_id' in totals else totals
+        self.baseline = baseline or self.plan_ids[0]
+        self.metadata = metadata or {}
+        self._check_plan(self.baseline)
+
+    @property
+    def plan_ids(self) -> List[str]:
+        """Compared plans, in evaluation order."""
+        return list(self.totals.columns)
+
+    def summary(self, percentiles: List[float] = [5, 50, 95]) -> pd.DataFrame:
+        """
+        Distribution of each plan's total payout per scenario.
+
+        Args:
+            percentiles: Percentiles to include
+
+        Returns:
+            DataFrame indexed by plan with mean, std and percentiles
+        """
+        summary = pd.DataFrame({
+            'mean': self.totals.mean(),
+            'std': self.totals.std()
+        })
+        for p in percentiles:
+            summary[f'p{p}'] = self.totals.quantile(p / 100)
+        summary.index.name = 'plan_id'
+        return summary
+
+    def paired_difference(self, plan_id: str, baseline: Optional[str] = None) -> pd.Series:
+        """
+        Per-scenario payout difference between a plan and the baseline.
+
+        Args:
+            plan_id: Plan to compare
+            baseline: Reference plan (default: the comparison baseline)
+
+        Returns:
+            Series of plan total minus baseline total, by scenario_id
+        """
+        baseline = baseline or self.baseline
+        self._check_plan(plan_id)
+        self._check_plan(baseline)
+        return self.totals[plan_id] - self.totals[baseline]
+
+    def differences(
+        self,
+        baseline: Optional[str] = None,
+        confidence: float = 0.95
+    ) -> pd.DataFrame:
+        """
+        Paired difference statistics of every plan against the baseline.
+
+        Args:
+            baseline: Reference plan (default: the comparison baseline)
+            confidence: Confidence level of the interval
+
+        Returns:
+            DataFrame indexed by plan with mean_difference,
+            relative_difference, std_error, ci_lower, ci_upper,
+            prob_higher (share of scenarios where the plan pays more),
+            correlation with the baseline and unpaired_std_error
+        """
+        baseline = baseline or self.baseline
+        self._check_plan(baseline)
+        z = norm.ppf(0.5 + confidence / 2)
+        n = len(self.totals)
+        reference = self.totals[baseline]
+
+        rows = {}
+        for plan_id in self.plan_ids:
+            if plan_id == baseline:
+                continue
+
+            diff = self.paired_difference(plan_id, baseline)
+            mean = diff.mean()
+            std_error = diff.std() / np.sqrt(n)
+            unpaired = np.sqrt(
+                (self.totals[plan_id].var() + reference.var()) / n
+            )
+
+            rows[plan_id] = {
+                'mean_difference': mean,
+                'relative_difference': mean / reference.mean() if reference.mean() else np.nan,
+                'std_error': std_error,
+                'ci_lower': mean - z * std_error,
+                'ci_upper': mean + z * std_error,
+                'prob_higher': (diff > 0).mean(),
+                'correlation': self.totals[plan_id].corr(reference),
+                'unpaired_std_error': unpaired
+            }
+
+        differences = pd.DataFrame.from_dict(rows, orient='index')
+        differences.index.name = 'plan_id'
+        return differences
+
+    def _check_plan(self, plan_id: str):
+        """Raise if a plan is not part of the comparison."""
+        if plan_id not in self.totals.columns:
+            raise ValueError(f"Unknown plan: {plan_id}. Available: {self.plan_ids}")
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"PlanComparison(plans={self.plan_ids}, scenarios={len(self.totals)}, "
+            f"baseline='{self.baseline}')"
+        )
@@ -0,0 +1,148 @@
+"""Convergence monitoring for adaptive simulation runs."""
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+from typing import Dict, List
+import logging
+
+from ..statistics.weighted import weighted_mean, weighted_quantile
+from .scenario_store import WEIGHT_COLUMN
+
+logger = logging.getLogger(__name__)
+
+
+class ConvergenceMonitor:
+    """
+    Track the precision of key estimates as scenario blocks complete.
+
+    Every generation block is an independent replicate of the simulation,
+    so the spread of per-block estimates gives a standard error for the
+    run-level estimate (the method of batch means). Precision is reported
+    as the confidence-interval half-width relative to the estimate.
+    Importance-sampled batches (with a weight column) use weighted
+    per-block estimates.
+
+    Example:
+        >>> monitor = ConvergenceMonitor(target_precision=0.01)
+        >>> monitor.update(batch_results, block_size=1024)
+        >>> monitor.converged
+    """
+
+    METRICS = {
+        'expected_payout': None,
+        'var_95': 0.95,
+        'var_99': 0.99
+    }
+
+    def __init__(
+        self,
+        target_precision: float,
+        confidence: float = 0.95,
+        min_replicates: int = 10,
+        variable: str = 'total_payout'
+    ):
+        """
+        Initialize monitor.
+
+        Args:
+            target_precision: Relative CI half-width to reach (e.g. 0.01 = 1%)
+            confidence: Confidence level of the interval
+            min_replicates: Blocks required before convergence can be declared
+            variable: Output variable to monitor
+        """
+        if target_precision <= 0:
+            raise ValueError("target_precision must be positive")
+
+        self.target_precision = target_precision
+        self.confidence = confidence
+        self.min_replicates = min_replicates
+        self.variable = variable
+        self._z = norm.ppf(0.5 + confidence / 2)
+        self._estimates: Dict[str, List[float]] = {metric: [] for metric in self.METRICS}
+
+    @property
+    def replicates(self) -> int:
+        """Number of blocks observed."""
+        return len(self._estimates['expected_payout'])
+
+    def update(self, batch: pd.DataFrame, block_size: int):
+        """
+        Record per-block estimates for a batch of results.
+
+        Args:
+            batch: Results with scenario_id and the monitored variable
+            block_size: Scenarios per generation block
+        """
+        block_ids = batch['scenario_id'].to_numpy() // block_size
+        values = batch[self.variable].to_numpy()
+        _, starts = np.unique(block_ids, return_index=True)
+
+        if WEIGHT_COLUMN in batch.columns:
+            weights = np.split(batch[WEIGHT_COLUMN].to_numpy(), starts[1:])
+        else:
+            weights = [None] * len(starts)
+
+        for block_values, block_weights in zip(np.split(values, starts[1:]), weights):
+            for metric, q in self.METRICS.items():
+                if block_weights is not None:
+                    estimate = (
+                        weighted_mean(block_values, block_weights) if q is None
+                        else weighted_quantile(block_values, block_weights, q)
+                    )
+                else:
+                    estimate = block_values.mean() if q is None else np.quantile(block_values, q)
+                self._estimates[metric].append(float(estimate))
+
+    def precision(self) -> Dict[str, float]:
+        """
+        Relative confidence-interval half-width of each metric.
+
+        Returns:
+            Dict of {metric: relative half-width} (inf until 2 replicates)
+        """
+        result = {}
+
+        for metric, estimates in self._estimates.items():
+            if len(estimates) < 2:
+                result[metric] = float('inf')
+                continue
+
+            estimates = np.asarray(estimates)
+            half_width = self._z * estimates.std(ddof=1) / np.sqrt(len(estimates))
+            center = abs(estimates.mean())
+
+            if half_width == 0:
+                result[metric] = 0.0
+            elif center == 0:
+                result[metric] = float('inf')
+            else:
+                result[metric] = float(half_width / center)
+
+        return result
+
+    @property
+    def converged(self) -> bool:
+        """Whether every metric meets the target precision."""
+        if self.replicates < self.min_replicates:
+            return False
+        return all(p <= self.target_precision for p in self.precision().values())
+
+    def report(self, iterations: int) -> Dict[str, object]:
+        """
+        Summarize convergence state.
+
+        Args:
+            iterations: Iterations run so far
+
+        Returns:
+            Dict with converged flag, iterations, replicates and precision
+        """
+        return {
+            'converged': self.converged,
+            'iterations': iterations,
+            'replicates': self.replicates,
+            'target_precision': self.target_precision,
+            'confidence': self.confidence,
+            'precision': self.precision()
+        }
@@ -0,0 +1,289 @@
+"""Execution backends for Monte Carlo simulation."""
+
+import os
+import time
+import pandas as pd
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, List, Dict, Any, Callable, Tuple
+import logging
+
+from ..compensation.plan import CompensationPlan
+from ..compensation.engine import CompensationEngine
+from .scenarios import ScenarioGenerator
+from .scenario_store import ID_DTYPE
+from .profiling import PipelineProfiler
+
+logger = logging.getLogger(__name__)
+
+# Rows below which a batch runs serially even when parallel: starting
+# workers (re-importing the package under spawn) costs about as much as
+# evaluating this many rows in-process
+PARALLEL_MIN_ROWS = 1_000_000
+
+
+def simulate_shard(
+    generator: ScenarioGenerator,
+    plan: CompensationPlan,
+    n_scenarios: int,
+    blocks: range
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+    """
+    Generate and evaluate one shard of scenario blocks.
+
+    Module-level so it can be pickled into worker processes. Scenario ids
+    are returned as int32 and float columns at the generator's precision.
+
+    Args:
+        generator: Scenario generator
+        plan: Compensation plan
+        n_scenarios: Total scenarios in the run
+        blocks: Block indices in this shard
+
+    Returns:
+        Tuple of (DataFrame with compensation for the shard's scenarios,
+        sample/compute stage records measured in this process)
+    """
+    profiler = PipelineProfiler()
+
+    with profiler.stage('sample') as record:
+        scenarios = generator.generate_store(n_scenarios, blocks).to_frame()
+        record['rows'] += len(scenarios)
+
+    with profiler.stage('compute', rows=len(scenarios)):
+        engine = CompensationEngine(plan)
+        results = engine.calculate_batch(scenarios, group_by='scenario_id')
+
+        dtypes = {'scenario_id': ID_DTYPE}
+        if generator.precision != np.float64:
+            floats = results.select_dtypes(include=[np.floating]).columns
+            dtypes.update({col: generator.precision for col in floats})
+        results = results.astype(dtypes)
+
+    return results, profiler.stages
+
+
+def compare_shard(
+    generator: ScenarioGenerator,
+    plans: List[CompensationPlan],
+    n_scenarios: int,
+    blocks: range
+) -> Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]:
+    """
+    Evaluate several plans on one shard of scenario blocks.
+
+    The scenarios are generated once and every plan is evaluated on the
+    same draws (common random numbers).
+
+    Args:
+        generator: Scenario generator
+        plans: Compensation plans to evaluate
+        n_scenarios: Total scenarios in the run
+        blocks: Block indices in this shard
+
+    Returns:
+        Tuple of (DataFrame with scenario_id and each plan's total payout
+        across reps, one column per plan_id; stage records)
+    """
+    profiler = PipelineProfiler()
+
+    with profiler.stage('sample') as record:
+        scenarios = generator.generate_store(n_scenarios, blocks).to_frame()
+        record['rows'] += len(scenarios)
+
+    totals = {}
+    for plan in plans:
+        with profiler.stage('compute', rows=len(scenarios)):
+            results = CompensationEngine(plan).calculate_batch(scenarios, group_by='scenario_id')
+            totals[plan.plan_id] = results.groupby('scenario_id')['total_payout'].sum()
+
+    return pd.DataFrame(totals).rename_axis('scenario_id').reset_index(), profiler.stages
+
+
+class SimulationExecutor:
+    """
+    Evaluate scenario blocks serially or on a process pool.
+
+    Blocks are split into contiguous shards and results are merged in
+    shard order, so the output is identical to a serial run for the same
+    seed regardless of worker count. Batches smaller than min_rows run
+    serially, since worker start-up would cost more than it saves. Used
+    as a context manager, the executor keeps one worker pool alive across
+    successive batches, started when the first batch needs it.
+    """
+
+    SHARDS_PER_WORKER = 4
+
+    def __init__(
+        self,
+        parallel: bool = True,
+        workers: Optional[int] = None,
+        min_rows: int = PARALLEL_MIN_ROWS
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            parallel: Use a process pool when there is more than one shard
+            workers: Number of worker processes (default: CPU count)
+            min_rows: Smallest batch, in scenario-rep rows, sent to the
+                      pool (default: PARALLEL_MIN_ROWS)
+        """
+        self.parallel = parallel
+        self.workers = workers or os.cpu_count() or 1
+        self.min_rows = min_rows
+        self.last_run: Dict[str, Any] = {}
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._shared = False
+
+    def __enter__(self) -> 'SimulationExecutor':
+        """Share one worker pool between all runs inside the block."""
+        self._shared = True
+        return self
+
+    def __exit__(self, *exc_info):
+        """Shut the shared worker pool down."""
+        self._shared = False
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def shards(self, n_blocks: int, n_rows: Optional[int] = None) -> List[range]:
+        """
+        Split block indices into contiguous shards.
+
+        Args:
+            n_blocks: Number of blocks in the run
+            n_rows: Scenario-rep rows the blocks produce
+                    (None = not checked against min_rows)
+
+        Returns:
+            List of block ranges, in order
+        """
+        if self._use_pool(n_blocks, n_rows):
+            n_shards = min(n_blocks, self.workers * self.SHARDS_PER_WORKER)
+        else:
+            n_shards = 1
+        bounds = [round(i * n_blocks / n_shards) for i in range(n_shards + 1)]
+        return [range(bounds[i], bounds[i + 1]) for i in range(n_shards)]
+
+    def run(
+        self,
+        generator: ScenarioGenerator,
+        plan: CompensationPlan,
+        n_scenarios: int,
+        blocks: Optional[range] = None
+    ) -> pd.DataFrame:
+        """
+        Generate and evaluate scenarios.
+
+        Args:
+            generator: Scenario generator
+            plan: Compensation plan
+            n_scenarios: Total scenarios in the run
+            blocks: Block indices to evaluate (None = all)
+
+        Returns:
+            DataFrame with compensation for the evaluated scenarios
+        """
+        return self._dispatch(simulate_shard, generator, plan, n_scenarios, blocks)
+
+    def compare(
+        self,
+        generator: ScenarioGenerator,
+        plans: List[CompensationPlan],
+        n_scenarios: int,
+        blocks: Optional[range] = None
+    ) -> pd.DataFrame:
+        """
+        Evaluate several plans on the same generated scenarios.
+
+        Args:
+            generator: Scenario generator
+            plans: Compensation plans to evaluate
+            n_scenarios: Total scenarios in the run
+            blocks: Block indices to evaluate (None = all)
+
+        Returns:
+            DataFrame with scenario_id and one total payout column per plan_id
+        """
+        return self._dispatch(compare_shard, generator, plans, n_scenarios, blocks)
+
+    def _dispatch(
+        self,
+        task: Callable[..., Tuple[pd.DataFrame, Dict[str, Dict[str, Any]]]],
+        generator: ScenarioGenerator,
+        plans: Any,
+        n_scenarios: int,
+        blocks: Optional[range]
+    ) -> pd.DataFrame:
+        """
+        Run a shard task over blocks, serially or on the pool.
+
+        Args:
+            task: Module-level shard function (generator, plans, n_scenarios, blocks)
+            generator: Scenario generator
+            plans: Plan (or plans) handed to the task
+            n_scenarios: Total scenarios in the run
+            blocks: Block indices to evaluate (None = all)
+
+        Returns:
+            Shard results concatenated in shard order (their stage
+            records are merged into ``last_run['stages']``)
+        """
+        if blocks is None:
+            blocks = range(generator.n_blocks(n_scenarios))
+
+        n_rows = len(blocks) * generator.block_size * generator.n_reps
+        use_pool = self._use_pool(len(blocks), n_rows)
+        shards = [
+            blocks[shard.start:shard.stop] for shard in self.shards(len(blocks), n_rows)
+        ]
+        start = time.perf_counter()
+
+        if use_pool:
+            logger.info(f"Running {len(shards)} shards on {self.workers} worker processes")
+            pool = self._pool or ProcessPoolExecutor(max_workers=self.workers)
+            if self._shared:
+                self._pool = pool
+            try:
+                futures = [
+                    pool.submit(task, generator, plans, n_scenarios, shard)
+                    for shard in shards
+                ]
+                outputs = [future.result() for future in futures]
+            finally:
+                if pool is not self._pool:
+                    pool.shutdown()
+        else:
+            outputs = [task(generator, plans, n_scenarios, shard) for shard in shards]
+
+        profiler = PipelineProfiler()
+        for _, stages in outputs:
+            profiler.merge(stages)
+        parts = [frame for frame, _ in outputs]
+        results = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+
+        self.last_run = {
+            'backend': 'process_pool' if use_pool else 'serial',
+            'workers': self.workers if use_pool else 1,
+            'shards': len(shards),
+            'elapsed_seconds': time.perf_counter() - start,
+            'stages': profiler.stages
+        }
+        logger.info(
+            f"Evaluated {len(blocks)} blocks in {self.last_run['elapsed_seconds']:.2f}s "
+            f"({self.last_run['backend']}, {self.last_run['workers']} workers)"
+        )
+
+        return results
+
+    def _use_pool(self, n_blocks: int, n_rows: Optional[int] = None) -> bool:
+        """Whether a run of n_blocks (n_rows rows) goes to the process pool."""
+        if n_rows is not None and n_rows < self.min_rows:
+            return False
+        return self.parallel and self.workers > 1 and n_blocks > 1
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"SimulationExecutor(parallel={self.parallel}, workers={self.workers})"
@@ -0,0 +1,286 @@
+"""Gradient-free plan cost optimization on frozen scenarios."""
+
+import copy
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple, Union
+import logging
+
+from ..compensation.plan import CompensationPlan
+from .streams import RandomStreams
+from .sweep import PlanSweep
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class OptimizationResult:
+    """Outcome of a plan cost optimization."""
+    plan: CompensationPlan
+    parameters: Dict[str, float]
+    expected_cost: float
+    cost_var_95: float
+    feasible: bool
+    converged: bool
+    rounds: int
+    history: pd.DataFrame = field(repr=False)
+
+
+class PlanOptimizer:
+    """
+    Cross-entropy search for tier parameters that hit a cost target.
+
+    Each round draws a population of candidate parameter vectors from a
+    Gaussian, evaluates the whole population on the frozen scenarios in
+    one ``PlanSweep`` call, and refits the Gaussian to the best (elite)
+    candidates. Candidates are scored by their relative miss of the
+    target expected cost plus penalties for exceeding the VaR95 budget,
+    for rates that fall as attainment rises and for tiers whose
+    thresholds cross. Rates and thresholds are only compared between
+    neighbouring tiers of the same kind (rate_type and applies_to), so a
+    flat-dollar tier is never ranked against a percentage rate. A small
+    pull toward the starting plan picks the least disruptive of equally
+    good plans.
+
+    Example:
+        >>> optimizer = PlanOptimizer(
+        ...     PlanSweep(plan, scenarios, n_reps),
+        ...     bounds={'Tier 4.rate_value': (0.04, 0.10),
+        ...             'Tier 4.quota_min': (1.1, 1.5)},
+        ...     target_cost=2_500_000, var_95_budget=3_000_000)
+        >>> result = optimizer.optimize()
+    """
+
+    # Weight of constraint violations relative to the cost miss
+    PENALTY = 10.0
+
+    def __init__(
+        self,
+        plan_sweep: PlanSweep,
+        bounds: Dict[Union[str, Tuple[str, ...]], Tuple[float, float]],
+        target_cost: float,
+        var_95_budget: Optional[float] = None,
+        population: int = 64,
+        elite_fraction: float = 0.2,
+        max_rounds: int = 30,
+        tolerance: float = 1e-2,
+        regularization: float = 1e-3,
+        seed: Optional[Union[int, RandomStreams]] = None
+    ):
+        """
+        Initialize optimizer.
+
+        Args:
+            plan_sweep: Sweep over the frozen scenarios and starting plan
+            bounds: Dict of {parameter name(s): (low, high)}; a tuple key
+                    moves several parameters together (a shared breakpoint)
+            target_cost: Target expected total payout per scenario
+            var_95_budget: Ceiling on the 95th percentile of total payout
+                           (None = unconstrained)
+            population: Candidates evaluated per round
+            elite_fraction: Share of each round used to refit the search
+            max_rounds: Round cap
+            tolerance: Stop when every parameter's search std falls below
+                       this fraction of its range
+            regularization: Weight of the pull toward the starting plan
+            seed: Random seed or RandomStreams for the search
+        """
+        if target_cost <= 0:
+            raise ValueError("target_cost must be positive")
+        if not bounds:
+            raise ValueError("No parameters to optimize")
+
+        self.plan_sweep = plan_sweep
+        self.keys = [key if isinstance(key, tuple) else (key,) for key in bounds]
+        self.low = np.array([b[0] for b in bounds.values()], dtype=float)
+        self.high = np.array([b[1] for b in bounds.values()], dtype=float)
+        self.target_cost = target_cost
+        self.var_95_budget = var_95_budget
+        self.population = population
+        self.n_elite = max(2, int(population * elite_fraction))
+        self.max_rounds = max_rounds
+        self.tolerance = tolerance
+        self.regularization = regularization
+        self.streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+
+        if np.any(self.high <= self.low):
+            raise ValueError("Every bound needs low < high")
+
+        self.start = np.clip(self._current_values(), self.low, self.high)
+
+        # Pairs of tiers (lower, next higher) of the same kind, in the
+        # starting plan's attainment order, for the constraints
+        tiers = plan_sweep.plan.commission_tiers
+        order = np.argsort([tier.quota_min for tier in tiers], kind='stable')
+        previous: Dict[Tuple[str, str], int] = {}
+        pairs = []
+        for i in order:
+            kind = (tiers[i].rate_type, tiers[i].applies_to)
+            if kind in previous:
+                pairs.append((previous[kind], i))
+            previous[kind] = i
+        self._lower = np.array([lower for lower, _ in pairs], dtype=int)
+        self._upper = np.array([upper for _, upper in pairs], dtype=int)
+
+    def _current_values(self) -> np.ndarray:
+        """Starting plan's value of each searched parameter."""
+        # Rejects names that do not match the plan's tiers
+        self.plan_sweep.tier_sweep.parameter_arrays(self.points(self.low[None, :]))
+
+        tiers = {tier.tier_name: tier for tier in self.plan_sweep.plan.commission_tiers}
+        values = []
+        for names in self.keys:
+            tier_name, _, param = names[0].rpartition('.')
+            values.append(getattr(tiers[tier_name], param))
+        return np.array(values, dtype=float)
+
+    def points(self, candidates: np.ndarray) -> pd.DataFrame:
+        """
+        Parameter table of candidate vectors.
+
+        Args:
+            candidates: Array of shape (n_candidates, n_parameters)
+
+        Returns:
+            DataFrame with one column per parameter name
+        """
+        columns = {}
+        for i, names in enumerate(self.keys):
+            for name in names:
+                columns[name] = candidates[:, i]
+        return pd.DataFrame(columns)
+
+    def score(self, candidates: np.ndarray) -> pd.DataFrame:
+        """
+        Evaluate and score candidates (lower is better).
+
+        Args:
+            candidates: Array of shape (n_candidates, n_parameters)
+
+        Returns:
+            DataFrame with expected_cost, cost_var_95, violation and score
+        """
+        points = self.points(candidates)
+        totals = self.plan_sweep.totals(points)
+        expected = totals.mean(axis=1)
+        var_95 = np.quantile(totals, 0.95, axis=1)
+
+        params = self.plan_sweep.tier_sweep.parameter_arrays(points)
+        rates = params['rate_value']
+        quota_min = params['quota_min']
+        quota_max = params['quota_max']
+
+        # Rates must not fall as attainment rises; thresholds must not cross
+        lower, upper = self._lower, self._upper
+        violation = np.clip(rates[:, lower] - rates[:, upper], 0, None).sum(axis=1)
+        violation += np.clip(quota_min - quota_max, 0, None).sum(axis=1)
+        violation += np.clip(quota_max[:, lower] - quota_min[:, upper], 0, None).sum(axis=1)
+        if self.var_95_budget is not None:
+            violation += np.clip(var_95 / self.var_95_budget - 1, 0, None)
+
+        distance = (((candidates - self.start) / (self.high - self.low)) ** 2).mean(axis=1)
+        score = (
+            np.abs(expected / self.target_cost - 1) +
+            self.PENALTY * violation +
+            self.regularization * distance
+        )
+
+        return pd.DataFrame({
+            'expected_cost': expected,
+            'cost_var_95': var_95,
+            'violation': violation,
+            'score': score
+        })
+
+    def optimize(self) -> OptimizationResult:
+        """
+        Run the cross-entropy search.
+
+        Returns:
+            OptimizationResult with the best plan found and the search
+            history (one row per round)
+        """
+        rng = self.streams.generator()
+        mean = self.start.copy()
+        std = (self.high - self.low) / 4
+
+        best, best_row = None, None
+        history = []
+        converged = False
+
+        for round_index in range(1, self.max_rounds + 1):
+            candidates = np.clip(
+                rng.normal(mean, std, size=(self.population, len(mean))),
+                self.low, self.high
+            )
+            if round_index == 1:
+                candidates[0] = self.start
+
+            scores = self.score(candidates)
+            elite = np.argsort(scores['score'].to_numpy(), kind='stable')[:self.n_elite]
+
+            top = elite[0]
+            if best_row is None or scores['score'].iloc[top] < best_row['score']:
+                best, best_row = candidates[top].copy(), scores.iloc[top]
+
+            # Smoothed refit keeps the search from collapsing too early
+            mean = 0.7 * candidates[elite].mean(axis=0) + 0.3 * mean
+            std = 0.7 * candidates[elite].std(axis=0) + 0.3 * std
+
+            history.append({
+                'round': round_index,
+                'best_score': best_row['score'],
+                'best_expected_cost': best_row['expected_cost'],
+                'best_cost_var_95': best_row['cost_var_95'],
+                'search_std': float((std / (self.high - self.low)).max())
+            })
+            logger.debug(
+                f"Round {round_index}: best score {best_row['score']:.5f}, "
+                f"expected cost {best_row['expected_cost']:,.0f}"
+            )
+
+            if np.all(std <= self.tolerance * (self.high - self.low)):
+                converged = True
+                break
+
+        parameters = self.points(best[None, :]).iloc[0].to_dict()
+        feasible = bool(best_row['violation'] == 0)
+
+        if not feasible:
+            logger.warning(
+                "No candidate met every constraint; returning the least-violating plan"
+            )
+
+        logger.info(
+            f"Optimized plan after {round_index} rounds: expected cost "
+            f"{best_row['expected_cost']:,.0f} (target {self.target_cost:,.0f})"
+        )
+
+        return OptimizationResult(
+            plan=self.apply(parameters),
+            parameters=parameters,
+            expected_cost=float(best_row['expected_cost']),
+            cost_var_95=float(best_row['cost_var_95']),
+            feasible=feasible,
+            converged=converged,
+            rounds=round_index,
+            history=pd.DataFrame(history)
+        )
+
+    def apply(self, parameters: Dict[str, float]) -> CompensationPlan:
+        """
+        Copy of the starting plan with parameters applied.
+
+        Args:
+            parameters: Dict of {'<tier_name>.<field>': value}
+
+        Returns:
+            New CompensationPlan
+        """
+        plan = copy.deepcopy(self.plan_sweep.plan)
+        tiers = {tier.tier_name: tier for tier in plan.commission_tiers}
+        for name, value in parameters.items():
+            tier_name, _, param = name.rpartition('.')
+            setattr(tiers[tier_name], param, float(value))
+        return plan
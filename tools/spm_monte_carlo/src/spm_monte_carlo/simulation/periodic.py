@@ -0,0 +1,134 @@
+"""Results of multi-period simulation runs."""
+
+import pandas as pd
+import numpy as np
+from typing import List, Dict, Any, Optional
+import logging
+
+from ..compensation.engine import PAYOUT_COMPONENTS
+from .results import SimulationResults
+from .scenario_store import ScenarioStore, ID_DTYPE
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicResults:
+    """
+    Payout timing of a multi-period simulation.
+
+    Holds each payout component as a (scenario x rep x period) array, so
+    cash needs can be read per period (``payout_timing``), per scenario
+    (``period_totals``) or rolled up to one row per scenario-rep for the
+    usual risk analysis (``annual_results``).
+    """
+
+    def __init__(
+        self,
+        scenario_ids: np.ndarray,
+        rep_ids: np.ndarray,
+        payouts: Dict[str, np.ndarray],
+        quota: np.ndarray,
+        actual_sales: np.ndarray,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize results.
+
+        Args:
+            scenario_ids: Scenario id of each row of the arrays
+            rep_ids: Rep identifiers, aligned with the rep axis
+            payouts: Dict of {component: array (scenarios, reps, periods)}
+            quota: Total quota per scenario and rep (scenarios, reps)
+            actual_sales: Total sales per scenario and rep (scenarios, reps)
+            metadata: Run information
+        """
+        self.scenario_ids = np.asarray(scenario_ids, dtype=ID_DTYPE)
+        self.rep_ids = np.asarray(rep_ids)
+        self.payouts = payouts
+        self.quota = quota
+        self.actual_sales = actual_sales
+        self.metadata = metadata or {}
+
+    @property
+    def n_periods(self) -> int:
+        """Periods per scenario."""
+        return self.payouts['total_payout'].shape[-1]
+
+    def period_totals(self, component: str = 'total_payout') -> np.ndarray:
+        """
+        Payout across all reps in every scenario and period.
+
+        Args:
+            component: Payout component
+
+        Returns:
+            Array of shape (scenarios, periods)
+        """
+        self._check_component(component)
+        return self.payouts[component].sum(axis=1)
+
+    def payout_timing(
+        self,
+        component: str = 'total_payout',
+        percentiles: List[float] = [5, 50, 95]
+    ) -> pd.DataFrame:
+        """
+        Distribution of the organisation's payout in each period.
+
+        Args:
+            component: Payout component
+            percentiles: Percentiles to report for each period
+
+        Returns:
+            DataFrame indexed by period (1-based) with mean, std,
+            percentiles and the mean cumulative payout
+        """
+        totals = self.period_totals(component)
+
+        timing = pd.DataFrame(
+            {'mean': totals.mean(axis=0), 'std': totals.std(axis=0)},
+            index=pd.RangeIndex(1, self.n_periods + 1, name='period')
+        )
+        quantiles = np.percentile(totals, percentiles, axis=0)
+        for p, values in zip(percentiles, quantiles):
+            timing[f'p{p}'] = values
+        timing['cumulative_mean'] = timing['mean'].cumsum()
+
+        return timing
+
+    def annual_results(self) -> SimulationResults:
+        """
+        Roll periods up to one row per scenario-rep.
+
+        Returns:
+            SimulationResults with quota, actual_sales, quota_attainment
+            and payout components summed over all periods
+        """
+        n_scenarios, n_reps = self.quota.shape
+        store = ScenarioStore(
+            np.repeat(self.scenario_ids, n_reps),
+            np.tile(np.arange(n_reps, dtype=ID_DTYPE), n_scenarios),
+            self.rep_ids,
+            precision=self.payouts['total_payout'].dtype
+        )
+        store.add('quota', self.quota.ravel())
+        store.add('actual_sales', self.actual_sales.ravel())
+        store.add('quota_attainment', (self.actual_sales / self.quota).ravel())
+        for component in PAYOUT_COMPONENTS:
+            store.add(component, self.payouts[component].sum(axis=-1).ravel())
+
+        return SimulationResults(store.to_frame(), metadata=self.metadata)
+
+    def _check_component(self, component: str):
+        """Raise if a payout component is not available."""
+        if component not in self.payouts:
+            raise ValueError(
+                f"Unknown payout component: {component}. Available: {list(self.payouts.keys())}"
+            )
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"PeriodicResults(scenarios={len(self.scenario_ids)}, "
+            f"reps={len(self.rep_ids)}, periods={self.n_periods})"
+        )
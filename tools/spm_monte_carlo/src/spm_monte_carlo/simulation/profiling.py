@@ -0,0 +1,147 @@
+"""Per-stage timing and progress instrumentation."""
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Iterator
+import logging
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Pipeline stages, in execution order
+STAGES = ['load', 'validate', 'fit', 'correlate', 'sample', 'compute', 'aggregate']
+
+
+def peak_memory_mb() -> Optional[float]:
+    """
+    Peak resident memory of this process so far.
+
+    Returns:
+        Peak RSS in MB, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+class PipelineProfiler:
+    """
+    Accumulate wall time, CPU time, rows and peak memory per stage.
+
+    A stage can be entered many times (e.g. once per batch); its entries
+    are summed. Peak memory is the process's peak RSS when the stage last
+    finished. Profiles from worker processes are folded in with ``merge``.
+
+    Example:
+        >>> profiler = PipelineProfiler()
+        >>> with profiler.stage('sample') as record:
+        ...     store = generator.generate_store(n)
+        ...     record['rows'] += len(store)
+        >>> profiler.report()['sample']['wall_seconds']
+    """
+
+    def __init__(self):
+        """Initialize profiler."""
+        self.stages: Dict[str, Dict[str, Any]] = {}
+
+    def _record(self, name: str) -> Dict[str, Any]:
+        """Record of a stage, created empty on first use."""
+        return self.stages.setdefault(name, {
+            'wall_seconds': 0.0,
+            'cpu_seconds': 0.0,
+            'rows': 0,
+            'calls': 0,
+            'peak_memory_mb': None
+        })
+
+    @contextmanager
+    def stage(self, name: str, rows: int = 0) -> Iterator[Dict[str, Any]]:
+        """
+        Time one entry into a stage.
+
+        Args:
+            name: Stage name
+            rows: Rows processed (can also be added to the yielded record)
+
+        Yields:
+            The stage's record, for adding rows inside the block
+        """
+        record = self._record(name)
+        record['rows'] += rows
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record['wall_seconds'] += time.perf_counter() - wall
+            record['cpu_seconds'] += time.process_time() - cpu
+            record['calls'] += 1
+            record['peak_memory_mb'] = self._max(record['peak_memory_mb'], peak_memory_mb())
+
+    def merge(self, stages: Dict[str, Dict[str, Any]]):
+        """
+        Fold in stage records from another profiler (e.g. a worker).
+
+        Args:
+            stages: Dict of {stage: record} as in ``stages``
+        """
+        for name, other in stages.items():
+            record = self._record(name)
+            for key in ['wall_seconds', 'cpu_seconds', 'rows', 'calls']:
+                record[key] += other[key]
+            record['peak_memory_mb'] = self._max(record['peak_memory_mb'], other['peak_memory_mb'])
+
+    def report(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Stage records with throughput, in pipeline order.
+
+        Returns:
+            Dict of {stage: {wall_seconds, cpu_seconds, rows, calls,
+            peak_memory_mb, rows_per_second}}
+        """
+        order = STAGES + [name for name in self.stages if name not in STAGES]
+        report = {}
+        for name in order:
+            if name not in self.stages:
+                continue
+            record = dict(self.stages[name])
+            wall = record['wall_seconds']
+            record['rows_per_second'] = record['rows'] / wall if wall > 0 and record['rows'] else None
+            report[name] = record
+        return report
+
+    @staticmethod
+    def _max(a: Optional[float], b: Optional[float]) -> Optional[float]:
+        """Maximum ignoring missing values."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return max(a, b)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"PipelineProfiler(stages={list(self.report())})"
+
+
+def print_progress(progress: Dict[str, Any]):
+    """
+    Progress callback that redraws one status line on stderr.
+
+    Args:
+        progress: Batch progress dict passed to run() callbacks
+    """
+    fraction = progress['rows'] / progress['total_rows'] if progress['total_rows'] else 1.0
+    sys.stderr.write(
+        f"\rBatch {progress['batch']}/{progress['batches']} "
+        f"[{fraction:6.1%}] {progress['elapsed_seconds']:.1f}s"
+    )
+    if progress['done']:
+        sys.stderr.write("\n")
+    sys.stderr.flush()
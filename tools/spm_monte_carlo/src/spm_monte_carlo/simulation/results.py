@@ -2,31 +2,119 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Union
 import logging
 
+from ..statistics.streaming import StreamingStats
+from ..statistics.weighted import (
+    weighted_mean, weighted_std, weighted_quantile, weighted_fraction_above,
+    effective_sample_size
+)
+from .scenario_store import WEIGHT_COLUMN
+from .scenario_file import ScenarioFile
+from ..exceptions import SimulationError
+
 logger = logging.getLogger(__name__)
 
 
 class SimulationResults:
-    """Container for simulation results with built-in analysis methods."""
-
-    def __init__(self, scenarios: pd.DataFrame):
+    """
+    Container for simulation results with built-in analysis methods.
+
+    Results either hold the full scenario DataFrame (in memory, or
+    memory-mapped from a run's ``output_path``) or, in streaming mode,
+    only StreamingStats folded in batch by batch. Summary statistics and
+    risk metrics work in both modes; streaming quantiles carry the
+    sketch's relative error, and row-level analyses (sensitivity, CDF
+    plots, scenario export) need the full scenarios.
+
+    Importance-sampled runs carry a likelihood-ratio ``weight`` per row;
+    summaries and risk metrics then use self-normalized weighted
+    estimators so they describe the untilted distribution.
+    """
+
+    def __init__(
+        self,
+        scenarios: Optional[Union[pd.DataFrame, ScenarioFile]] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        stats: Optional[StreamingStats] = None
+    ):
         """
         Initialize results.
 
         Args:
-            scenarios: DataFrame with all simulation scenarios
+            scenarios: DataFrame with all simulation scenarios, or a
+                       ScenarioFile opened lazily on first use
+            metadata: Run information (execution backend, timing, ...)
+            stats: Streaming statistics (when scenarios were not retained)
         """
-        self._scenarios = scenarios
+        if scenarios is None and stats is None:
+            raise ValueError("Either scenarios or streaming stats are required")
+
+        self._source = scenarios if isinstance(scenarios, ScenarioFile) else None
+        self._frame = None if self._source is not None else scenarios
+        self._stats = stats
+        self.metadata = metadata or {}
         self._summary_stats = None
         self._risk_metrics = None
+        self._weights = None
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> 'SimulationResults':
+        """
+        Open results written by ``run(output_path=...)``.
+
+        Column files are memory-mapped, not loaded.
+
+        Args:
+            path: Scenario output directory
+
+        Returns:
+            SimulationResults backed by the files
+        """
+        source = ScenarioFile(path)
+        return cls(source, metadata=source.metadata)
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether results hold streaming statistics instead of scenarios."""
+        return self._frame is None and self._source is None
+
+    @property
+    def source(self) -> Optional[ScenarioFile]:
+        """On-disk scenario file backing these results, if any."""
+        return self._source
+
+    @property
+    def _scenarios(self) -> Optional[pd.DataFrame]:
+        """Scenario frame, mapped from disk on first access."""
+        if self._frame is None and self._source is not None:
+            self._frame = self._source.to_frame()
+        return self._frame
 
     @property
     def scenarios(self) -> pd.DataFrame:
         """Full scenario dataset."""
+        self._require_scenarios('scenarios')
         return self._scenarios
 
+    @property
+    def n_rows(self) -> int:
+        """Number of scenario-rep rows simulated."""
+        if self._source is not None:
+            return len(self._source)
+        return self._stats.count if self.is_streaming else len(self._scenarios)
+
+    @property
+    def weights(self) -> Optional[np.ndarray]:
+        """Likelihood-ratio weight of each row (None unless importance sampled)."""
+        if self._weights is None:
+            if self.is_streaming or WEIGHT_COLUMN not in self._scenarios.columns:
+                return None
+            self._weights = np.asarray(self._scenarios[WEIGHT_COLUMN], dtype=float)
+        return self._weights
+
     @property
     def summary_stats(self) -> pd.DataFrame:
         """Summary statistics (computed on first access)."""
@@ -41,6 +129,25 @@ class SimulationResults:
             self._risk_metrics = self._compute_risk_metrics()
         return self._risk_metrics
 
+    @property
+    def profile(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage wall time, CPU time, rows and peak memory of the run."""
+        return self.metadata.get('profile', {})
+
+    def profile_json(self, indent: Optional[int] = 2) -> str:
+        """
+        Stage profile as JSON.
+
+        Args:
+            indent: JSON indentation (None = compact)
+
+        Returns:
+            JSON string of ``profile``
+        """
+        import json
+
+        return json.dumps(self.profile, indent=indent, default=str)
+
     def summary(self, percentiles: List[float] = [5, 25, 50, 75, 95, 99]) -> pd.DataFrame:
         """
         Generate summary statistics.
@@ -51,8 +158,15 @@ class SimulationResults:
         Returns:
             DataFrame with summary stats
         """
-        # Select numeric columns
+        if self.is_streaming:
+            return self._streaming_summary(percentiles)
+
+        # Select numeric columns (weights are not a metric)
         numeric_cols = self._scenarios.select_dtypes(include=[np.number]).columns
+        numeric_cols = numeric_cols.drop(WEIGHT_COLUMN, errors='ignore')
+
+        if self.weights is not None:
+            return self._weighted_summary(numeric_cols, percentiles)
 
         summary_data = {}
 
@@ -84,8 +198,13 @@ class SimulationResults:
         Returns:
             VaR value
         """
-        if variable not in self._scenarios.columns:
-            raise ValueError(f"Variable '{variable}' not found in scenarios")
+        self._check_variable(variable)
+
+        if self.is_streaming:
+            return self._stats[variable].quantile(confidence)
+
+        if self.weights is not None:
+            return weighted_quantile(self._scenarios[variable], self.weights, confidence)
 
         var_value = self._scenarios[variable].quantile(confidence)
         return float(var_value)
@@ -101,10 +220,18 @@ class SimulationResults:
         Returns:
             CVaR value
         """
-        if variable not in self._scenarios.columns:
-            raise ValueError(f"Variable '{variable}' not found in scenarios")
+        self._check_variable(variable)
+
+        if self.is_streaming:
+            return self._stats[variable].tail_mean(confidence)
 
         var_threshold = self.var(confidence, variable)
+
+        if self.weights is not None:
+            values = np.asarray(self._scenarios[variable], dtype=float)
+            tail = values >= var_threshold
+            return weighted_mean(values[tail], self.weights[tail])
+
         tail_values = self._scenarios[self._scenarios[variable] >= var_threshold][variable]
 
         cvar_value = tail_values.mean()
@@ -121,14 +248,123 @@ class SimulationResults:
         Returns:
             Probability (0-1)
         """
-        if variable not in self._scenarios.columns:
-            raise ValueError(f"Variable '{variable}' not found in scenarios")
+        self._check_variable(variable)
+
+        if self.is_streaming:
+            return self._stats[variable].sketch.fraction_above(threshold)
+
+        if self.weights is not None:
+            return weighted_fraction_above(self._scenarios[variable], self.weights, threshold)
 
         exceed = (self._scenarios[variable] > threshold).sum()
         probability = exceed / len(self._scenarios)
 
         return float(probability)
 
+    def control_variate_estimate(
+        self,
+        variable: str = 'total_payout',
+        control: str = 'quota_attainment',
+        control_mean: Optional[float] = None
+    ) -> Dict[str, float]:
+        """
+        Estimate the mean of a variable using a control variate.
+
+        The control is a simulated input with a known mean (by default the
+        mean of the distribution quota_attainment was drawn from, recorded
+        by the simulator in ``metadata['control_means']``; with inverse-CDF
+        tables that is the table's mean, not the fitted scipy mean, which
+        differs by the interpolation error). The sample mean is
+        corrected by beta * (control sample mean - known mean), with beta
+        the regression coefficient of the variable on the control, which
+        removes the part of the sampling error explained by the control.
+
+        Args:
+            variable: Variable whose mean is estimated
+            control: Control variable
+            control_mean: Known mean of the control (default: from metadata)
+
+        Returns:
+            Dict with estimate, std_error, naive_estimate, naive_std_error,
+            beta and variance_reduction (variance ratio naive / controlled)
+        """
+        self._require_scenarios('control_variate_estimate')
+        self._check_variable(variable)
+        self._check_variable(control)
+
+        if control_mean is None:
+            control_mean = self.metadata.get('control_means', {}).get(control)
+            if control_mean is None:
+                raise ValueError(f"No known mean for control variable '{control}'")
+
+        y = np.asarray(self._scenarios[variable], dtype=float)
+        x = np.asarray(self._scenarios[control], dtype=float)
+        n = len(y)
+
+        if self.weights is not None:
+            # w*y and w*x are unbiased for the untilted means
+            y = y * self.weights
+            x = x * self.weights
+
+        x_centered = x - x.mean()
+        x_var = (x_centered ** 2).sum()
+        beta = float((x_centered * (y - y.mean())).sum() / x_var) if x_var > 0 else 0.0
+
+        controlled = y - beta * (x - control_mean)
+        naive_se = float(y.std(ddof=1) / np.sqrt(n))
+        controlled_se = float(controlled.std(ddof=1) / np.sqrt(n))
+
+        return {
+            'estimate': float(controlled.mean()),
+            'std_error': controlled_se,
+            'naive_estimate': float(y.mean()),
+            'naive_std_error': naive_se,
+            'beta': beta,
+            'variance_reduction': (naive_se / controlled_se) ** 2 if controlled_se > 0 else float('inf')
+        }
+
+    def replicate_estimate(self, variable: str = 'total_payout') -> Dict[str, float]:
+        """
+        Estimate the mean of a variable with a replicate standard error.
+
+        Every generation block is an independently randomized design (a
+        fresh random draw, LHS or scrambled Sobol set), so the spread of
+        per-block means gives an honest standard error even when points
+        within a block are not independent, as with LHS and Sobol.
+
+        Args:
+            variable: Variable whose mean is estimated
+
+        Returns:
+            Dict with estimate, std_error and replicates (blocks)
+        """
+        self._require_scenarios('replicate_estimate')
+        self._check_variable(variable)
+
+        block_size = self.metadata.get('execution', {}).get('block_size')
+        if block_size is None:
+            raise ValueError("Run metadata has no block_size to form replicates")
+
+        values = np.asarray(self._scenarios[variable], dtype=float)
+        weights = self.weights if self.weights is not None else np.ones(len(values))
+        _, blocks = np.unique(
+            np.asarray(self._scenarios['scenario_id']) // block_size, return_inverse=True
+        )
+
+        block_means = (
+            np.bincount(blocks, weights=weights * values) / np.bincount(blocks, weights=weights)
+        )
+        n_blocks = len(block_means)
+        std_error = (
+            float(block_means.std(ddof=1) / np.sqrt(n_blocks)) if n_blocks > 1 else float('nan')
+        )
+
+        return {
+            'estimate': weighted_mean(values, weights),
+            'std_error': std_error,
+            'replicates': n_blocks
+        }
+
     def sensitivity_analysis(
         self,
         output_variable: str = 'total_payout',
@@ -146,6 +382,8 @@ class SimulationResults:
         Returns:
             DataFrame with sensitivity metrics
         """
+        self._require_scenarios('sensitivity_analysis')
+
         if output_variable not in self._scenarios.columns:
             raise ValueError(f"Output variable '{output_variable}' not found")
 
@@ -208,7 +446,7 @@ class SimulationResults:
                 logger.warning(f"Could not generate sensitivity analysis: {e}")
 
             # All scenarios (optional)
-            if include_scenarios:
+            if include_scenarios and not self.is_streaming:
                 self._scenarios.to_excel(writer, sheet_name='All_Scenarios', index=False)
 
             logger.info(f"Exported results to {file_path}")
@@ -220,7 +458,7 @@ class SimulationResults:
         output = {
             'summary_stats': self.summary().to_dict(),
             'risk_metrics': self.risk_metrics,
-            'n_scenarios': len(self._scenarios)
+            'n_scenarios': self.n_rows
         }
 
         with open(file_path, 'w') as f:
@@ -239,7 +477,8 @@ class SimulationResults:
         self.summary().to_csv(dir_path / 'summary_statistics.csv')
 
         # Scenarios
-        self._scenarios.to_csv(dir_path / 'scenarios.csv', index=False)
+        if not self.is_streaming:
+            self._scenarios.to_csv(dir_path / 'scenarios.csv', index=False)
 
         logger.info(f"Exported results to {directory}")
 
@@ -259,17 +498,20 @@ class SimulationResults:
         """
         import matplotlib.pyplot as plt
 
-        if variable not in self._scenarios.columns:
-            raise ValueError(f"Variable '{variable}' not found")
+        self._check_variable(variable)
 
         fig, ax = plt.subplots(figsize=(10, 6))
 
         # Histogram
-        ax.hist(self._scenarios[variable], bins=bins, alpha=0.7, edgecolor='black')
+        if self.is_streaming:
+            counts, edges = self._stats[variable].sketch.histogram(bins)
+            ax.hist(edges[:-1], bins=edges, weights=counts, alpha=0.7, edgecolor='black')
+        else:
+            ax.hist(self._scenarios[variable], bins=bins, alpha=0.7, edgecolor='black')
 
         # Percentile lines
         for p in show_percentiles:
-            value = self._scenarios[variable].quantile(p / 100)
+            value = self.var(p / 100, variable)
             ax.axvline(value, color='red', linestyle='--', linewidth=2,
                       label=f'P{p}: {value:,.0f}')
 
@@ -313,6 +555,8 @@ class SimulationResults:
         """Plot cumulative distribution function."""
         import matplotlib.pyplot as plt
 
+        self._require_scenarios('plot_cdf')
+
         if variable not in self._scenarios.columns:
             raise ValueError(f"Variable '{variable}' not found")
 
@@ -335,9 +579,15 @@ class SimulationResults:
 
     def _compute_risk_metrics(self) -> Dict[str, float]:
         """Compute risk metrics."""
+        if self.is_streaming:
+            return self._streaming_risk_metrics()
+
         if 'total_payout' not in self._scenarios.columns:
             return {}
 
+        if self.weights is not None:
+            return self._weighted_risk_metrics()
+
         return {
             'expected_payout': float(self._scenarios['total_payout'].mean()),
             'median_payout': float(self._scenarios['total_payout'].median()),
@@ -352,3 +602,98 @@ class SimulationResults:
                 self._scenarios['total_payout'].std() / self._scenarios['total_payout'].mean()
             )
         }
+
+    def _weighted_summary(self, columns: List[str], percentiles: List[float]) -> pd.DataFrame:
+        """Summary statistics of importance-sampled scenarios."""
+        summary_data = {}
+
+        for col in columns:
+            values = np.asarray(self._scenarios[col], dtype=float)
+            stats = {
+                'mean': weighted_mean(values, self.weights),
+                'median': weighted_quantile(values, self.weights, 0.5),
+                'std': weighted_std(values, self.weights),
+                'min': values.min(),
+                'max': values.max()
+            }
+
+            for p in percentiles:
+                stats[f'p{p}'] = weighted_quantile(values, self.weights, p / 100)
+
+            summary_data[col] = stats
+
+        return pd.DataFrame(summary_data).T
+
+    def _weighted_risk_metrics(self) -> Dict[str, float]:
+        """Risk metrics of importance-sampled scenarios."""
+        payout = np.asarray(self._scenarios['total_payout'], dtype=float)
+        mean = weighted_mean(payout, self.weights)
+        std = weighted_std(payout, self.weights)
+
+        return {
+            'expected_payout': mean,
+            'median_payout': self.var(0.5),
+            'std_dev': std,
+            'var_95': self.var(0.95),
+            'var_99': self.var(0.99),
+            'cvar_95': self.cvar(0.95),
+            'cvar_99': self.cvar(0.99),
+            'min_payout': float(payout.min()),
+            'max_payout': float(payout.max()),
+            'coefficient_of_variation': std / mean,
+            'effective_sample_size': effective_sample_size(self.weights)
+        }
+
+    def _streaming_summary(self, percentiles: List[float]) -> pd.DataFrame:
+        """Summary statistics from streaming accumulators."""
+        summary_data = {}
+
+        for col, col_stats in self._stats.columns.items():
+            stats = {
+                'mean': col_stats.moments.mean,
+                'median': col_stats.quantile(0.5),
+                'std': col_stats.moments.std,
+                'min': col_stats.moments.min,
+                'max': col_stats.moments.max
+            }
+
+            for p in percentiles:
+                stats[f'p{p}'] = col_stats.quantile(p / 100)
+
+            summary_data[col] = stats
+
+        return pd.DataFrame(summary_data).T
+
+    def _streaming_risk_metrics(self) -> Dict[str, float]:
+        """Risk metrics from streaming accumulators."""
+        if 'total_payout' not in self._stats:
+            return {}
+
+        moments = self._stats['total_payout'].moments
+
+        return {
+            'expected_payout': float(moments.mean),
+            'median_payout': self.var(0.5),
+            'std_dev': float(moments.std),
+            'var_95': self.var(0.95),
+            'var_99': self.var(0.99),
+            'cvar_95': self.cvar(0.95),
+            'cvar_99': self.cvar(0.99),
+            'min_payout': float(moments.min),
+            'max_payout': float(moments.max),
+            'coefficient_of_variation': float(moments.std / moments.mean)
+        }
+
+    def _check_variable(self, variable: str):
+        """Raise ValueError if a variable is not available."""
+        available = self._stats.columns if self.is_streaming else self._scenarios.columns
+        if variable not in available:
+            raise ValueError(f"Variable '{variable}' not found in scenarios")
+
+    def _require_scenarios(self, what: str):
+        """Raise SimulationError if full scenarios were not retained."""
+        if self.is_streaming:
+            raise SimulationError(
+                f"{what} needs the full scenarios, which are not retained "
+                f"in streaming mode"
+            )
@@ -1,26 +1,120 @@
 """Sampling strategies for Monte Carlo simulation."""
 
+import warnings
 import numpy as np
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, Optional, Union, Tuple
 from scipy.stats import qmc
+from scipy.special import ndtr, ndtri
 import logging
 
+from .streams import RandomStreams
+
 logger = logging.getLogger(__name__)
 
 
 class SamplingStrategy(ABC):
-    """Abstract base class for sampling strategies."""
+    """
+    Abstract base class for sampling strategies.
+
+    Strategies produce designs: ``n_points`` points in the unit hypercube
+    of a given dimension. Scenario generation asks for one design per
+    block with a dimension for every (rep, variable) pair, so space-filling
+    strategies stratify the whole scenario matrix rather than each scalar.
+    Strategies that cannot build designs above some dimension say so in
+    ``max_dimensions``.
+    """
+
+    # Largest design dimension supported (None = unlimited)
+    max_dimensions: Optional[int] = None
 
     @abstractmethod
-    def sample(self, distribution: Any, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    def uniform_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """
+        Generate a U(0, 1) design.
+
+        Args:
+            n_points: Number of points
+            dimensions: Dimension of each point
+            rng: numpy Generator (an integer seed is also accepted)
+
+        Returns:
+            Array of shape (n_points, dimensions)
+        """
+        pass
+
+    def normal_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """
+        Generate an N(0, 1) design (used by the Gaussian copula).
+
+        Args:
+            n_points: Number of points
+            dimensions: Dimension of each point
+            rng: numpy Generator (an integer seed is also accepted)
+
+        Returns:
+            Array of standard normal scores, shape (n_points, dimensions)
+        """
+        return ndtri(self.uniform_design(n_points, dimensions, rng))
+
+    def uniform(
+        self,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """
+        Generate U(0, 1) draws (a one-dimensional design).
+
+        Args:
+            n_samples: Number of samples to generate
+            rng: numpy Generator (an integer seed is also accepted)
+
+        Returns:
+            Array of uniforms
+        """
+        return self.uniform_design(n_samples, 1, rng).ravel()
+
+    def standard_normal(
+        self,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """
+        Generate N(0, 1) draws (a one-dimensional design).
+
+        Args:
+            n_samples: Number of samples to generate
+            rng: numpy Generator (an integer seed is also accepted)
+
+        Returns:
+            Array of standard normal scores
+        """
+        return self.normal_design(n_samples, 1, rng).ravel()
+
+    @abstractmethod
+    def sample(
+        self,
+        distribution: Any,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
         """
         Generate samples from a distribution.
 
         Args:
             distribution: scipy.stats distribution object
             n_samples: Number of samples to generate
-            seed: Random seed
+            rng: numpy Generator (an integer seed is also accepted)
 
         Returns:
             Array of samples
@@ -31,22 +125,44 @@ class SamplingStrategy(ABC):
 class MonteCarloSampling(SamplingStrategy):
     """Standard Monte Carlo sampling (random sampling)."""
 
-    def sample(self, distribution: Any, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    def uniform_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """Generate pseudo-random uniforms."""
+        return np.random.default_rng(rng).random((n_points, dimensions))
+
+    def normal_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """Generate pseudo-random normals directly (no inverse transform)."""
+        return np.random.default_rng(rng).standard_normal((n_points, dimensions))
+
+    def sample(
+        self,
+        distribution: Any,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
         """
         Generate random samples.
 
         Args:
             distribution: scipy.stats distribution object
             n_samples: Number of samples
-            seed: Random seed
+            rng: numpy Generator (an integer seed is also accepted)
 
         Returns:
             Random samples
         """
-        if seed is not None:
-            np.random.seed(seed)
+        rng = np.random.default_rng(rng)
 
-        samples = distribution.rvs(size=n_samples)
+        samples = distribution.rvs(size=n_samples, random_state=rng)
         logger.debug(f"Generated {n_samples} Monte Carlo samples")
         return samples
 
@@ -54,21 +170,35 @@ class MonteCarloSampling(SamplingStrategy):
 class LatinHypercubeSampling(SamplingStrategy):
     """Latin Hypercube Sampling for better space coverage."""
 
-    def sample(self, distribution: Any, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    def uniform_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """Generate a randomized Latin Hypercube design."""
+        sampler = qmc.LatinHypercube(d=dimensions, seed=np.random.default_rng(rng))
+        return sampler.random(n=n_points)
+
+    def sample(
+        self,
+        distribution: Any,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
         """
         Generate Latin Hypercube samples.
 
         Args:
             distribution: scipy.stats distribution object
             n_samples: Number of samples
-            seed: Random seed
+            rng: numpy Generator (an integer seed is also accepted)
 
         Returns:
             LHS samples
         """
         # Generate LHS uniform samples [0, 1]
-        sampler = qmc.LatinHypercube(d=1, seed=seed)
-        uniform_samples = sampler.random(n=n_samples).flatten()
+        uniform_samples = self.uniform(n_samples, rng)
 
         # Transform to target distribution using inverse CDF
         samples = distribution.ppf(uniform_samples)
@@ -77,24 +207,98 @@ class LatinHypercubeSampling(SamplingStrategy):
         return samples
 
 
+class AntitheticSampling(SamplingStrategy):
+    """
+    Antithetic variates: every uniform u is paired with 1 - u.
+
+    The first half of each design is random and the second half mirrors
+    it, so in a scenario block scenario i and scenario i + n/2 are
+    antithetic pairs. Payouts that rise with the inputs are negatively correlated
+    within a pair, which lowers the variance of the mean.
+    """
+
+    def uniform_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """Generate antithetic pairs of uniform points."""
+        u = np.random.default_rng(rng).random((-(-n_points // 2), dimensions))
+        return np.concatenate([u, 1 - u])[:n_points]
+
+    def sample(
+        self,
+        distribution: Any,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """
+        Generate antithetic samples.
+
+        Args:
+            distribution: scipy.stats distribution object
+            n_samples: Number of samples
+            rng: numpy Generator (an integer seed is also accepted)
+
+        Returns:
+            Antithetic samples
+        """
+        samples = distribution.ppf(self.uniform(n_samples, rng))
+
+        logger.debug(f"Generated {n_samples} antithetic samples")
+        return samples
+
+
 class QuasiRandomSampling(SamplingStrategy):
-    """Quasi-random sampling using Sobol sequences."""
+    """
+    Quasi-random sampling using scrambled Sobol sequences.
+
+    Each design is an independent Owen scrambling, so designs drawn from
+    different streams (e.g. scenario blocks) are independent replicates
+    whose spread gives an error estimate.
+    """
 
-    def sample(self, distribution: Any, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    # scipy's Sobol direction numbers cover this many dimensions
+    max_dimensions = 21201
+
+    def uniform_design(
+        self,
+        n_points: int,
+        dimensions: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
+        """Generate a scrambled Sobol design."""
+        sampler = qmc.Sobol(d=dimensions, scramble=True, seed=np.random.default_rng(rng))
+
+        if n_points > 0 and n_points & (n_points - 1) == 0:
+            return sampler.random_base2(m=n_points.bit_length() - 1)
+
+        # Balance is only guaranteed for powers of two; a partial final
+        # block is still a valid (if less uniform) randomized design
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', UserWarning)
+            return sampler.random(n=n_points)
+
+    def sample(
+        self,
+        distribution: Any,
+        n_samples: int,
+        rng: Optional[Union[np.random.Generator, int]] = None
+    ) -> np.ndarray:
         """
         Generate quasi-random samples using Sobol sequence.
 
         Args:
             distribution: scipy.stats distribution object
             n_samples: Number of samples
-            seed: Random seed
+            rng: numpy Generator (an integer seed is also accepted)
 
         Returns:
             Quasi-random samples
         """
         # Generate Sobol sequence
-        sampler = qmc.Sobol(d=1, scramble=True, seed=seed)
-        uniform_samples = sampler.random(n=n_samples).flatten()
+        uniform_samples = self.uniform(n_samples, rng)
 
         # Transform to target distribution
         samples = distribution.ppf(uniform_samples)
@@ -104,13 +308,33 @@ class QuasiRandomSampling(SamplingStrategy):
 
 
 class MultivariateSampler:
-    """Sample multiple correlated variables."""
+    """
+    Sample multiple correlated variables through a Gaussian copula.
+
+    One design is drawn from the sampling strategy for all variables, the
+    Cholesky factor of the correlation matrix is applied to the whole
+    (n_samples x n_variables) score matrix in one product, and each column
+    is mapped back through the normal CDF and the variable's inverse CDF.
+    Samples can be grouped so that each design point covers several rows
+    (e.g. every rep of a scenario), giving the design one dimension per
+    (row in group, variable). When that exceeds the strategy's
+    ``max_dimensions`` (e.g. Sobol with thousands of reps) every row gets
+    its own point of an n_variables-dimensional design instead.
+
+    Distributions exposing ``ppf_normal`` (``InverseCDFTable``) take the
+    normal scores directly, so tabulated marginals skip every CDF call.
+
+    For importance sampling, ``mean_shift`` moves the mean of selected
+    independent scores (in standard deviations); ``sample_with_weights``
+    then also returns the likelihood ratio of every sample.
+    """
 
     def __init__(
         self,
         distributions: dict,
         correlation_matrix: Optional[np.ndarray] = None,
-        sampling_strategy: SamplingStrategy = None
+        sampling_strategy: SamplingStrategy = None,
+        mean_shift: Optional[dict] = None
     ):
         """
         Initialize multivariate sampler.
@@ -119,73 +343,143 @@ class MultivariateSampler:
             distributions: Dict of {variable_name: distribution}
             correlation_matrix: Correlation matrix (None = independent)
             sampling_strategy: Sampling strategy to use
+            mean_shift: Dict of {variable_name: normal-score shift}
+                        (None = sample the distributions as given)
         """
         self.distributions = distributions
         self.correlation_matrix = correlation_matrix
         self.sampling_strategy = sampling_strategy or MonteCarloSampling()
         self.variable_names = list(distributions.keys())
+        self._cholesky = self._cholesky_factor(correlation_matrix)
+        self._shift = self._shift_vector(mean_shift)
+        self._tabulated = all(hasattr(d, 'ppf_normal') for d in distributions.values())
+
+    @property
+    def is_weighted(self) -> bool:
+        """Whether samples carry likelihood-ratio weights."""
+        return self._shift is not None
 
-    def sample(self, n_samples: int, seed: Optional[int] = None) -> np.ndarray:
+    def sample(
+        self,
+        n_samples: int,
+        streams: Optional[Union[RandomStreams, int]] = None,
+        group_size: int = 1
+    ) -> np.ndarray:
         """
         Generate multivariate samples.
 
         Args:
             n_samples: Number of samples
-            seed: Random seed
+            streams: RandomStreams to draw from (an integer seed is also
+                     accepted); the design uses child stream 0
+            group_size: Consecutive samples covered by one design point
 
         Returns:
             Array of shape (n_samples, n_variables)
         """
-        n_vars = len(self.distributions)
+        return self.sample_with_weights(n_samples, streams, group_size)[0]
 
-        if seed is not None:
-            np.random.seed(seed)
-
-        # Generate independent samples for each variable
-        samples = np.zeros((n_samples, n_vars))
-
-        for i, (var_name, dist) in enumerate(self.distributions.items()):
-            # Use different seed for each variable to maintain independence
-            var_seed = seed + i if seed is not None else None
-            samples[:, i] = self.sampling_strategy.sample(dist, n_samples, var_seed)
-
-        # Apply correlation if specified
-        if self.correlation_matrix is not None:
-            from ..statistics.correlation import CorrelationAnalyzer
-
-            # Convert to standard normal
-            standard_normal = np.zeros_like(samples)
-            for i in range(n_vars):
-                # Convert to uniform [0,1]
-                uniform = self.distributions[self.variable_names[i]].cdf(samples[:, i])
-                # Convert to standard normal
-                from scipy.stats import norm
-                standard_normal[:, i] = norm.ppf(uniform)
-
-            # Apply correlation using Cholesky
-            try:
-                L = np.linalg.cholesky(self.correlation_matrix)
-                correlated_normal = standard_normal @ L.T
-            except np.linalg.LinAlgError:
-                # Fix matrix and retry
-                logger.warning("Correlation matrix not positive definite, adjusting...")
-                fixed_corr = CorrelationAnalyzer.nearest_positive_definite(
-                    self.correlation_matrix
-                )
-                L = np.linalg.cholesky(fixed_corr)
-                correlated_normal = standard_normal @ L.T
-
-            # Convert back to original distributions
-            for i in range(n_vars):
-                # Convert to uniform [0,1]
-                from scipy.stats import norm
-                uniform = norm.cdf(correlated_normal[:, i])
-                # Convert to target distribution
-                samples[:, i] = self.distributions[self.variable_names[i]].ppf(uniform)
-
-            logger.info(f"Applied correlation to {n_vars} variables")
+    def sample_with_weights(
+        self,
+        n_samples: int,
+        streams: Optional[Union[RandomStreams, int]] = None,
+        group_size: int = 1
+    ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Generate multivariate samples and their likelihood-ratio weights.
 
-        return samples
+        Args:
+            n_samples: Number of samples
+            streams: RandomStreams to draw from (an integer seed is also
+                     accepted); the design uses child stream 0
+            group_size: Consecutive samples covered by one design point
+                        (n_samples must be a multiple of it; reduced to 1
+                        when the design would exceed ``max_dimensions``)
+
+        Returns:
+            Tuple of (samples of shape (n_samples, n_variables), weights of
+            shape (n_samples,) or None when no mean shift is applied)
+        """
+        n_vars = len(self.distributions)
+
+        if n_samples % group_size:
+            raise ValueError(
+                f"n_samples ({n_samples}) must be a multiple of group_size ({group_size})"
+            )
+
+        if not isinstance(streams, RandomStreams):
+            streams = RandomStreams(streams)
+
+        max_dimensions = self.sampling_strategy.max_dimensions
+        if max_dimensions is not None and group_size * n_vars > max_dimensions:
+            logger.warning(
+                f"A design over {group_size} grouped rows needs {group_size * n_vars} "
+                f"dimensions (max {max_dimensions}); stratifying rows individually"
+            )
+            group_size = 1
+
+        n_points = n_samples // group_size
+        dimensions = group_size * n_vars
+        rng = streams.generator(0)
+        samples = np.empty((n_samples, n_vars))
+
+        if self._cholesky is None and self._shift is None and not self._tabulated:
+            # Independent variables: map the uniform design straight through
+            uniforms = self.sampling_strategy.uniform_design(n_points, dimensions, rng)
+            uniforms = uniforms.reshape(n_samples, n_vars)
+            for i, dist in enumerate(self.distributions.values()):
+                samples[:, i] = dist.ppf(uniforms[:, i])
+            return samples, None
+
+        # Independent normal scores, one column per variable
+        scores = self.sampling_strategy.normal_design(n_points, dimensions, rng)
+        scores = scores.reshape(n_samples, n_vars)
+
+        weights = None
+        if self._shift is not None:
+            # Draw scores from N(shift, I); weight = N(0, I) / N(shift, I) density
+            scores += self._shift
+            weights = np.exp(-scores @ self._shift + 0.5 * self._shift @ self._shift)
+
+        # Correlate all rows at once, then map back to each marginal
+        if self._cholesky is not None:
+            scores = scores @ self._cholesky.T
+            logger.debug(f"Applied correlation to {n_vars} variables")
+
+        for i, dist in enumerate(self.distributions.values()):
+            if hasattr(dist, 'ppf_normal'):
+                # Inverse-CDF table: interpolate on the scores directly
+                samples[:, i] = dist.ppf_normal(scores[:, i])
+            else:
+                samples[:, i] = dist.ppf(ndtr(scores[:, i]))
+
+        return samples, weights
+
+    def _shift_vector(self, mean_shift: Optional[dict]) -> Optional[np.ndarray]:
+        """Score shift per variable, or None when nothing is shifted."""
+        if not mean_shift or not any(mean_shift.values()):
+            return None
+
+        unknown = set(mean_shift) - set(self.variable_names)
+        if unknown:
+            raise ValueError(f"Cannot shift unknown variables: {sorted(unknown)}")
+
+        return np.array([float(mean_shift.get(var, 0.0)) for var in self.variable_names])
+
+    @staticmethod
+    def _cholesky_factor(correlation_matrix: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Lower Cholesky factor, repairing non-positive-definite input."""
+        if correlation_matrix is None:
+            return None
+
+        from ..statistics.correlation import CorrelationAnalyzer
+
+        matrix = np.asarray(correlation_matrix, dtype=float)
+        try:
+            return np.linalg.cholesky(matrix)
+        except np.linalg.LinAlgError:
+            logger.warning("Correlation matrix not positive definite, adjusting...")
+            return np.linalg.cholesky(CorrelationAnalyzer.nearest_positive_definite(matrix))
 
 
 def get_sampling_strategy(strategy_name: str) -> SamplingStrategy:
@@ -193,7 +487,7 @@ def get_sampling_strategy(strategy_name: str) -> SamplingStrategy:
     Get sampling strategy by name.
 
     Args:
-        strategy_name: 'monte_carlo', 'lhs', or 'quasi_random'
+        strategy_name: 'monte_carlo', 'lhs', 'quasi_random' or 'antithetic'
 
     Returns:
         SamplingStrategy instance
@@ -206,7 +500,8 @@ def get_sampling_strategy(strategy_name: str) -> SamplingStrategy:
         'lhs': LatinHypercubeSampling,
         'latin_hypercube': LatinHypercubeSampling,
         'quasi_random': QuasiRandomSampling,
-        'sobol': QuasiRandomSampling
+        'sobol': QuasiRandomSampling,
+        'antithetic': AntitheticSampling
     }
 
     if strategy_name not in strategies:
@@ -0,0 +1,135 @@
+"""On-disk, memory-mapped scenario output."""
+
+import json
+import pandas as pd
+import numpy as np
+from pathlib import Path
+from typing import Dict, Optional, List, Any, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = 'manifest.json'
+
+
+def column_path(directory: Union[str, Path], column: str) -> Path:
+    """Path of a column's .npy file inside a scenario directory."""
+    return Path(directory) / f"{column}.npy"
+
+
+def write_manifest(
+    directory: Union[str, Path],
+    rows: int,
+    columns: Dict[str, np.dtype],
+    categories: Dict[str, pd.Index],
+    metadata: Optional[Dict[str, Any]] = None
+):
+    """
+    Write the manifest describing a scenario directory.
+
+    Args:
+        directory: Scenario directory
+        rows: Number of valid rows in every column file
+        columns: Dict of {column: storage dtype}, in frame order
+        categories: Dict of {column: categories} for code-stored columns
+        metadata: Run metadata to keep with the scenarios
+    """
+    manifest = {
+        'rows': int(rows),
+        'columns': {col: np.dtype(dtype).str for col, dtype in columns.items()},
+        'categories': {col: pd.Index(values).tolist() for col, values in categories.items()},
+        'metadata': metadata or {}
+    }
+    with open(Path(directory) / MANIFEST_NAME, 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+
+class ScenarioFile:
+    """
+    Read-only view of scenarios written to disk by a simulation run.
+
+    Every column is a ``.npy`` file opened with ``np.memmap``, so nothing
+    is read until a column is touched and then only the pages used.
+    Result sets far larger than RAM can be queried column by column.
+
+    Example:
+        >>> scenarios = ScenarioFile('runs/q3')
+        >>> payouts = scenarios.column('total_payout')
+        >>> payouts[scenarios.column('rep_id') == 7].mean()
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        """
+        Open a scenario directory.
+
+        Args:
+            directory: Directory written by ``run(output_path=...)``
+
+        Raises:
+            FileNotFoundError: If the directory has no manifest
+        """
+        self.directory = Path(directory)
+        manifest_path = self.directory / MANIFEST_NAME
+
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"No scenario manifest found in {self.directory}")
+
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+
+        self.rows: int = manifest['rows']
+        self.dtypes = {col: np.dtype(dtype) for col, dtype in manifest['columns'].items()}
+        self.categories = {
+            col: pd.Index(values) for col, values in manifest['categories'].items()
+        }
+        self.metadata: Dict[str, Any] = manifest['metadata']
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in frame order."""
+        return list(self.dtypes.keys())
+
+    def __len__(self) -> int:
+        """Number of scenario-rep rows."""
+        return self.rows
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Memory-mapped values of one column.
+
+        Categorical columns are returned as their integer codes; decode
+        them with ``categories[name]``.
+
+        Args:
+            name: Column name
+
+        Returns:
+            Read-only memory-mapped array
+        """
+        if name not in self.dtypes:
+            raise KeyError(f"Column '{name}' not found. Available: {self.columns}")
+        return np.load(column_path(self.directory, name), mmap_mode='r')[:self.rows]
+
+    def to_frame(self, columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Wrap memory-mapped columns in a DataFrame without loading them.
+
+        Args:
+            columns: Columns to include (None = all)
+
+        Returns:
+            DataFrame backed by the column files
+        """
+        frame = {}
+        for col in columns or self.columns:
+            values = self.column(col)
+            if col in self.categories:
+                frame[col] = pd.Categorical.from_codes(values, categories=self.categories[col])
+            else:
+                frame[col] = values
+
+        return pd.DataFrame(frame, copy=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return f"ScenarioFile('{self.directory}', rows={self.rows})"
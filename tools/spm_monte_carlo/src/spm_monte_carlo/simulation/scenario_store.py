@@ -0,0 +1,154 @@
+"""Compact columnar storage for simulation scenarios."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Optional, List, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+PRECISIONS = {
+    'float64': np.float64,
+    'float32': np.float32
+}
+
+ID_DTYPE = np.int32
+
+# Likelihood-ratio weight of each row under importance sampling
+WEIGHT_COLUMN = 'weight'
+
+
+def resolve_precision(precision: Union[str, np.dtype, type]) -> np.dtype:
+    """
+    Resolve a precision name to a float dtype.
+
+    Args:
+        precision: 'float64', 'float32' or a numpy float dtype
+
+    Returns:
+        numpy dtype
+
+    Raises:
+        ValueError: If the precision is not supported
+    """
+    try:
+        dtype = np.dtype(PRECISIONS.get(precision, precision))
+    except TypeError:
+        dtype = None
+
+    if dtype not in [np.dtype(t) for t in PRECISIONS.values()]:
+        raise ValueError(
+            f"Unknown precision: {precision}. Choose from: {list(PRECISIONS.keys())}"
+        )
+    return dtype
+
+
+class ScenarioStore:
+    """
+    Scenario rows held as contiguous, typed column arrays.
+
+    Scenario ids and reps are stored as int32 codes, with rep identifiers
+    kept once in a lookup table instead of being repeated on every row.
+    Metric columns are float64 by default, or float32 for half the memory.
+    ``to_frame`` wraps the arrays without copying them and exposes reps as
+    a categorical column over the lookup table.
+    """
+
+    def __init__(
+        self,
+        scenario_ids: np.ndarray,
+        rep_codes: np.ndarray,
+        rep_ids: np.ndarray,
+        metrics: Optional[Dict[str, np.ndarray]] = None,
+        precision: Union[str, np.dtype] = 'float64'
+    ):
+        """
+        Initialize store.
+
+        Args:
+            scenario_ids: Scenario id of every row
+            rep_codes: Index into rep_ids of every row
+            rep_ids: Rep identifier lookup table
+            metrics: Dict of {column: values} aligned with the rows
+            precision: Float precision of metric columns
+        """
+        self.dtype = resolve_precision(precision)
+        self.rep_ids = np.asarray(rep_ids)
+        self.scenario_ids = np.asarray(scenario_ids, dtype=ID_DTYPE)
+        self.rep_codes = np.asarray(rep_codes, dtype=ID_DTYPE)
+        self.metrics: Dict[str, np.ndarray] = {}
+
+        if len(self.scenario_ids) != len(self.rep_codes):
+            raise ValueError("scenario_ids and rep_codes must have the same length")
+
+        for name, values in (metrics or {}).items():
+            self.add(name, values)
+
+    def __len__(self) -> int:
+        """Number of scenario-rep rows."""
+        return len(self.scenario_ids)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Column values (a view, not a copy)."""
+        if column == 'scenario_id':
+            return self.scenario_ids
+        if column == 'rep_code':
+            return self.rep_codes
+        return self.metrics[column]
+
+    def __contains__(self, column: str) -> bool:
+        """Whether a column is stored."""
+        return column in ('scenario_id', 'rep_code') or column in self.metrics
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names in frame order."""
+        return ['scenario_id', 'rep_id'] + list(self.metrics.keys())
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column arrays and the rep lookup."""
+        return (
+            self.scenario_ids.nbytes + self.rep_codes.nbytes + self.rep_ids.nbytes +
+            sum(values.nbytes for values in self.metrics.values())
+        )
+
+    def add(self, name: str, values: np.ndarray):
+        """
+        Add a metric column, cast to the store precision.
+
+        Args:
+            name: Column name
+            values: Values aligned with the rows
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        if len(values) != len(self):
+            raise ValueError(
+                f"Column '{name}' has {len(values)} rows, expected {len(self)}"
+            )
+        self.metrics[name] = values
+
+    def rep_column(self) -> pd.Categorical:
+        """Rep identifiers as a categorical over the lookup table."""
+        return pd.Categorical.from_codes(self.rep_codes, categories=self.rep_ids)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Wrap the columns in a DataFrame without copying them.
+
+        Returns:
+            DataFrame with scenario_id, rep_id (categorical) and metrics
+        """
+        columns = {
+            'scenario_id': self.scenario_ids,
+            'rep_id': self.rep_column()
+        }
+        columns.update(self.metrics)
+        return pd.DataFrame(columns, copy=False)
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"ScenarioStore(rows={len(self)}, reps={len(self.rep_ids)}, "
+            f"precision={self.dtype.name})"
+        )
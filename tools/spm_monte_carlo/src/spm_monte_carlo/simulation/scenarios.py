@@ -0,0 +1,419 @@
+"""Vectorized scenario generation."""
+
+import pandas as pd
+import numpy as np
+from typing import Optional, Dict, Any, List, Union
+import logging
+
+from .sampling import SamplingStrategy, MonteCarloSampling, MultivariateSampler
+from .streams import RandomStreams
+from .scenario_store import ScenarioStore, resolve_precision, ID_DTYPE, WEIGHT_COLUMN
+from .cache import ScenarioCache, fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOCK_SIZE = 1024
+
+
+class ScenarioGenerator:
+    """
+    Generate simulation scenarios as whole arrays.
+
+    All fitted variables are drawn together for every scenario and rep of
+    a block in one ``MultivariateSampler`` call, which applies the Gaussian
+    copula for the correlation matrix (if any) to the whole sample matrix.
+    The scenario frame is assembled directly from the resulting
+    (n_scenarios x n_reps) arrays into a compact ``ScenarioStore``.
+
+    Scenarios are produced in fixed-size blocks. Each block is one design
+    from the sampling strategy, with a dimension for every (rep, variable)
+    pair, drawn from the stream keyed by the block index. A given scenario
+    therefore gets the same values whether the run is generated in one
+    piece or sharded by block across processes, and blocks are independent
+    randomized replicates (so LHS and Sobol runs have an error estimate).
+
+    With ``importance_shift`` set, quota attainment is drawn from a
+    distribution tilted toward high attainment (its normal score is shifted
+    by that many standard deviations) and every row gets a ``weight``
+    column holding its likelihood ratio, so weighted estimators recover the
+    untilted distribution with many more draws in the payout tail.
+    """
+
+    SAMPLED_VARIABLES = ['quota_attainment', 'deal_count', 'avg_deal_size']
+
+    def __init__(
+        self,
+        rep_ids: np.ndarray,
+        quotas: np.ndarray,
+        distributions: Dict[str, Any],
+        sampling_strategy: Optional[SamplingStrategy] = None,
+        seed: Optional[Union[int, RandomStreams]] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        correlation_matrix: Optional[pd.DataFrame] = None,
+        precision: str = 'float64',
+        importance_shift: float = 0.0,
+        cache: Optional[ScenarioCache] = None
+    ):
+        """
+        Initialize generator.
+
+        Args:
+            rep_ids: Rep identifiers (one per rep)
+            quotas: Quota per rep, aligned with rep_ids
+            distributions: Dict of {variable: FitResult}
+            sampling_strategy: Sampling strategy to use
+            seed: Random seed or RandomStreams for reproducibility
+            block_size: Scenarios per generation block
+            correlation_matrix: Correlation between sampled variables
+                                (None = independent)
+            precision: Float precision of scenario columns
+                       ('float64' or 'float32')
+            importance_shift: Shift of the quota attainment normal score,
+                              in standard deviations (0 = no tilt)
+            cache: Cache of drawn blocks, keyed by ``fingerprint``
+        """
+        if block_size < 1:
+            raise ValueError(f"block_size must be positive, got {block_size}")
+
+        self.rep_ids = np.asarray(rep_ids)
+        self.quotas = np.asarray(quotas, dtype=float)
+        self.distributions = distributions
+        self.sampling_strategy = sampling_strategy or MonteCarloSampling()
+        self.streams = seed if isinstance(seed, RandomStreams) else RandomStreams(seed)
+        self.block_size = block_size
+        self.precision = resolve_precision(precision)
+        self.correlation_matrix = self._align_correlation(correlation_matrix)
+        self.importance_shift = importance_shift
+        self.cache = cache
+        self._fingerprint: Optional[str] = None
+
+        if importance_shift and 'quota_attainment' not in self.variables:
+            raise ValueError("importance_shift needs a fitted quota_attainment distribution")
+
+        self.sampler = MultivariateSampler(
+            {var: self.distributions[var].sampling_distribution for var in self.variables},
+            correlation_matrix=self.correlation_matrix,
+            sampling_strategy=self.sampling_strategy,
+            mean_shift={'quota_attainment': importance_shift} if importance_shift else None
+        )
+
+    @classmethod
+    def from_history(
+        cls,
+        historical_data: pd.DataFrame,
+        distributions: Dict[str, Any],
+        sampling_strategy: Optional[SamplingStrategy] = None,
+        seed: Optional[Union[int, RandomStreams]] = None,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        correlation_matrix: Optional[pd.DataFrame] = None,
+        precision: str = 'float64',
+        importance_shift: float = 0.0,
+        cache: Optional[ScenarioCache] = None
+    ) -> 'ScenarioGenerator':
+        """
+        Build generator from historical performance data.
+
+        Each rep is simulated against its average historical quota.
+
+        Args:
+            historical_data: DataFrame with rep_id and quota columns
+            distributions: Dict of {variable: FitResult}
+            sampling_strategy: Sampling strategy to use
+            seed: Random seed or RandomStreams
+            block_size: Scenarios per generation block
+            correlation_matrix: Correlation between sampled variables
+            precision: Float precision of scenario columns
+            importance_shift: Quota attainment tilt for importance sampling
+            cache: Cache of drawn blocks
+
+        Returns:
+            ScenarioGenerator instance
+        """
+        reps = historical_data['rep_id'].unique()
+        avg_quota = historical_data.groupby('rep_id')['quota'].mean()
+        quotas = avg_quota.reindex(reps).fillna(avg_quota.mean()).values
+
+        return cls(
+            reps, quotas, distributions, sampling_strategy, seed, block_size,
+            correlation_matrix, precision, importance_shift, cache
+        )
+
+    @property
+    def n_reps(self) -> int:
+        """Number of reps per scenario."""
+        return len(self.rep_ids)
+
+    @property
+    def variables(self) -> List[str]:
+        """Sampled variables, in generation order."""
+        return [var for var in self.SAMPLED_VARIABLES if var in self.distributions]
+
+    def n_blocks(self, n_scenarios: int) -> int:
+        """Number of blocks needed for n_scenarios."""
+        return -(-n_scenarios // self.block_size)
+
+    def block_bounds(self, block_index: int, n_scenarios: int) -> range:
+        """
+        Scenario ids covered by a block.
+
+        Args:
+            block_index: Block index
+            n_scenarios: Total scenarios in the run
+
+        Returns:
+            Range of scenario ids
+        """
+        start = block_index * self.block_size
+        return range(start, min(start + self.block_size, n_scenarios))
+
+    def draw(
+        self,
+        block_index: int,
+        n_scenarios: int,
+        n_periods: Optional[int] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Draw every sampled variable for all scenarios and reps in a block.
+
+        Args:
+            block_index: Block index (selects the random streams)
+            n_scenarios: Number of scenarios in the block
+            n_periods: Periods per scenario (None = one draw per rep)
+
+        Returns:
+            Dict of {variable: array of shape (n_scenarios, n_reps)}, or
+            (n_scenarios, n_reps, n_periods) with n_periods, plus the
+            likelihood-ratio weights under ``weight`` when tilted
+        """
+        shape = (n_scenarios, self.n_reps) + ((n_periods,) if n_periods else ())
+        group_size = int(np.prod(shape[1:]))
+
+        if self.cache is not None:
+            key = f"{self.fingerprint}-{block_index}-{'x'.join(map(str, shape))}"
+            draws = self.cache.get(key)
+            if draws is None:
+                draws = self._draw(block_index, shape, group_size)
+                self.cache.put(key, draws)
+            return draws
+
+        return self._draw(block_index, shape, group_size)
+
+    def _draw(self, block_index: int, shape: tuple, group_size: int) -> Dict[str, np.ndarray]:
+        """Sample a block's draws in the given shape."""
+        n_scenarios = shape[0]
+
+        samples, weights = self.sampler.sample_with_weights(
+            n_scenarios * group_size, self.streams.child(block_index),
+            group_size=group_size
+        )
+        draws = {
+            var: samples[:, i].reshape(shape)
+            for i, var in enumerate(self.variables)
+        }
+        if weights is not None:
+            draws[WEIGHT_COLUMN] = weights.reshape(shape)
+        return draws
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        Digest of everything that determines the drawn values.
+
+        Covers the reps and quotas, the sampling distributions and their
+        parameters (including inverse-CDF tables), the correlation matrix,
+        the sampling strategy, the seed, the block size and the
+        importance-sampling shift. Blocks drawn by generators with equal
+        fingerprints are identical.
+        """
+        if self._fingerprint is None:
+            parts = [
+                self.rep_ids.astype(str), self.quotas, self.block_size,
+                self.importance_shift, type(self.sampling_strategy).__name__,
+                sorted(vars(self.sampling_strategy).items()),
+                self.streams.entropy, tuple(self.streams.seed_sequence.spawn_key),
+                self.correlation_matrix if self.correlation_matrix is not None else 'independent'
+            ]
+            for var in self.variables:
+                fit = self.distributions[var]
+                dist = fit.distribution
+                parts += [var, fit.distribution_name, dist.dist.name, dist.args, sorted(dist.kwds.items())]
+                if fit.inverse_cdf is not None:
+                    parts += [fit.inverse_cdf.n_knots, fit.inverse_cdf.z_max]
+            self._fingerprint = fingerprint(*parts)
+        return self._fingerprint
+
+    def _align_correlation(self, correlation_matrix) -> Optional[np.ndarray]:
+        """
+        Restrict a correlation matrix to the sampled variables.
+
+        Variables missing from a labelled matrix are treated as independent.
+        Returns None when there is nothing to correlate.
+
+        Args:
+            correlation_matrix: DataFrame labelled by variable, or array
+                                ordered like ``variables``
+
+        Returns:
+            Correlation array ordered like ``variables``, or None
+        """
+        if correlation_matrix is None or len(self.variables) < 2:
+            return None
+
+        if isinstance(correlation_matrix, pd.DataFrame):
+            matrix = correlation_matrix.reindex(
+                index=self.variables, columns=self.variables
+            ).to_numpy(dtype=float)
+            matrix = np.where(np.isnan(matrix), 0.0, matrix)
+            np.fill_diagonal(matrix, 1.0)
+        else:
+            matrix = np.asarray(correlation_matrix, dtype=float)
+            n_vars = len(self.variables)
+            if matrix.shape != (n_vars, n_vars):
+                raise ValueError(
+                    f"Correlation matrix shape {matrix.shape} does not match "
+                    f"{n_vars} sampled variables"
+                )
+
+        if np.allclose(matrix, np.eye(len(matrix))):
+            return None
+
+        return matrix
+
+    def generate(
+        self,
+        n_scenarios: int,
+        blocks: Optional[range] = None
+    ) -> pd.DataFrame:
+        """
+        Generate simulation scenarios.
+
+        Args:
+            n_scenarios: Total number of scenarios in the run
+            blocks: Block indices to generate (None = all)
+
+        Returns:
+            DataFrame with one row per scenario-rep combination
+        """
+        return self.generate_store(n_scenarios, blocks).to_frame()
+
+    def generate_store(
+        self,
+        n_scenarios: int,
+        blocks: Optional[range] = None
+    ) -> ScenarioStore:
+        """
+        Generate simulation scenarios into a compact columnar store.
+
+        Args:
+            n_scenarios: Total number of scenarios in the run
+            blocks: Block indices to generate (None = all)
+
+        Returns:
+            ScenarioStore with one row per scenario-rep combination
+        """
+        if blocks is None:
+            blocks = range(self.n_blocks(n_scenarios))
+
+        if len(blocks) == 0:
+            raise ValueError("No scenario blocks to generate")
+
+        bounds = [self.block_bounds(b, n_scenarios) for b in blocks]
+        scenario_ids = np.concatenate(
+            [np.arange(r.start, r.stop, dtype=ID_DTYPE) for r in bounds]
+        )
+
+        logger.info(f"Generating {len(scenario_ids)} scenarios...")
+
+        n = len(scenario_ids)
+        store = ScenarioStore(
+            np.repeat(scenario_ids, self.n_reps),
+            np.tile(np.arange(self.n_reps, dtype=ID_DTYPE), n),
+            self.rep_ids,
+            precision=self.precision
+        )
+        quota = np.tile(self.quotas, n)
+        store.add('quota', quota)
+
+        block_draws = [self.draw(b, len(r)) for b, r in zip(blocks, bounds)]
+        draws = {
+            var: np.concatenate([d[var] for d in block_draws]).ravel()
+            for var in block_draws[0]
+        }
+
+        if 'quota_attainment' in draws:
+            qa = draws['quota_attainment']
+            store.add('quota_attainment', qa)
+            store.add('actual_sales', quota * qa)
+        else:
+            store.add('quota_attainment', np.ones(len(quota)))
+            store.add('actual_sales', quota)
+
+        for var in ['deal_count', 'avg_deal_size', WEIGHT_COLUMN]:
+            if var in draws:
+                store.add(var, draws[var])
+
+        logger.info(f"Generated {len(store)} scenario-rep combinations")
+
+        return store
+
+    def generate_periods(
+        self,
+        n_scenarios: int,
+        n_periods: int,
+        blocks: Optional[range] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate multi-period scenarios as (scenario x rep x period) tensors.
+
+        Every period of every rep is a separate draw from the fitted
+        (per-period) distributions, taken in one sampler call per block.
+        Each period is evaluated against the rep's average historical quota.
+
+        Args:
+            n_scenarios: Total number of scenarios in the run
+            n_periods: Periods per scenario (e.g. 12 for a monthly year)
+            blocks: Block indices to generate (None = all)
+
+        Returns:
+            Dict with scenario_id (n,) and quota, quota_attainment,
+            actual_sales, deal_count and avg_deal_size tensors of shape
+            (n, n_reps, n_periods) (quota is broadcast, not copied)
+        """
+        if n_periods < 1:
+            raise ValueError(f"n_periods must be positive, got {n_periods}")
+        if self.importance_shift:
+            raise ValueError("Multi-period scenarios do not support importance_shift")
+
+        if blocks is None:
+            blocks = range(self.n_blocks(n_scenarios))
+
+        if len(blocks) == 0:
+            raise ValueError("No scenario blocks to generate")
+
+        bounds = [self.block_bounds(b, n_scenarios) for b in blocks]
+        scenario_ids = np.concatenate(
+            [np.arange(r.start, r.stop, dtype=ID_DTYPE) for r in bounds]
+        )
+        shape = (len(scenario_ids), self.n_reps, n_periods)
+
+        logger.info(f"Generating {len(scenario_ids)} scenarios x {n_periods} periods...")
+
+        block_draws = [self.draw(b, len(r), n_periods) for b, r in zip(blocks, bounds)]
+        draws = {
+            var: np.concatenate([d[var] for d in block_draws]).astype(self.precision, copy=False)
+            for var in block_draws[0]
+        }
+
+        quota = np.broadcast_to(
+            self.quotas.astype(self.precision)[None, :, None], shape
+        )
+        tensors = {'scenario_id': scenario_ids, 'quota': quota}
+
+        if 'quota_attainment' in draws:
+            tensors['quota_attainment'] = draws.pop('quota_attainment')
+        else:
+            tensors['quota_attainment'] = np.ones(shape, dtype=self.precision)
+        tensors['actual_sales'] = quota * tensors['quota_attainment']
+        tensors.update(draws)
+
+        return tensors
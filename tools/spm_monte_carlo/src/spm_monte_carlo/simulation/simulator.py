@@ -2,9 +2,10 @@
 
 import pandas as pd
 import numpy as np
-from typing import Optional, Dict, Any, List, Union
+from typing import Optional, Dict, Any, List, Union, Tuple, Callable
 from pathlib import Path
 import logging
+import time
 
 from ..data.loader import ExcelDataLoader
 from ..data.validator import DataValidator
@@ -12,17 +13,45 @@ from ..statistics.distribution_fitter import DistributionFitter
 from ..statistics.correlation import CorrelationAnalyzer
 from ..compensation.plan import CompensationPlan
 from ..compensation.engine import CompensationEngine
+from ..compensation.periodic import PeriodicEngine
+from ..compensation.sweep import TierSweep
 from .sampling import get_sampling_strategy, MultivariateSampler
 from .results import SimulationResults
-from ..exceptions import SimulationError, ConfigurationError
+from .periodic import PeriodicResults, PAYOUT_COMPONENTS
+from .comparison import PlanComparison
+from .sweep import PlanSweep, SweepResults
+from .optimizer import PlanOptimizer, OptimizationResult
+from .scenarios import ScenarioGenerator, DEFAULT_BLOCK_SIZE
+from .scenario_store import resolve_precision
+from .executor import SimulationExecutor, PARALLEL_MIN_ROWS
+from .accumulators import ScenarioAccumulator, StreamingAccumulator, MemmapAccumulator
+from .convergence import ConvergenceMonitor
+from .cache import ScenarioCache, DEFAULT_MEMORY_MB
+from .checkpoint import RunCheckpoint
+from .profiling import PipelineProfiler, print_progress
+from ..exceptions import SimulationError, ConfigurationError, ConvergenceError
 
 logger = logging.getLogger(__name__)
 
+# Rough working-set bytes per scenario-rep row while a batch is evaluated
+# (sampled inputs, payout columns and the engine's intermediate copies)
+BATCH_BYTES_PER_ROW = 512
+
+# Rows per batch when neither batch_size nor a memory limit is given
+DEFAULT_BATCH_ROWS = 2_000_000
+
 
 class MonteCarloSimulator:
     """
     Main Monte Carlo simulation orchestrator.
 
+    With parallel=True, batches of at least parallel_min_rows scenario-rep
+    rows are evaluated on a process pool. Where worker processes are
+    spawned rather than forked (Windows, and macOS by default), each
+    worker re-imports the calling script, so a script that runs
+    simulations must do so under ``if __name__ == '__main__':`` or pass
+    parallel=False.
+
     Example:
         >>> sim = MonteCarloSimulator(seed=42, parallel=True)
         >>> results = sim.load_data('data.xlsx') \\
@@ -36,7 +65,10 @@ class MonteCarloSimulator:
         seed: Optional[int] = None,
         parallel: bool = True,
         workers: Optional[int] = None,
-        sampling_strategy: str = 'monte_carlo'
+        sampling_strategy: str = 'monte_carlo',
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        precision: str = 'float64',
+        parallel_min_rows: int = PARALLEL_MIN_ROWS
     ):
         """
         Initialize simulator.
@@ -45,12 +77,21 @@ class MonteCarloSimulator:
             seed: Random seed for reproducibility (default: None)
             parallel: Enable parallel processing (default: True)
             workers: Number of parallel workers (default: CPU count)
-            sampling_strategy: 'monte_carlo', 'lhs', or 'quasi_random'
+            sampling_strategy: 'monte_carlo', 'lhs', 'quasi_random' or 'antithetic'
+            block_size: Scenarios per generation block; the unit of work
+                        handed to parallel workers (default: 1024)
+            precision: Float precision of scenario and result columns;
+                       'float32' halves their memory (default: 'float64')
+            parallel_min_rows: Smallest batch, in scenario-rep rows, run on
+                               the process pool (default: 1,000,000)
         """
         self.seed = seed
         self.parallel = parallel
         self.workers = workers
+        self.parallel_min_rows = parallel_min_rows
         self.sampling_strategy_name = sampling_strategy
+        self.block_size = block_size
+        self.precision = resolve_precision(precision)
 
         # Data containers
         self._historical_data: Optional[pd.DataFrame] = None
@@ -58,9 +99,45 @@ class MonteCarloSimulator:
         self._rep_master: Optional[pd.DataFrame] = None
         self._fitted_distributions: Dict[str, Any] = {}
         self._correlation_matrix: Optional[pd.DataFrame] = None
+        self._cache: Optional[ScenarioCache] = None
+
+        # Setup stages (load, validate, fit, correlate); runs add their own
+        self.profiler = PipelineProfiler()
 
         logger.info(f"Initialized MonteCarloSimulator (seed={seed}, strategy={sampling_strategy})")
 
+    def enable_cache(
+        self,
+        cache: Optional[ScenarioCache] = None,
+        max_memory_mb: float = DEFAULT_MEMORY_MB,
+        directory: Optional[Union[str, Path]] = None,
+        max_disk_mb: Optional[float] = None
+    ) -> 'MonteCarloSimulator':
+        """
+        Reuse generated scenarios across runs.
+
+        Scenario blocks are cached under a fingerprint of the reps and
+        quotas, fitted distributions, correlation matrix, sampling
+        strategy, seed and block size, so re-running after a plan-only
+        change skips generation and goes straight to the compensation
+        engine. Needs a fixed seed to produce hits.
+
+        Args:
+            cache: Existing cache to share (default: create one)
+            max_memory_mb: Memory budget of a new cache (default: 512)
+            directory: Disk tier directory of a new cache (default: None)
+            max_disk_mb: Disk budget of a new cache (default: None = unbounded)
+
+        Returns:
+            Self for method chaining
+        """
+        self._cache = cache or ScenarioCache(max_memory_mb, directory, max_disk_mb)
+
+        if self.seed is None:
+            logger.warning("Scenario cache enabled without a seed; runs will not share draws")
+
+        return self
+
     def load_data(
         self,
         file_path: Union[str, Path, pd.DataFrame],
@@ -84,22 +161,25 @@ class MonteCarloSimulator:
         """
         logger.info("Loading historical performance data...")
 
-        if isinstance(file_path, pd.DataFrame):
-            self._historical_data = file_path
-        else:
-            self._historical_data = ExcelDataLoader.load_historical_performance(
-                file_path, sheet_name
-            )
+        with self.profiler.stage('load') as record:
+            if isinstance(file_path, pd.DataFrame):
+                self._historical_data = file_path
+            else:
+                self._historical_data = ExcelDataLoader.load_historical_performance(
+                    file_path, sheet_name
+                )
+            record['rows'] += len(self._historical_data)
 
         logger.info(f"Loaded {len(self._historical_data)} performance records")
 
         # Validate data
         if validate:
-            report = DataValidator.validate_dataframe(
-                self._historical_data,
-                'historical_performance',
-                strict=False
-            )
+            with self.profiler.stage('validate', rows=len(self._historical_data)):
+                report = DataValidator.validate_dataframe(
+                    self._historical_data,
+                    'historical_performance',
+                    strict=False
+                )
 
             if not report.is_valid:
                 logger.error("Data validation failed")
@@ -128,10 +208,11 @@ class MonteCarloSimulator:
         """
         logger.info("Loading compensation plan...")
 
-        if isinstance(file_path, CompensationPlan):
-            self._plan = file_path
-        else:
-            self._plan = CompensationPlan.from_excel(file_path, plan_id)
+        with self.profiler.stage('load'):
+            if isinstance(file_path, CompensationPlan):
+                self._plan = file_path
+            else:
+                self._plan = CompensationPlan.from_excel(file_path, plan_id)
 
         logger.info(f"Loaded plan '{self._plan.plan_id}'")
 
@@ -168,7 +249,8 @@ class MonteCarloSimulator:
         auto: bool = True,
         distributions: Optional[Dict[str, str]] = None,
         test_goodness_of_fit: bool = True,
-        variables: Optional[List[str]] = None
+        variables: Optional[List[str]] = None,
+        inverse_cdf_tables: bool = True
     ) -> 'MonteCarloSimulator':
         """
         Fit probability distributions to data.
@@ -179,6 +261,9 @@ class MonteCarloSimulator:
                           {'variable': 'dist_type', ...}
             test_goodness_of_fit: Run statistical tests (default: True)
             variables: Variables to fit (None = quota_attainment)
+            inverse_cdf_tables: Sample through interpolated inverse-CDF
+                                tables instead of scipy's ppf (default: True;
+                                see FitResult.inverse_cdf for the error bound)
 
         Returns:
             Self for method chaining
@@ -205,22 +290,22 @@ class MonteCarloSimulator:
 
             # Get manual distribution if specified
             manual_dist = distributions.get(var) if distributions else None
+            values = self._historical_data[var].dropna().values
+
+            with self.profiler.stage('fit', rows=len(values)):
+                if manual_dist:
+                    result = fitter.fit(
+                        values,
+                        distribution_type=manual_dist,
+                        test_fit=test_goodness_of_fit
+                    )
+                elif auto:
+                    result = fitter.auto_fit(values)
+                else:
+                    result = fitter.fit(values, distribution_type='normal')
 
-            if manual_dist:
-                result = fitter.fit(
-                    self._historical_data[var].dropna().values,
-                    distribution_type=manual_dist,
-                    test_fit=test_goodness_of_fit
-                )
-            elif auto:
-                result = fitter.auto_fit(
-                    self._historical_data[var].dropna().values
-                )
-            else:
-                result = fitter.fit(
-                    self._historical_data[var].dropna().values,
-                    distribution_type='normal'
-                )
+                if inverse_cdf_tables:
+                    result.build_inverse_cdf()
 
             self._fitted_distributions[var] = result
             logger.info(
@@ -256,11 +341,12 @@ class MonteCarloSimulator:
 
             variables = list(self._fitted_distributions.keys())
             if len(variables) > 1:
-                self._correlation_matrix = CorrelationAnalyzer.estimate_correlation_matrix(
-                    self._historical_data,
-                    variables=variables,
-                    min_correlation=min_correlation
-                )
+                with self.profiler.stage('correlate', rows=len(self._historical_data)):
+                    self._correlation_matrix = CorrelationAnalyzer.estimate_correlation_matrix(
+                        self._historical_data,
+                        variables=variables,
+                        min_correlation=min_correlation
+                    )
                 logger.info(f"Detected correlations for {len(variables)} variables")
             else:
                 logger.info("Only one variable, skipping correlation")
@@ -271,28 +357,102 @@ class MonteCarloSimulator:
         self,
         iterations: int = 10000,
         batch_size: Optional[int] = None,
-        progress_bar: bool = False
+        progress_bar: bool = False,
+        memory_limit_mb: Optional[float] = None,
+        streaming: bool = False,
+        target_precision: Optional[float] = None,
+        max_iterations: Optional[int] = None,
+        output_path: Optional[Union[str, Path]] = None,
+        importance_shift: Optional[float] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_every: int = 1,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
     ) -> SimulationResults:
         """
         Execute Monte Carlo simulation.
 
+        Scenarios are generated and evaluated in batches that are folded
+        into the results as they complete, so only one batch of working
+        data is alive at a time. With streaming=True batches only update
+        running statistics and quantile sketches, and memory stays flat
+        in the number of iterations.
+
+        With memory_limit_mb set, a run whose scenario rows would not fit
+        in the limit raises ConfigurationError before allocating them;
+        use streaming=True or output_path for such runs.
+
+        With target_precision set, the run keeps drawing batches until the
+        confidence intervals on expected payout, VaR95 and VaR99 are all
+        within that relative half-width, and reports the iterations used
+        and precision achieved in ``results.metadata['convergence']``.
+
+        With output_path set, scenario columns are written to memory-mapped
+        ``.npy`` files in that directory as batches complete, and the
+        returned results read them lazily from disk (reopen later with
+        ``SimulationResults.open(output_path)``).
+
+        With importance_shift set, quota attainment is drawn tilted toward
+        high attainment and each row carries a likelihood-ratio ``weight``;
+        VaR, CVaR, exceedance probabilities and summaries use weighted
+        estimators, which sharpens the 99th-percentile numbers for the
+        same iteration count. A shift of 1.5-2.5 suits VaR99/CVaR99.
+
+        Every run records wall time, CPU time, rows and peak memory for
+        each pipeline stage (load, validate, fit, correlate, sample,
+        compute, aggregate) in ``results.profile``.
+
+        With checkpoint_path set, the run state (batches completed and the
+        results folded in so far) is saved there every checkpoint_every
+        batches; after a crash ``resume(checkpoint_path)`` finishes the run
+        with results identical to an uninterrupted one. The checkpoint is
+        removed when the run completes. Checkpointed runs must set
+        output_path or streaming=True, so a checkpoint references column
+        files or holds sketches and stays the same size as the run grows.
+
         Args:
             iterations: Number of simulation runs (default: 10000)
-            batch_size: Batch size for memory management (default: auto)
-            progress_bar: Show progress bar (default: False)
+            batch_size: Scenarios per batch, rounded to whole generation
+                        blocks (default: auto)
+            progress_bar: Show a progress line on stderr (default: False)
+            memory_limit_mb: Memory ceiling used to size batches and to
+                             cap the scenario rows kept in memory
+                             (default: None)
+            streaming: Keep streaming statistics instead of every scenario
+                       row (default: False)
+            target_precision: Relative CI half-width at which to stop
+                              (default: None = run exactly `iterations`)
+            max_iterations: Iteration cap for adaptive runs
+                            (default: `iterations`)
+            output_path: Directory to write scenario columns to
+                         (default: None = keep in memory)
+            importance_shift: Tilt of the quota attainment normal score,
+                              in standard deviations (default: None = off)
+            checkpoint_path: File to checkpoint progress to (default: None)
+            checkpoint_every: Batches between checkpoints (default: 1)
+            progress_callback: Called after every batch with a dict of
+                               batch, batches, rows, total_rows,
+                               elapsed_seconds and done (default: None)
 
         Returns:
             SimulationResults object with analysis
 
         Raises:
             SimulationError: If simulation fails
-            ConfigurationError: If required data not loaded
+            ConvergenceError: If target_precision is not reached by the cap
+            ConfigurationError: If required data not loaded, checkpoint_path
+                                is set for an in-memory run, or the rows
+                                kept in memory would exceed memory_limit_mb
         """
         # Validate configuration
         if self._historical_data is None:
             raise ConfigurationError("No historical data loaded")
         if self._plan is None:
             raise ConfigurationError("No compensation plan loaded")
+        if streaming and output_path is not None:
+            raise ConfigurationError("streaming=True keeps no scenario rows to write to output_path")
+        if checkpoint_path is not None and not streaming and output_path is None:
+            # Each checkpoint would pickle every row kept so far
+            raise ConfigurationError("checkpoint_path needs output_path or streaming=True")
 
         logger.info(f"Starting Monte Carlo simulation ({iterations} iterations)...")
 
@@ -306,83 +466,615 @@ class MonteCarloSimulator:
             logger.info("Auto-detecting correlations...")
             self.set_correlations(auto_detect=True)
 
-        # Generate scenarios
-        scenarios = self._generate_scenarios(iterations)
+        generator = self._scenario_generator(importance_shift=importance_shift or 0.0)
+        monitor = None
+
+        if target_precision is not None:
+            monitor = ConvergenceMonitor(target_precision)
+            iterations = max_iterations or iterations
+            if batch_size is None:
+                # Check convergence every few blocks rather than every few million rows
+                batch_size = monitor.min_replicates * generator.block_size
+
+        batches = self._plan_batches(generator, iterations, batch_size, memory_limit_mb)
+        if streaming:
+            accumulator = StreamingAccumulator()
+        elif output_path is not None:
+            # Adaptive runs stop early; rows past the stop are never written
+            accumulator = MemmapAccumulator(output_path, iterations * generator.n_reps)
+        else:
+            # Kept rows count against the memory limit too
+            max_bytes = memory_limit_mb * 2**20 if memory_limit_mb is not None else None
+            total_rows = None if monitor is not None else iterations * generator.n_reps
+            accumulator = ScenarioAccumulator(total_rows, max_bytes=max_bytes)
+
+        state = RunCheckpoint(
+            generator=generator,
+            plan=self._plan,
+            iterations=iterations,
+            batches=batches,
+            accumulator=accumulator,
+            monitor=monitor,
+            target_precision=target_precision,
+            memory_limit_mb=memory_limit_mb,
+            importance_shift=importance_shift,
+            profiler=PipelineProfiler()
+        )
+
+        if progress_bar and progress_callback is None:
+            progress_callback = print_progress
+
+        return self._execute(state, checkpoint_path, checkpoint_every, progress_callback)
+
+    def resume(
+        self,
+        checkpoint_path: Union[str, Path],
+        checkpoint_every: int = 1,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> SimulationResults:
+        """
+        Continue a run from its last checkpoint.
+
+        The checkpoint holds the run's generator, plan, batch plan and
+        partial results, so nothing needs to be loaded first; only this
+        simulator's parallel/workers settings are used. Results are
+        identical to those of the uninterrupted run.
+
+        Args:
+            checkpoint_path: Checkpoint written by ``run(checkpoint_path=...)``
+            checkpoint_every: Batches between further checkpoints
+            progress_callback: Called after every batch (see ``run``)
+
+        Returns:
+            SimulationResults object with analysis
+
+        Raises:
+            FileNotFoundError: If the checkpoint does not exist
+            ConvergenceError: If target_precision is not reached by the cap
+        """
+        state = RunCheckpoint.load(checkpoint_path)
+
+        logger.info(
+            f"Resuming from batch {state.completed}/{len(state.batches)} "
+            f"({state.accumulator.rows} rows done)"
+        )
+
+        return self._execute(state, checkpoint_path, checkpoint_every, progress_callback)
+
+    def _execute(
+        self,
+        state: RunCheckpoint,
+        checkpoint_path: Optional[Union[str, Path]],
+        checkpoint_every: int,
+        progress_callback: Optional[Callable[[Dict[str, Any]], None]] = None,
+        executor: Optional[SimulationExecutor] = None
+    ) -> SimulationResults:
+        """
+        Run a run's remaining batches and build its results.
+
+        Args:
+            state: Run state (fresh or loaded from a checkpoint)
+            checkpoint_path: File to checkpoint to (None = no checkpoints)
+            checkpoint_every: Batches between checkpoints
+            progress_callback: Called after every batch
+            executor: Executor to run batches on
+                      (default: this simulator's parallel settings)
 
-        # Calculate compensation for all scenarios
-        engine = CompensationEngine(self._plan)
-        results = engine.calculate_batch(scenarios, group_by='scenario_id')
+        Returns:
+            SimulationResults object with analysis
+        """
+        generator, accumulator, monitor = state.generator, state.accumulator, state.monitor
+        batches = state.batches
+        profiler = state.profiler or PipelineProfiler()
+
+        # Generate scenarios and calculate compensation batch by batch,
+        # sharding each batch across workers
+        start = time.perf_counter()
+        elapsed_before = state.elapsed_seconds
+        with executor or self._executor() as executor:
+            for blocks in batches[state.completed:]:
+                batch = executor.run(generator, state.plan, state.iterations, blocks)
+                profiler.merge(executor.last_run['stages'])
+
+                with profiler.stage('aggregate', rows=len(batch)):
+                    accumulator.add(batch)
+                    if monitor is not None:
+                        monitor.update(batch, generator.block_size)
+
+                state.completed += 1
+                logger.info(
+                    f"Completed batch {state.completed}/{len(batches)} ({accumulator.rows} rows)"
+                )
+
+                converged = monitor is not None and monitor.converged
+                if progress_callback is not None:
+                    progress_callback({
+                        'batch': state.completed,
+                        'batches': len(batches),
+                        'rows': accumulator.rows,
+                        'total_rows': state.iterations * generator.n_reps,
+                        'elapsed_seconds': elapsed_before + time.perf_counter() - start,
+                        'done': state.finished or converged
+                    })
+
+                if converged:
+                    break
+
+                if (checkpoint_path is not None and not state.finished
+                        and state.completed % checkpoint_every == 0):
+                    state.elapsed_seconds = elapsed_before + time.perf_counter() - start
+                    state.save(checkpoint_path)
+
+        metadata = {
+            'execution': {
+                **{k: v for k, v in executor.last_run.items() if k != 'stages'},
+                'batches': state.completed,
+                'block_size': generator.block_size,
+                'elapsed_seconds': elapsed_before + time.perf_counter() - start
+            },
+            # Known input means, used by control-variate estimators; taken
+            # from the distribution actually sampled (the inverse-CDF table
+            # when one is built) so the control is centred without bias
+            'control_means': {
+                var: float(generator.distributions[var].sampling_distribution.mean())
+                for var in generator.variables
+            }
+        }
+
+        if state.importance_shift:
+            metadata['importance_sampling'] = {
+                'variable': 'quota_attainment',
+                'shift': state.importance_shift
+            }
+
+        if checkpoint_path is not None:
+            Path(checkpoint_path).unlink(missing_ok=True)
+
+        if monitor is not None:
+            completed = accumulator.rows // generator.n_reps
+            metadata['convergence'] = monitor.report(completed)
+            precision = monitor.precision()
+
+            if not monitor.converged:
+                achieved = ", ".join(f"{k}={v:.4f}" for k, v in precision.items())
+                raise ConvergenceError(
+                    f"Did not reach target precision {state.target_precision:.4f} within "
+                    f"{completed} iterations (achieved: {achieved})",
+                    iterations=completed,
+                    precision=precision
+                )
+
+            logger.info(
+                f"Converged after {completed} iterations "
+                f"(worst precision: {max(precision.values()):.4f})"
+            )
+
+        # The profile must be complete before output_path runs write it
+        # into their manifest; building the results is not profiled
+        metadata['profile'] = {**self.profiler.report(), **profiler.report()}
+
+        results = accumulator.to_results(metadata=metadata)
 
         logger.info("Simulation complete!")
 
-        return SimulationResults(results)
+        return results
 
-    def _generate_scenarios(self, n_scenarios: int) -> pd.DataFrame:
+    def compare(
+        self,
+        plans: List[CompensationPlan],
+        iterations: int = 10000,
+        batch_size: Optional[int] = None,
+        baseline: Optional[str] = None
+    ) -> PlanComparison:
         """
-        Generate simulation scenarios.
+        Compare compensation plans on common random numbers.
+
+        Scenarios are generated once per batch and every plan is evaluated
+        on the same draws, so plan differences are paired per scenario and
+        carry much less noise than two separate ``run()`` calls.
 
         Args:
-            n_scenarios: Number of scenarios to generate
+            plans: Plans to compare (at least two, distinct plan_ids)
+            iterations: Number of simulation runs (default: 10000)
+            batch_size: Scenarios per batch, rounded to whole generation
+                        blocks (default: auto)
+            baseline: plan_id differences are measured against
+                      (default: the first plan)
 
         Returns:
-            DataFrame with scenarios
+            PlanComparison with per-scenario totals and paired differences
+
+        Raises:
+            ConfigurationError: If data is missing or the plans are invalid
         """
-        logger.info(f"Generating {n_scenarios} scenarios...")
+        if self._historical_data is None:
+            raise ConfigurationError("No historical data loaded")
+        if len(plans) < 2:
+            raise ConfigurationError("compare() needs at least two plans")
+
+        plan_ids = [plan.plan_id for plan in plans]
+        if len(set(plan_ids)) != len(plan_ids):
+            raise ConfigurationError(f"Compared plans need distinct plan_ids, got {plan_ids}")
+        if baseline is not None and baseline not in plan_ids:
+            raise ConfigurationError(f"Baseline '{baseline}' is not one of {plan_ids}")
+
+        logger.info(f"Comparing {len(plans)} plans on {iterations} common scenarios...")
+
+        if not self._fitted_distributions:
+            self.fit_distributions(auto=True)
+
+        if self._correlation_matrix is None and len(self._fitted_distributions) > 1:
+            self.set_correlations(auto_detect=True)
 
-        # Get unique reps
-        reps = self._historical_data['rep_id'].unique()
-        n_reps = len(reps)
+        generator = self._scenario_generator()
+        batches = self._plan_batches(generator, iterations, batch_size, None)
 
-        # Get average quota per rep
-        avg_quota = self._historical_data.groupby('rep_id')['quota'].mean()
+        start = time.perf_counter()
+        parts = []
+        with self._executor() as executor:
+            for blocks in batches:
+                parts.append(executor.compare(generator, plans, iterations, blocks))
 
-        # Prepare for sampling
-        sampling_strategy = get_sampling_strategy(self.sampling_strategy_name)
+        totals = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
 
-        # Generate samples for each variable
-        scenarios_list = []
+        metadata = {
+            'execution': {
+                **{k: v for k, v in executor.last_run.items() if k != 'stages'},
+                'batches': len(batches),
+                'block_size': generator.block_size,
+                'elapsed_seconds': time.perf_counter() - start
+            }
+        }
 
-        for scenario_id in range(n_scenarios):
-            scenario_data = []
+        logger.info("Plan comparison complete!")
 
-            for rep_id in reps:
-                # Get quota for this rep
-                quota = avg_quota.get(rep_id, avg_quota.mean())
+        return PlanComparison(totals, baseline=baseline, metadata=metadata)
 
-                # Generate performance metrics
-                row = {
-                    'scenario_id': scenario_id,
-                    'rep_id': rep_id,
-                    'quota': quota
+    def sweep(
+        self,
+        parameters: Union[Dict[Any, List[float]], pd.DataFrame],
+        iterations: int = 10000
+    ) -> SweepResults:
+        """
+        Evaluate a grid of commission-tier parameters on one scenario set.
+
+        Scenarios are generated once and every variant of the loaded plan
+        is evaluated on them, with the variants broadcast along a
+        parameter axis, so a 50-point sweep costs about one run plus the
+        payout arithmetic. Parameters are named ``'<tier_name>.<field>'``
+        with field quota_min, quota_max or rate_value.
+
+        Args:
+            parameters: Dict of {parameter name(s): values} expanded to
+                        their Cartesian product (see ``TierSweep.grid``),
+                        or a DataFrame with one row per variant
+            iterations: Number of simulation runs (default: 10000)
+
+        Returns:
+            SweepResults with each variant's per-scenario total payout
+
+        Raises:
+            ConfigurationError: If required data not loaded
+        """
+        if self._historical_data is None:
+            raise ConfigurationError("No historical data loaded")
+        if self._plan is None:
+            raise ConfigurationError("No compensation plan loaded")
+
+        points = parameters if isinstance(parameters, pd.DataFrame) else TierSweep.grid(parameters)
+        logger.info(f"Sweeping {len(points)} plan variants over {iterations} scenarios...")
+
+        start = time.perf_counter()
+        generator, scenarios = self._frozen_scenarios(iterations)
+        plan_sweep = PlanSweep(self._plan, scenarios, generator.n_reps)
+
+        results = plan_sweep.evaluate(points)
+        results.metadata = {
+            'execution': {
+                'points': len(points),
+                'block_size': generator.block_size,
+                'elapsed_seconds': time.perf_counter() - start
+            }
+        }
+
+        logger.info("Sweep complete!")
+
+        return results
+
+    def optimize(
+        self,
+        bounds: Dict[Any, Tuple[float, float]],
+        target_cost: float,
+        var_95_budget: Optional[float] = None,
+        iterations: int = 10000,
+        population: int = 64,
+        max_rounds: int = 30
+    ) -> OptimizationResult:
+        """
+        Search tier rates and thresholds for a target expected cost.
+
+        One scenario set is generated and frozen; a cross-entropy search
+        (``PlanOptimizer``) then evaluates a population of plan variants
+        per round on it in a single broadcast sweep. Rates must not fall
+        as attainment rises and tier thresholds must not cross.
+
+        Args:
+            bounds: Dict of {'<tier_name>.<field>' (or a tuple of names
+                    moved together): (low, high)}
+            target_cost: Target expected total payout per scenario
+                         (summed over reps)
+            var_95_budget: Ceiling on the 95th percentile of total payout
+                           (default: None = unconstrained)
+            iterations: Number of frozen scenarios (default: 10000)
+            population: Candidates evaluated per round (default: 64)
+            max_rounds: Round cap (default: 30)
+
+        Returns:
+            OptimizationResult with the optimized plan and search history
+
+        Raises:
+            ConfigurationError: If required data not loaded
+        """
+        if self._historical_data is None:
+            raise ConfigurationError("No historical data loaded")
+        if self._plan is None:
+            raise ConfigurationError("No compensation plan loaded")
+
+        generator, scenarios = self._frozen_scenarios(iterations)
+        optimizer = PlanOptimizer(
+            PlanSweep(self._plan, scenarios, generator.n_reps),
+            bounds,
+            target_cost,
+            var_95_budget=var_95_budget,
+            population=population,
+            max_rounds=max_rounds,
+            seed=generator.streams.child(generator.n_blocks(iterations))
+        )
+        return optimizer.optimize()
+
+    def _frozen_scenarios(self, iterations: int) -> Tuple[ScenarioGenerator, pd.DataFrame]:
+        """
+        Generate one scenario set to evaluate many plan variants on.
+
+        Args:
+            iterations: Number of scenarios
+
+        Returns:
+            Tuple of (generator, scenario frame)
+        """
+        if not self._fitted_distributions:
+            self.fit_distributions(auto=True)
+
+        if self._correlation_matrix is None and len(self._fitted_distributions) > 1:
+            self.set_correlations(auto_detect=True)
+
+        generator = self._scenario_generator()
+        return generator, generator.generate(iterations)
+
+    def run_periods(
+        self,
+        iterations: int = 10000,
+        periods: int = 12,
+        periods_per_year: Optional[int] = None,
+        batch_size: Optional[int] = None
+    ) -> PeriodicResults:
+        """
+        Execute a multi-period Monte Carlo simulation.
+
+        Each scenario draws every rep's performance in every period as one
+        (scenario x rep x period) tensor per generation block. The plan is
+        then evaluated with ``PeriodicEngine``: commission tiers at the
+        plan's frequency, bonuses at their own frequency (monthly,
+        quarterly or annual) and SPIFs once a year, using reductions along
+        the period axis. Payouts land in the period they are paid.
+
+        The fitted distributions describe one historical period, so the
+        periods simulated should match the historical period length.
+
+        Args:
+            iterations: Number of simulation runs (default: 10000)
+            periods: Periods per scenario (default: 12)
+            periods_per_year: Simulated periods per plan year
+                              (default: ``periods``, i.e. one plan year)
+            batch_size: Scenarios per batch, rounded to whole generation
+                        blocks (default: auto)
+
+        Returns:
+            PeriodicResults with per-period payout arrays
+
+        Raises:
+            ConfigurationError: If required data not loaded
+        """
+        if self._historical_data is None:
+            raise ConfigurationError("No historical data loaded")
+        if self._plan is None:
+            raise ConfigurationError("No compensation plan loaded")
+
+        logger.info(
+            f"Starting multi-period simulation ({iterations} iterations x {periods} periods)..."
+        )
+
+        if not self._fitted_distributions:
+            self.fit_distributions(auto=True)
+
+        if self._correlation_matrix is None and len(self._fitted_distributions) > 1:
+            self.set_correlations(auto_detect=True)
+
+        generator = self._scenario_generator()
+        engine = PeriodicEngine(self._plan, periods_per_year or periods)
+
+        if batch_size is None:
+            batch_size = max(1, DEFAULT_BATCH_ROWS // (generator.n_reps * periods))
+        batches = self._plan_batches(generator, iterations, batch_size, None)
+
+        start = time.perf_counter()
+        parts = []
+        for blocks in batches:
+            tensors = generator.generate_periods(iterations, periods, blocks)
+            payouts = engine.calculate(tensors)
+            parts.append({
+                'scenario_id': tensors['scenario_id'],
+                'quota': tensors['quota'].sum(axis=-1),
+                'actual_sales': tensors['actual_sales'].sum(axis=-1),
+                **{
+                    component: values.astype(generator.precision, copy=False)
+                    for component, values in payouts.items()
                 }
+            })
+
+        merged = {key: np.concatenate([part[key] for part in parts]) for key in parts[0]}
+
+        metadata = {
+            'execution': {
+                'backend': 'serial',
+                'batches': len(batches),
+                'block_size': generator.block_size,
+                'elapsed_seconds': time.perf_counter() - start
+            },
+            'periods': {
+                'periods': periods,
+                'periods_per_year': engine.periods_per_year,
+                'plan_frequency': self._plan.frequency
+            }
+        }
+
+        logger.info("Multi-period simulation complete!")
+
+        return PeriodicResults(
+            merged.pop('scenario_id'),
+            generator.rep_ids,
+            payouts={component: merged[component] for component in PAYOUT_COMPONENTS},
+            quota=merged['quota'],
+            actual_sales=merged['actual_sales'],
+            metadata=metadata
+        )
 
-                # Sample quota_attainment
-                if 'quota_attainment' in self._fitted_distributions:
-                    dist = self._fitted_distributions['quota_attainment'].distribution
-                    seed = abs(hash((self.seed, scenario_id, rep_id))) % (2**32) if self.seed else None
-                    qa = sampling_strategy.sample(dist, 1, seed)[0]
-                    row['quota_attainment'] = qa
-                    row['actual_sales'] = quota * qa
-                else:
-                    row['quota_attainment'] = 1.0
-                    row['actual_sales'] = quota
+    def _plan_batches(
+        self,
+        generator: ScenarioGenerator,
+        iterations: int,
+        batch_size: Optional[int],
+        memory_limit_mb: Optional[float]
+    ) -> List[range]:
+        """
+        Split a run's generation blocks into batches.
 
-                # Sample other metrics if available
-                for var in ['deal_count', 'avg_deal_size']:
-                    if var in self._fitted_distributions:
-                        dist = self._fitted_distributions[var].distribution
-                        seed = abs(hash((self.seed, scenario_id, rep_id, var))) % (2**32) if self.seed else None
-                        row[var] = sampling_strategy.sample(dist, 1, seed)[0]
+        Args:
+            generator: Scenario generator
+            iterations: Number of scenarios
+            batch_size: Requested scenarios per batch
+            memory_limit_mb: Memory ceiling for one batch's working set
 
-                scenario_data.append(row)
+        Returns:
+            List of block ranges, in order
+        """
+        if batch_size is None:
+            batch_size = max(1, DEFAULT_BATCH_ROWS // generator.n_reps)
 
-            scenarios_list.extend(scenario_data)
+        if memory_limit_mb is not None:
+            bytes_per_scenario = generator.n_reps * BATCH_BYTES_PER_ROW
+            batch_size = min(batch_size, int(memory_limit_mb * 2**20 // bytes_per_scenario))
 
-        scenarios_df = pd.DataFrame(scenarios_list)
+        blocks_per_batch = max(1, batch_size // generator.block_size)
+        n_blocks = generator.n_blocks(iterations)
 
-        logger.info(f"Generated {len(scenarios_df)} scenario-rep combinations")
+        return [
+            range(start, min(start + blocks_per_batch, n_blocks))
+            for start in range(0, n_blocks, blocks_per_batch)
+        ]
 
-        return scenarios_df
+    def benchmark(self, iterations: int = 10000) -> Dict[str, float]:
+        """
+        Time the configured parallel backend against the serial path.
+
+        Both runs go through the same setup and batch loop as ``run()``
+        (auto-fitted distributions and correlations, batching, result
+        aggregation) with the same seed, and the results are checked to
+        be identical. The parallel run always uses the process pool.
+
+        Args:
+            iterations: Number of simulation runs per backend
+
+        Returns:
+            Dict with serial_seconds, parallel_seconds, speedup and workers
+        """
+        if self._historical_data is None or self._plan is None:
+            raise ConfigurationError("Load data and plan before benchmarking")
+
+        if not self._fitted_distributions:
+            self.fit_distributions(auto=True)
+
+        if self._correlation_matrix is None and len(self._fitted_distributions) > 1:
+            self.set_correlations(auto_detect=True)
+
+        generator = self._scenario_generator()
+        executors = {
+            'serial': SimulationExecutor(parallel=False),
+            'parallel': SimulationExecutor(parallel=True, workers=self.workers, min_rows=0)
+        }
+
+        execution = {}
+        payouts = {}
+        for name, executor in executors.items():
+            state = RunCheckpoint(
+                generator=generator,
+                plan=self._plan,
+                iterations=iterations,
+                batches=self._plan_batches(generator, iterations, None, None),
+                accumulator=ScenarioAccumulator(iterations * generator.n_reps),
+                profiler=PipelineProfiler()
+            )
+            results = self._execute(state, None, 1, executor=executor)
+            execution[name] = results.metadata['execution']
+            payouts[name] = results.scenarios['total_payout']
+
+        if not payouts['serial'].equals(payouts['parallel']):
+            raise SimulationError("Parallel results differ from serial results")
+
+        timing = {
+            'serial_seconds': execution['serial']['elapsed_seconds'],
+            'parallel_seconds': execution['parallel']['elapsed_seconds'],
+            'workers': execution['parallel']['workers'],
+        }
+        timing['speedup'] = timing['serial_seconds'] / timing['parallel_seconds']
+
+        logger.info(
+            f"Parallel speedup: {timing['speedup']:.2f}x on {timing['workers']} workers"
+        )
+
+        return timing
+
+    def _executor(self) -> SimulationExecutor:
+        """Executor with this simulator's parallel settings."""
+        return SimulationExecutor(
+            parallel=self.parallel, workers=self.workers, min_rows=self.parallel_min_rows
+        )
+
+    def _scenario_generator(self, importance_shift: float = 0.0) -> ScenarioGenerator:
+        """Build the scenario generator for the current configuration."""
+        return ScenarioGenerator.from_history(
+            self._historical_data,
+            self._fitted_distributions,
+            sampling_strategy=get_sampling_strategy(self.sampling_strategy_name),
+            seed=self.seed,
+            block_size=self.block_size,
+            correlation_matrix=self._correlation_matrix,
+            precision=self.precision,
+            importance_shift=importance_shift,
+            cache=self._cache
+        )
+
+    def _generate_scenarios(self, n_scenarios: int) -> pd.DataFrame:
+        """
+        Generate simulation scenarios.
+
+        Args:
+            n_scenarios: Number of scenarios to generate
+
+        Returns:
+            DataFrame with scenarios
+        """
+        return self._scenario_generator().generate(n_scenarios)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -0,0 +1,151 @@
+"""Plan parameter sweeps over a shared scenario set."""
+
+import pandas as pd
+import numpy as np
+from typing import Dict, Any, Optional
+import logging
+
+from ..compensation.plan import CompensationPlan
+from ..compensation.calculator import BonusCalculator, SPIFCalculator
+from ..compensation.sweep import TierSweep
+
+logger = logging.getLogger(__name__)
+
+# Elements of the (points x rows) commission array evaluated at once
+SWEEP_CHUNK_ELEMENTS = 8_000_000
+
+
+class PlanSweep:
+    """
+    Evaluate tier-parameter variants of a plan on frozen scenarios.
+
+    Bonuses and SPIFs do not depend on tier parameters, so they are
+    computed once. Each batch of variants then costs one broadcast
+    commission evaluation plus a reduction to per-scenario totals.
+
+    Example:
+        >>> sweep = PlanSweep(plan, scenarios, n_reps=50)
+        >>> totals = sweep.totals(TierSweep.grid({'Tier 4.rate_value': [0.05, 0.07]}))
+    """
+
+    def __init__(self, plan: CompensationPlan, scenarios: pd.DataFrame, n_reps: int):
+        """
+        Initialize sweep.
+
+        Args:
+            plan: Plan whose tiers are varied
+            scenarios: Scenario rows, scenario-major with n_reps rows each
+            n_reps: Reps per scenario
+        """
+        self.plan = plan
+        self.n_reps = n_reps
+        self.tier_sweep = TierSweep(plan.commission_tiers)
+        self.quota = scenarios['quota'].to_numpy(dtype=float)
+        self.actual_sales = scenarios['actual_sales'].to_numpy(dtype=float)
+        self.n_scenarios = len(scenarios) // n_reps
+
+        fixed = np.zeros(len(scenarios))
+        if plan.bonuses:
+            fixed += BonusCalculator.calculate(scenarios, plan.bonuses).to_numpy()
+        if plan.spifs:
+            fixed += SPIFCalculator.calculate(scenarios, plan.spifs).to_numpy()
+        self.fixed_payout = fixed
+
+    def totals(self, points: pd.DataFrame) -> np.ndarray:
+        """
+        Total payout across reps of every variant in every scenario.
+
+        Args:
+            points: Parameter table (see ``TierSweep``)
+
+        Returns:
+            Array of shape (n_points, n_scenarios)
+        """
+        n_rows = len(self.quota)
+        chunk = max(1, SWEEP_CHUNK_ELEMENTS // n_rows)
+        totals = np.empty((len(points), self.n_scenarios))
+
+        for start in range(0, len(points), chunk):
+            part = points.iloc[start:start + chunk]
+            payout = self.tier_sweep.calculate(self.quota, self.actual_sales, part)
+            payout += self.fixed_payout
+            totals[start:start + len(part)] = payout.reshape(
+                len(part), self.n_scenarios, self.n_reps
+            ).sum(axis=-1)
+
+        return totals
+
+    def evaluate(
+        self,
+        points: pd.DataFrame,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> 'SweepResults':
+        """
+        Evaluate every variant.
+
+        Args:
+            points: Parameter table (see ``TierSweep``)
+            metadata: Run information
+
+        Returns:
+            SweepResults for the variants
+        """
+        return SweepResults(
+            points.reset_index(drop=True), self.totals(points), self.n_reps, metadata
+        )
+
+
+class SweepResults:
+    """
+    Cost distribution of every swept plan variant.
+
+    Holds each variant's total payout per scenario (summed over reps);
+    ``summary`` lines the parameter table up with cost metrics.
+    """
+
+    def __init__(
+        self,
+        points: pd.DataFrame,
+        totals: np.ndarray,
+        n_reps: int,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Initialize results.
+
+        Args:
+            points: Parameter table, one row per variant
+            totals: Total payout per variant and scenario
+            n_reps: Reps per scenario
+            metadata: Run information
+        """
+        self.points = points
+        self.totals = totals
+        self.n_reps = n_reps
+        self.metadata = metadata or {}
+
+    def summary(self) -> pd.DataFrame:
+        """
+        Cost metrics of every variant.
+
+        Returns:
+            Parameter table plus expected_payout (per rep), expected_cost,
+            cost_std, cost_var_95 and cost_cvar_95 (per scenario total)
+        """
+        var_95 = np.quantile(self.totals, 0.95, axis=1)
+        tail = self.totals >= var_95[:, None]
+
+        summary = self.points.copy()
+        summary['expected_payout'] = self.totals.mean(axis=1) / self.n_reps
+        summary['expected_cost'] = self.totals.mean(axis=1)
+        summary['cost_std'] = self.totals.std(axis=1, ddof=1)
+        summary['cost_var_95'] = var_95
+        summary['cost_cvar_95'] = (self.totals * tail).sum(axis=1) / tail.sum(axis=1)
+        return summary
+
+    def __repr__(self) -> str:
+        """String representation."""
+        return (
+            f"SweepResults(points={len(self.points)}, "
+            f"scenarios={self.totals.shape[1]})"
+        )
@@ -2,9 +2,19 @@
 
 from .distribution_fitter import DistributionFitter, FitResult
 from .correlation import CorrelationAnalyzer
+from .streaming import RunningMoments, QuantileSketch, StreamingStats
+from .inverse_cdf import InverseCDFTable
+from .weighted import weighted_mean, weighted_quantile, effective_sample_size
 
 __all__ = [
     'DistributionFitter',
     'FitResult',
-    'CorrelationAnalyzer'
+    'CorrelationAnalyzer',
+    'RunningMoments',
+    'QuantileSketch',
+    'StreamingStats',
+    'InverseCDFTable',
+    'weighted_mean',
+    'weighted_quantile',
+    'effective_sample_size'
 ]
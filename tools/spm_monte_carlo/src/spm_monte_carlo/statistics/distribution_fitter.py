@@ -8,6 +8,7 @@ from dataclasses import dataclass
 import logging
 
 from ..exceptions import DistributionFittingError
+from .inverse_cdf import InverseCDFTable, DEFAULT_KNOTS
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +22,25 @@ class FitResult:
     params: Dict[str, float]
     goodness_of_fit: Dict[str, float]
     selected_distribution: Optional[str] = None
+    inverse_cdf: Optional[InverseCDFTable] = None
+
+    def build_inverse_cdf(self, n_knots: int = DEFAULT_KNOTS) -> 'FitResult':
+        """
+        Build an interpolated inverse-CDF table for fast sampling.
+
+        Args:
+            n_knots: Number of interpolation knots
+
+        Returns:
+            Self for method chaining
+        """
+        self.inverse_cdf = InverseCDFTable(self.distribution, n_knots=n_knots)
+        return self
+
+    @property
+    def sampling_distribution(self) -> Any:
+        """Distribution to draw from: the table if built, else scipy's."""
+        return self.inverse_cdf if self.inverse_cdf is not None else self.distribution
 
 
 class DistributionFitter:
@@ -49,7 +69,8 @@ class DistributionFitter:
         data: np.ndarray,
         distribution_type: str = 'normal',
         remove_outliers: bool = False,
-        test_fit: bool = True
+        test_fit: bool = True,
+        inverse_cdf_table: bool = False
     ) -> FitResult:
         """
         Fit a specific distribution to data.
@@ -59,6 +80,7 @@ class DistributionFitter:
             distribution_type: Distribution family to fit
             remove_outliers: Remove outliers before fitting
             test_fit: Run goodness-of-fit test
+            inverse_cdf_table: Build an interpolated inverse-CDF table
 
         Returns:
             FitResult
@@ -105,13 +127,18 @@ class DistributionFitter:
             if test_fit:
                 gof = self._test_goodness_of_fit(data, distribution)
 
-            return FitResult(
+            result = FitResult(
                 distribution_name=distribution_type,
                 distribution=distribution,
                 params=param_names,
                 goodness_of_fit=gof
             )
 
+            if inverse_cdf_table:
+                result.build_inverse_cdf()
+
+            return result
+
         except Exception as e:
             raise DistributionFittingError(
                 f"Failed to fit {distribution_type} distribution: {str(e)}"
@@ -121,7 +148,8 @@ class DistributionFitter:
         self,
         data: np.ndarray,
         candidates: Optional[List[str]] = None,
-        remove_outliers: bool = False
+        remove_outliers: bool = False,
+        inverse_cdf_table: bool = False
     ) -> FitResult:
         """
         Automatically select best-fitting distribution.
@@ -130,6 +158,7 @@ class DistributionFitter:
             data: Data array
             candidates: List of distributions to try (None = all)
             remove_outliers: Remove outliers before fitting
+            inverse_cdf_table: Build an inverse-CDF table for the best fit
 
         Returns:
             FitResult with best-fit distribution
@@ -168,6 +197,9 @@ class DistributionFitter:
         best_fit.selected_distribution = best_fit.distribution_name
         logger.info(f"Best fit: {best_fit.distribution_name} (p={best_pvalue:.4f})")
 
+        if inverse_cdf_table:
+            best_fit.build_inverse_cdf()
+
         return best_fit
 
     def _validate_data(self, data: np.ndarray) -> np.ndarray:
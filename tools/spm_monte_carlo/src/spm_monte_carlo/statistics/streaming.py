@@ -0,0 +1,406 @@
+"""Streaming (single-pass, mergeable) statistics."""
+
+import numpy as np
+import pandas as pd
+from typing import Optional, Dict, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class RunningMoments:
+    """
+    Running count, mean, variance, min and max.
+
+    Batches are folded in with the Chan et al. pairwise update, the batch
+    form of Welford's algorithm, so results do not depend on batch sizes
+    and two accumulators can be merged. Observations may carry
+    likelihood-ratio weights; ``count`` is always the number of rows and
+    ``weight`` the total weight.
+    """
+
+    def __init__(self):
+        """Initialize empty moments."""
+        self.count = 0.0
+        self.weight = 0.0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray, weights: Optional[np.ndarray] = None):
+        """
+        Fold a batch of values in.
+
+        Args:
+            values: 1-D array of observations
+            weights: Weight of each observation (None = all 1)
+        """
+        values = np.asarray(values, dtype=float)
+        if len(values) == 0:
+            return
+
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=float)
+
+        batch = RunningMoments()
+        batch.count = float(len(values))
+        batch.weight = float(weights.sum())
+        batch.mean = float((weights * values).sum() / batch.weight)
+        batch.m2 = float((weights * (values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        self.merge(batch)
+
+    def merge(self, other: 'RunningMoments'):
+        """
+        Merge another accumulator into this one.
+
+        Args:
+            other: RunningMoments over disjoint observations
+        """
+        if other.count == 0:
+            return
+
+        total = self.weight + other.weight
+        delta = other.mean - self.mean
+        self.mean += delta * other.weight / total
+        self.m2 += other.m2 + delta ** 2 * self.weight * other.weight / total
+        self.weight = total
+        self.count += other.count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1; weighted variance scaled likewise)."""
+        if self.count <= 1:
+            return float('nan')
+        return self.m2 / self.weight * self.count / (self.count - 1)
+
+    @property
+    def std(self) -> float:
+        """Sample standard deviation (ddof=1)."""
+        return float(np.sqrt(self.variance))
+
+
+class _BucketStore:
+    """Dense, growable array of bucket counts keyed by integer index."""
+
+    def __init__(self):
+        self.counts = np.zeros(0)
+        self.offset = 0
+
+    def add(self, indices: np.ndarray, weights: Optional[np.ndarray] = None):
+        if len(indices) == 0:
+            return
+        self._extend(int(indices.min()), int(indices.max()))
+        self.counts += np.bincount(
+            indices - self.offset, weights=weights, minlength=len(self.counts)
+        )
+
+    def merge(self, other: '_BucketStore'):
+        if len(other.counts) == 0:
+            return
+        self._extend(other.offset, other.offset + len(other.counts) - 1)
+        start = other.offset - self.offset
+        self.counts[start:start + len(other.counts)] += other.counts
+
+    def _extend(self, low: int, high: int):
+        if len(self.counts) == 0:
+            self.offset = low
+            self.counts = np.zeros(high - low + 1)
+            return
+        new_low = min(low, self.offset)
+        new_high = max(high, self.offset + len(self.counts) - 1)
+        if new_low == self.offset and new_high == self.offset + len(self.counts) - 1:
+            return
+        counts = np.zeros(new_high - new_low + 1)
+        start = self.offset - new_low
+        counts[start:start + len(self.counts)] = self.counts
+        self.counts = counts
+        self.offset = new_low
+
+    @property
+    def total(self) -> float:
+        return float(self.counts.sum())
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Values are counted in logarithmically spaced buckets (the DDSketch
+    layout), so any quantile is returned within ``relative_accuracy`` of
+    the true value while memory grows only with the log of the value
+    range. Sketches built on separate batches or workers merge exactly.
+    """
+
+    def __init__(self, relative_accuracy: float = 0.005, min_value: float = 1e-9):
+        """
+        Initialize sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of returned quantiles
+            min_value: Magnitudes below this are counted as zero
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+
+        self.relative_accuracy = relative_accuracy
+        self.min_value = min_value
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = np.log(self._gamma)
+        self._positive = _BucketStore()
+        self._negative = _BucketStore()
+        self.zero_count = 0.0
+
+    @property
+    def count(self) -> float:
+        """Total weight of values added (the number of values if unweighted)."""
+        return self._positive.total + self._negative.total + self.zero_count
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the bucket counts."""
+        return self._positive.counts.nbytes + self._negative.counts.nbytes
+
+    def update(self, values: np.ndarray, weights: Optional[np.ndarray] = None):
+        """
+        Add a batch of values.
+
+        Args:
+            values: 1-D array of observations
+            weights: Weight of each observation (None = all 1)
+        """
+        values = np.asarray(values, dtype=float)
+        weights = np.ones(len(values)) if weights is None else np.asarray(weights, dtype=float)
+        magnitude = np.abs(values)
+        nonzero = magnitude > self.min_value
+        positive = nonzero & (values > 0)
+        negative = nonzero & (values < 0)
+
+        self.zero_count += float(weights[~nonzero].sum())
+        self._positive.add(self._index(values[positive]), weights[positive])
+        self._negative.add(self._index(-values[negative]), weights[negative])
+
+    def merge(self, other: 'QuantileSketch'):
+        """
+        Merge another sketch into this one.
+
+        Args:
+            other: Sketch with the same relative accuracy
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+
+        self._positive.merge(other._positive)
+        self._negative.merge(other._negative)
+        self.zero_count += other.zero_count
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value
+        """
+        values, counts = self._buckets()
+        if counts.sum() == 0:
+            return float('nan')
+
+        cumulative = np.cumsum(counts)
+        rank = q * (cumulative[-1] - 1)
+        return float(values[np.searchsorted(cumulative, rank, side='right')])
+
+    def tail_mean(self, q: float) -> float:
+        """
+        Estimate the mean of values at or above the q-th quantile.
+
+        Args:
+            q: Quantile in [0, 1] where the tail starts
+
+        Returns:
+            Estimated tail mean
+        """
+        values, counts = self._buckets()
+        if counts.sum() == 0:
+            return float('nan')
+
+        cumulative = np.cumsum(counts)
+        start = np.searchsorted(cumulative, q * (cumulative[-1] - 1), side='right')
+        return float((values[start:] * counts[start:]).sum() / counts[start:].sum())
+
+    def fraction_above(self, threshold: float) -> float:
+        """
+        Estimate the fraction of values strictly above a threshold.
+
+        Args:
+            threshold: Threshold value
+
+        Returns:
+            Fraction in [0, 1]
+        """
+        values, counts = self._buckets()
+        if counts.sum() == 0:
+            return float('nan')
+        return float(counts[values > threshold].sum() / counts.sum())
+
+    def histogram(
+        self,
+        bins: int = 50,
+        value_range: Optional[Tuple[float, float]] = None
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate histogram on evenly spaced bins.
+
+        Args:
+            bins: Number of bins
+            value_range: (min, max) of the bins (default: sketch range)
+
+        Returns:
+            Tuple of (counts, bin_edges) like numpy.histogram
+        """
+        values, counts = self._buckets()
+        if value_range is None:
+            value_range = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+        return np.histogram(values, bins=bins, range=value_range, weights=counts)
+
+    def _index(self, magnitudes: np.ndarray) -> np.ndarray:
+        """Bucket index of positive magnitudes."""
+        return np.ceil(np.log(magnitudes) / self._log_gamma).astype(np.int64)
+
+    def _bucket_values(self, store: _BucketStore) -> np.ndarray:
+        """Representative value of every bucket in a store."""
+        indices = np.arange(store.offset, store.offset + len(store.counts))
+        return 2 * self._gamma ** indices / (self._gamma + 1)
+
+    def _buckets(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All non-empty buckets as ascending (values, counts)."""
+        values = np.concatenate([
+            -self._bucket_values(self._negative)[::-1],
+            [0.0],
+            self._bucket_values(self._positive)
+        ])
+        counts = np.concatenate([
+            self._negative.counts[::-1],
+            [self.zero_count],
+            self._positive.counts
+        ])
+        keep = counts > 0
+        return values[keep], counts[keep]
+
+
+class ColumnStats:
+    """Streaming moments and quantile sketch for one column."""
+
+    def __init__(self, relative_accuracy: float = 0.005):
+        """
+        Initialize column statistics.
+
+        Args:
+            relative_accuracy: Quantile sketch relative accuracy
+        """
+        self.moments = RunningMoments()
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    def update(self, values: np.ndarray, weights: Optional[np.ndarray] = None):
+        """Fold a batch of (optionally weighted) values in."""
+        self.moments.update(values, weights)
+        self.sketch.update(values, weights)
+
+    def merge(self, other: 'ColumnStats'):
+        """Merge statistics over disjoint observations."""
+        self.moments.merge(other.moments)
+        self.sketch.merge(other.sketch)
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile, clamped to the exact observed range."""
+        return float(np.clip(self.sketch.quantile(q), self.moments.min, self.moments.max))
+
+    def tail_mean(self, q: float) -> float:
+        """Estimate the mean beyond the q-th quantile, clamped to the observed range."""
+        return float(np.clip(self.sketch.tail_mean(q), self.moments.min, self.moments.max))
+
+
+class StreamingStats:
+    """
+    Streaming statistics for every numeric column of a result stream.
+
+    Batches are folded in as they complete and then discarded, so memory
+    stays flat regardless of how many rows the simulation produces. When
+    batches carry a weight column (importance sampling), every other
+    column is accumulated with those weights.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.005,
+        exclude: Optional[List[str]] = None,
+        weight_column: Optional[str] = None
+    ):
+        """
+        Initialize streaming statistics.
+
+        Args:
+            relative_accuracy: Quantile sketch relative accuracy
+            exclude: Numeric columns not to track (e.g. identifiers)
+            weight_column: Column holding per-row weights, if present
+        """
+        self.relative_accuracy = relative_accuracy
+        self.exclude = set(exclude or [])
+        self.weight_column = weight_column
+        self.columns: Dict[str, ColumnStats] = {}
+
+    @property
+    def weighted(self) -> bool:
+        """Whether any tracked column was accumulated with weights."""
+        return self.weight_column is not None and self.weight_column in self.columns
+
+    @property
+    def count(self) -> int:
+        """Number of rows seen."""
+        if not self.columns:
+            return 0
+        return int(next(iter(self.columns.values())).moments.count)
+
+    def update(self, batch: pd.DataFrame):
+        """
+        Fold a batch of rows in.
+
+        Args:
+            batch: DataFrame of results
+        """
+        weights = None
+        if self.weight_column is not None and self.weight_column in batch.columns:
+            weights = batch[self.weight_column].to_numpy()
+
+        for col in batch.select_dtypes(include=[np.number]).columns:
+            if col in self.exclude:
+                continue
+            if col not in self.columns:
+                self.columns[col] = ColumnStats(self.relative_accuracy)
+            col_weights = None if col == self.weight_column else weights
+            self.columns[col].update(batch[col].to_numpy(), col_weights)
+
+    def merge(self, other: 'StreamingStats'):
+        """
+        Merge statistics over disjoint rows.
+
+        Args:
+            other: StreamingStats from another batch or worker
+        """
+        for col, stats in other.columns.items():
+            if col not in self.columns:
+                self.columns[col] = ColumnStats(self.relative_accuracy)
+            self.columns[col].merge(stats)
+
+    def __getitem__(self, column: str) -> ColumnStats:
+        """Statistics for one column."""
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        """Whether a column is tracked."""
+        return column in self.columns
@@ -0,0 +1,92 @@
+"""Weighted (importance-sampling) estimators."""
+
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def weighted_mean(values: np.ndarray, weights: np.ndarray) -> float:
+    """
+    Self-normalized weighted mean.
+
+    Args:
+        values: Observations
+        weights: Likelihood-ratio weight of each observation
+
+    Returns:
+        sum(w * x) / sum(w)
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    return float((weights * values).sum() / weights.sum())
+
+
+def weighted_std(values: np.ndarray, weights: np.ndarray) -> float:
+    """
+    Self-normalized weighted standard deviation.
+
+    Args:
+        values: Observations
+        weights: Likelihood-ratio weight of each observation
+
+    Returns:
+        Standard deviation under the weighted distribution
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    mean = weighted_mean(values, weights)
+    return float(np.sqrt((weights * (values - mean) ** 2).sum() / weights.sum()))
+
+
+def weighted_quantile(values: np.ndarray, weights: np.ndarray, q: float) -> float:
+    """
+    Quantile of the weighted empirical distribution.
+
+    Returns the smallest value whose cumulative normalized weight reaches q.
+
+    Args:
+        values: Observations
+        weights: Likelihood-ratio weight of each observation
+        q: Quantile in [0, 1]
+
+    Returns:
+        Estimated quantile
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    order = np.argsort(values, kind='stable')
+    cumulative = np.cumsum(weights[order])
+    index = np.searchsorted(cumulative, q * cumulative[-1], side='left')
+    return float(values[order[min(index, len(values) - 1)]])
+
+
+def weighted_fraction_above(values: np.ndarray, weights: np.ndarray, threshold: float) -> float:
+    """
+    Weighted probability that a value exceeds a threshold.
+
+    Args:
+        values: Observations
+        weights: Likelihood-ratio weight of each observation
+        threshold: Threshold value
+
+    Returns:
+        Probability (0-1)
+    """
+    values = np.asarray(values, dtype=float)
+    weights = np.asarray(weights, dtype=float)
+    return float(weights[values > threshold].sum() / weights.sum())
+
+
+def effective_sample_size(weights: np.ndarray) -> float:
+    """
+    Kish effective sample size of a set of weights.
+
+    Args:
+        weights: Likelihood-ratio weights
+
+    Returns:
+        (sum w)^2 / sum w^2
+    """
+    weights = np.asarray(weights, dtype=float)
+    return float(weights.sum() ** 2 / (weights ** 2).sum())
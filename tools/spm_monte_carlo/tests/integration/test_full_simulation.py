@@ -1,9 +1,13 @@
 """Integration tests for complete simulation workflows."""
 
+import json
 import pytest
+import numpy as np
 import pandas as pd
 
-from spm_monte_carlo import MonteCarloSimulator
+from spm_monte_carlo import MonteCarloSimulator, CompensationPlan
+from spm_monte_carlo.simulation import SimulationResults, SimulationExecutor
+from spm_monte_carlo.exceptions import ConvergenceError, ConfigurationError
 
 
 class TestFullSimulation:
@@ -59,3 +63,450 @@ class TestFullSimulation:
 
         assert results is not None
         assert len(results.scenarios) > 0
+
+    def test_parallel_run_matches_serial(self, sample_historical_data, sample_compensation_plan):
+        """Test process-pool execution reproduces the serial results exactly."""
+        serial = MonteCarloSimulator(seed=42, parallel=False, block_size=16) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .run(iterations=100)
+
+        parallel = MonteCarloSimulator(
+            seed=42, parallel=True, workers=2, block_size=16, parallel_min_rows=0
+        ) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .run(iterations=100)
+
+        assert parallel.metadata['execution']['backend'] == 'process_pool'
+        pd.testing.assert_frame_equal(serial.scenarios, parallel.scenarios)
+
+    def test_memory_limit_caps_rows_kept_in_memory(self, sample_historical_data, sample_compensation_plan):
+        """Test an in-memory run too large for memory_limit_mb raises instead of allocating."""
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        # 10,000 scenarios x 10 reps keep ~7 MB of columns
+        with pytest.raises(ConfigurationError, match='memory_limit_mb=1'):
+            sim.run(iterations=10000, memory_limit_mb=1)
+        with pytest.raises(ConfigurationError, match='memory_limit_mb=1'):
+            sim.run(iterations=10000, memory_limit_mb=1, target_precision=1e-9)
+
+        streamed = sim.run(iterations=10000, memory_limit_mb=1, streaming=True)
+        assert streamed.metadata['execution']['batches'] > 1
+        assert sim.run(iterations=1000, memory_limit_mb=1).n_rows == 10000
+
+    def test_benchmark_times_the_run_pipeline(self, sample_historical_data, sample_compensation_plan):
+        """Test benchmark sets up inputs like run() and times both backends."""
+        sim = MonteCarloSimulator(seed=42, workers=2, block_size=16) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        timing = sim.benchmark(iterations=100)
+
+        assert sim._correlation_matrix is not None
+        assert timing['workers'] == 2
+        assert timing['speedup'] == pytest.approx(
+            timing['serial_seconds'] / timing['parallel_seconds']
+        )
+
+    def test_small_parallel_run_stays_serial(self, sample_historical_data, sample_compensation_plan):
+        """Test batches below parallel_min_rows do not start worker processes."""
+        results = MonteCarloSimulator(seed=42, parallel=True, workers=2, block_size=16) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .run(iterations=100)
+
+        assert results.metadata['execution']['backend'] == 'serial'
+        assert results.metadata['execution']['workers'] == 1
+
+    def test_batched_run_matches_single_batch(self, sample_historical_data, sample_compensation_plan):
+        """Test batch_size changes memory use, not results."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=10) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        single = sim.run(iterations=100)
+        batched = sim.run(iterations=100, batch_size=20)
+
+        assert single.metadata['execution']['batches'] == 1
+        assert batched.metadata['execution']['batches'] == 5
+        pd.testing.assert_frame_equal(single.scenarios, batched.scenarios)
+
+    def test_float32_results_are_compact(self, sample_historical_data, sample_compensation_plan):
+        """Test float32 precision halves result columns and keeps the answers."""
+        full = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .run(iterations=100)
+        compact = MonteCarloSimulator(seed=42, parallel=False, precision='float32') \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .run(iterations=100)
+
+        assert compact.scenarios['total_payout'].dtype == np.float32
+        assert compact.scenarios['scenario_id'].dtype == np.int32
+        assert isinstance(compact.scenarios['rep_id'].dtype, pd.CategoricalDtype)
+        assert compact.risk_metrics['expected_payout'] == pytest.approx(
+            full.risk_metrics['expected_payout'], rel=1e-5
+        )
+
+    def test_output_path_writes_memory_mapped_scenarios(
+        self, tmp_path, sample_historical_data, sample_compensation_plan
+    ):
+        """Test output_path spills scenarios to .npy files read back lazily."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=20) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        in_memory = sim.run(iterations=100)
+        on_disk = sim.run(iterations=100, batch_size=40, output_path=tmp_path / 'run')
+
+        assert (tmp_path / 'run' / 'total_payout.npy').exists()
+        assert isinstance(on_disk.source.column('total_payout'), np.memmap)
+        assert on_disk.n_rows == len(in_memory.scenarios)
+
+        reopened = SimulationResults.open(tmp_path / 'run')
+        assert reopened.metadata['execution']['batches'] == 3
+        assert reopened.var(0.95) == in_memory.var(0.95)
+        assert list(reopened.scenarios['rep_id']) == list(in_memory.scenarios['rep_id'])
+        assert reopened.profile == on_disk.profile
+        assert reopened.profile['compute']['rows'] == on_disk.n_rows
+
+    def test_control_variate_tightens_expected_payout(
+        self, sample_historical_data, sample_compensation_plan
+    ):
+        """Test the quota-attainment control variate shrinks the standard error."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, sampling_strategy='antithetic') \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+        results = sim.run(iterations=200)
+
+        estimate = results.control_variate_estimate()
+
+        sampled = sim._fitted_distributions['quota_attainment'].sampling_distribution
+        assert results.metadata['control_means']['quota_attainment'] == sampled.mean()
+        assert estimate['std_error'] < estimate['naive_std_error']
+        assert estimate['estimate'] == pytest.approx(
+            estimate['naive_estimate'], abs=3 * estimate['naive_std_error']
+        )
+
+    def test_importance_sampling_weights_tail_metrics(
+        self, sample_historical_data, sample_compensation_plan
+    ):
+        """Test tilted runs put more draws in the tail and reweight them."""
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        plain = sim.run(iterations=400)
+        tilted = sim.run(iterations=400, importance_shift=2.0)
+
+        weights = tilted.scenarios['weight']
+        threshold = plain.var(0.99)
+        assert (tilted.scenarios['total_payout'] > threshold).mean() > 0.1
+        assert weights.mean() == pytest.approx(1.0, abs=0.3)
+        assert tilted.prob_exceed(threshold) == pytest.approx(0.01, abs=0.01)
+        assert tilted.var(0.99) == pytest.approx(plain.var(0.99), rel=0.1)
+        assert tilted.risk_metrics['expected_payout'] == pytest.approx(
+            plain.risk_metrics['expected_payout'], rel=0.1
+        )
+        assert tilted.metadata['importance_sampling']['shift'] == 2.0
+        assert tilted.weights is tilted.weights
+        assert 'weight' not in tilted.summary().index
+
+    def test_lhs_design_shrinks_replicate_error(self, sample_historical_data, sample_compensation_plan):
+        """Test whole-matrix LHS beats plain draws on the replicate error."""
+        errors = {}
+        for strategy in ['monte_carlo', 'lhs']:
+            results = MonteCarloSimulator(
+                seed=42, parallel=False, sampling_strategy=strategy, block_size=32
+            ).load_data(sample_historical_data) \
+             .load_plan(sample_compensation_plan) \
+             .run(iterations=256)
+            estimate = results.replicate_estimate()
+            assert estimate['replicates'] == 8
+            errors[strategy] = estimate['std_error']
+
+        assert errors['lhs'] < errors['monte_carlo'] / 2
+
+    def test_multi_period_run_times_payouts(self, sample_historical_data, sample_compensation_plan):
+        """Test period tensors roll up to annual totals with quarterly bonus timing."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=32) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        periodic = sim.run_periods(iterations=64, periods=12)
+
+        n_reps = sample_historical_data['rep_id'].nunique()
+        assert periodic.payouts['total_payout'].shape == (64, n_reps, 12)
+
+        bonuses = periodic.period_totals('bonuses')
+        quarter_ends = [2, 5, 8, 11]
+        assert bonuses[:, quarter_ends].sum() > 0
+        assert np.all(np.delete(bonuses, quarter_ends, axis=1) == 0)
+
+        timing = periodic.payout_timing()
+        assert len(timing) == 12
+        assert timing['cumulative_mean'].iloc[-1] == pytest.approx(
+            periodic.period_totals().sum(axis=1).mean()
+        )
+
+        annual = periodic.annual_results()
+        assert len(annual.scenarios) == 64 * n_reps
+        assert annual.scenarios['total_payout'].sum() == pytest.approx(
+            periodic.payouts['total_payout'].sum()
+        )
+
+    def test_compare_plans_on_common_scenarios(self, sample_historical_data, sample_compensation_plan):
+        """Test plans share draws so paired differences are tight."""
+        richer = CompensationPlan('RICHER')
+        richer.commission_tiers = list(sample_compensation_plan.commission_tiers)
+        richer.add_bonus('100% Club', 'quota_attainment >= 1.0', 6000, 'quarterly')
+
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        comparison = sim.compare([sample_compensation_plan, richer], iterations=100)
+        single = sim.run(iterations=100)
+
+        baseline = comparison.totals[sample_compensation_plan.plan_id]
+        expected = single.scenarios.groupby('scenario_id')['total_payout'].sum()
+        assert np.allclose(baseline.to_numpy(), expected.to_numpy())
+
+        diff = comparison.differences().loc['RICHER']
+        assert diff['mean_difference'] > 0
+        assert diff['ci_lower'] <= diff['mean_difference'] <= diff['ci_upper']
+        assert diff['std_error'] < diff['unpaired_std_error'] / 5
+
+    def test_compare_needs_distinct_plans(self, sample_historical_data, sample_compensation_plan):
+        """Test comparing a plan with itself is rejected."""
+        sim = MonteCarloSimulator(seed=42, parallel=False).load_data(sample_historical_data)
+
+        with pytest.raises(ConfigurationError, match="distinct plan_ids"):
+            sim.compare([sample_compensation_plan, sample_compensation_plan], iterations=10)
+
+    def test_sweep_evaluates_grid_on_shared_scenarios(
+        self, sample_historical_data, sample_compensation_plan
+    ):
+        """Test the sweep point equal to the loaded plan reproduces run()."""
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        sweep = sim.sweep({'Tier 4.rate_value': [0.04, 0.06, 0.08]}, iterations=100)
+        single = sim.run(iterations=100)
+
+        summary = sweep.summary()
+        assert len(summary) == 3
+        assert summary['expected_cost'].is_monotonic_increasing
+
+        expected = single.scenarios.groupby('scenario_id')['total_payout'].sum()
+        assert np.allclose(sweep.totals[1], expected.to_numpy())
+        assert summary['expected_payout'].iloc[1] == pytest.approx(
+            single.risk_metrics['expected_payout']
+        )
+
+    def test_optimizer_hits_target_cost(self, sample_historical_data, sample_compensation_plan):
+        """Test the search finds monotonic rates at the target cost within budget."""
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        base = sim.sweep({'Tier 4.rate_value': [0.06]}, iterations=200).summary().iloc[0]
+        # Tiers 3 and 4 only pay on sales above quota, so their rates move cost little
+        target = base['expected_cost'] * 1.02
+
+        result = sim.optimize(
+            {'Tier 3.rate_value': (0.03, 0.08), 'Tier 4.rate_value': (0.04, 0.12)},
+            target_cost=target,
+            var_95_budget=base['cost_var_95'] * 1.1,
+            iterations=200,
+            population=32,
+            max_rounds=15
+        )
+
+        assert result.feasible
+        assert result.expected_cost == pytest.approx(target, rel=0.01)
+        rates = [tier.rate_value for tier in result.plan.commission_tiers]
+        assert rates == sorted(rates)
+        assert sample_compensation_plan.commission_tiers[3].rate_value == 0.06
+
+    def test_optimizer_ignores_flat_tiers_in_rate_order(self, sample_historical_data):
+        """Test a flat-dollar tier between percentage tiers is not ranked against their rates."""
+        plan = CompensationPlan('FLAT_MIDDLE')
+        plan.add_commission_tier(0, 1.0, rate=0.03, tier_name='T1')
+        plan.add_commission_tier(1.0, 1.2, rate=500, rate_type='flat', tier_name='T2')
+        plan.add_commission_tier(1.2, 10, rate=0.05, tier_name='T3')
+
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(plan)
+
+        target = sim.sweep({'T3.rate_value': [0.08]}, iterations=200).summary().iloc[0]['expected_cost']
+
+        result = sim.optimize(
+            {'T3.rate_value': (0.03, 0.12)},
+            target_cost=target,
+            iterations=200,
+            population=32,
+            max_rounds=15
+        )
+
+        assert result.feasible
+        assert result.expected_cost == pytest.approx(target, rel=0.01)
+
+    def test_cached_scenarios_serve_plan_only_changes(
+        self, sample_historical_data, sample_compensation_plan
+    ):
+        """Test a rerun with a new plan reuses cached draws and matches a fresh run."""
+        richer = CompensationPlan('RICHER')
+        richer.add_commission_tier(0, 10, rate=0.05)
+
+        sim = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan) \
+            .enable_cache()
+        sim.run(iterations=100)
+        cached = sim.load_plan(richer).run(iterations=100)
+
+        assert sim._cache.hits == sim._cache.misses == 1
+
+        fresh = MonteCarloSimulator(seed=42, parallel=False) \
+            .load_data(sample_historical_data) \
+            .load_plan(richer) \
+            .run(iterations=100)
+        assert np.array_equal(cached.scenarios['total_payout'], fresh.scenarios['total_payout'])
+
+    def test_resume_from_checkpoint_is_bit_identical(
+        self, sample_historical_data, sample_compensation_plan, tmp_path, monkeypatch
+    ):
+        """Test a run killed mid-way resumes to exactly the uninterrupted results."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=25) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+        uninterrupted = sim.run(iterations=100, batch_size=25)
+
+        run_batch = SimulationExecutor.run
+        calls = []
+
+        def crash_on_third_batch(self, *args, **kwargs):
+            calls.append(1)
+            if len(calls) == 3:
+                raise RuntimeError("worker lost")
+            return run_batch(self, *args, **kwargs)
+
+        checkpoint = tmp_path / 'run.ckpt'
+        monkeypatch.setattr(SimulationExecutor, 'run', crash_on_third_batch)
+        with pytest.raises(RuntimeError):
+            sim.run(
+                iterations=100, batch_size=25,
+                output_path=tmp_path / 'run', checkpoint_path=checkpoint
+            )
+        monkeypatch.undo()
+
+        assert checkpoint.exists()
+        resumed = MonteCarloSimulator(parallel=False).resume(checkpoint)
+
+        assert not checkpoint.exists()
+        assert resumed.metadata['execution']['batches'] == 4
+        assert np.array_equal(
+            resumed.scenarios['total_payout'], uninterrupted.scenarios['total_payout']
+        )
+
+    def test_checkpoints_stay_bounded(self, sample_historical_data, sample_compensation_plan, tmp_path):
+        """Test checkpoints do not grow with the rows a run has produced."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=25) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        with pytest.raises(ConfigurationError, match='checkpoint_path'):
+            sim.run(iterations=100, checkpoint_path=tmp_path / 'memory.ckpt')
+
+        for name, options in [
+            ('memmap', {'output_path': tmp_path / 'run'}),
+            ('streaming', {'streaming': True})
+        ]:
+            checkpoint = tmp_path / f'{name}.ckpt'
+            sizes = []
+
+            def record_size(progress):
+                # The checkpoint of the previous batch is on disk
+                if checkpoint.exists():
+                    sizes.append(checkpoint.stat().st_size)
+
+            sim.run(
+                iterations=400, batch_size=25, checkpoint_path=checkpoint,
+                progress_callback=record_size, **options
+            )
+
+            assert len(sizes) == 15
+            assert max(sizes) < 1.5 * min(sizes), name
+
+    def test_run_reports_stage_profile_and_progress(self, sample_historical_data, sample_compensation_plan):
+        """Test every run records per-stage timings and reports batch progress."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=25) \
+            .load_data(sample_historical_data) \
+            .fit_distributions() \
+            .load_plan(sample_compensation_plan)
+
+        progress = []
+        results = sim.run(iterations=100, batch_size=25, progress_callback=progress.append)
+
+        assert [p['batch'] for p in progress] == [1, 2, 3, 4]
+        assert progress[-1]['done'] and not progress[0]['done']
+        assert progress[-1]['rows'] == progress[-1]['total_rows'] == results.n_rows
+
+        profile = results.profile
+        assert list(profile)[:3] == ['load', 'validate', 'fit']
+        for stage in ['sample', 'compute', 'aggregate']:
+            assert profile[stage]['rows'] == results.n_rows
+            assert profile[stage]['wall_seconds'] > 0
+        assert 'stages' not in results.metadata['execution']
+        assert json.loads(results.profile_json())['compute']['calls'] == 4
+
+    def test_streaming_results_match_full_results(self, sample_historical_data, sample_compensation_plan):
+        """Test streaming mode answers risk metrics without keeping rows."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=50) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        full = sim.run(iterations=200)
+        streaming = sim.run(iterations=200, batch_size=50, streaming=True)
+
+        assert streaming.is_streaming
+        assert streaming.n_rows == len(full.scenarios)
+        assert streaming.risk_metrics['expected_payout'] == pytest.approx(
+            full.risk_metrics['expected_payout'], rel=1e-9
+        )
+        assert streaming.var(0.95) == pytest.approx(full.var(0.95), rel=0.01)
+        assert streaming.cvar(0.95) == pytest.approx(full.cvar(0.95), rel=0.01)
+        assert 'total_payout' in streaming.summary().index
+
+    def test_adaptive_run_stops_at_target_precision(self, sample_historical_data, sample_compensation_plan):
+        """Test target_precision stops early and reports convergence."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=20) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        results = sim.run(target_precision=0.05, max_iterations=5000)
+        convergence = results.metadata['convergence']
+
+        assert convergence['converged']
+        assert convergence['iterations'] < 5000
+        assert len(results.scenarios) == convergence['iterations'] * 10
+        assert max(convergence['precision'].values()) <= 0.05
+
+    def test_adaptive_run_raises_at_cap(self, sample_historical_data, sample_compensation_plan):
+        """Test ConvergenceError when the cap is hit first."""
+        sim = MonteCarloSimulator(seed=42, parallel=False, block_size=20) \
+            .load_data(sample_historical_data) \
+            .load_plan(sample_compensation_plan)
+
+        with pytest.raises(ConvergenceError) as excinfo:
+            sim.run(target_precision=1e-6, max_iterations=400)
+
+        assert excinfo.value.iterations == 400
+        assert excinfo.value.precision['expected_payout'] > 1e-6
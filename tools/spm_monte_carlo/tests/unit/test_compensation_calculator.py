@@ -1,10 +1,16 @@
 """Unit tests for compensation calculator."""
 
+import copy
 import pytest
+import numpy as np
 import pandas as pd
 
 from spm_monte_carlo.compensation.plan import CompensationPlan
 from spm_monte_carlo.compensation.engine import CompensationEngine
+from spm_monte_carlo.compensation.periodic import PeriodicEngine
+from spm_monte_carlo.compensation.sweep import TierSweep
+from spm_monte_carlo.compensation.calculator import TierCalculator
+from spm_monte_carlo.compensation.formula import Formula
 
 
 class TestCompensationCalculator:
@@ -89,3 +95,349 @@ class TestCompensationCalculator:
         assert results.loc[0, 'commission'] > 0
         assert results.loc[0, 'bonuses'] == 5000  # 100% Club
         assert results.loc[0, 'total_payout'] > 5000
+
+    def test_batch_matches_per_scenario_evaluation(self, sample_compensation_plan):
+        """Test the single-pass batch equals evaluating each scenario alone."""
+        rng = np.random.default_rng(0)
+        quota = rng.uniform(50_000, 150_000, 60)
+        scenarios = pd.DataFrame({
+            'scenario_id': np.repeat([2, 0, 1], 20),
+            'rep_id': np.tile([f"REP{i:03d}" for i in range(20)], 3),
+            'quota': quota,
+            'actual_sales': quota * rng.uniform(0.5, 1.5, 60)
+        })
+        engine = CompensationEngine(sample_compensation_plan)
+
+        batch = engine.calculate_batch(scenarios, group_by='scenario_id')
+
+        expected = pd.concat(
+            [engine.calculate(group) for _, group in scenarios.groupby('scenario_id')],
+            ignore_index=True
+        )
+        pd.testing.assert_frame_equal(batch, expected)
+
+    def test_array_api_writes_into_buffers(self, sample_compensation_plan):
+        """Test calculate_arrays fills caller buffers and matches calculate."""
+        sample_compensation_plan.add_spif('Deal Blitz', 'deal_count', 10, 1000)
+        performance = pd.DataFrame({
+            'rep_id': ['REP001', 'REP002', 'REP003'],
+            'actual_sales': [60000.0, 100000.0, 140000.0],
+            'quota': [100000.0, 100000.0, 100000.0],
+            'deal_count': [12, 4, 10]
+        })
+        engine = CompensationEngine(sample_compensation_plan)
+        out = {'commission': np.empty(3), 'total_payout': np.empty(3)}
+
+        payouts = engine.calculate_arrays(
+            performance['actual_sales'].to_numpy(),
+            performance['quota'].to_numpy(),
+            metrics={'deal_count': performance['deal_count'].to_numpy()},
+            out=out
+        )
+
+        expected = engine.calculate(performance)
+        assert payouts['commission'] is out['commission']
+        assert payouts['total_payout'] is out['total_payout']
+        for component in ['commission', 'bonuses', 'spifs', 'total_payout']:
+            assert np.array_equal(payouts[component], expected[component])
+        assert payouts['bonuses'].tolist() == [0, 5000, 5000]
+        assert payouts['spifs'].tolist() == [1000, 0, 1000]
+
+
+class TestCompiledTiers:
+    """Test suite for compiled commission schedules."""
+
+    def test_compiled_schedule_keeps_lower_bands(self):
+        """Test marginal bands carry over gaps, with step tiers on top."""
+        plan = CompensationPlan('TEST_PLAN')
+        plan.add_commission_tier(0.5, 0.9, rate=0.02)
+        plan.add_commission_tier(1.0, 1.2, rate=500, rate_type='flat')
+        plan.add_commission_tier(1.2, 1.5, rate=0.01, applies_to='quota')
+
+        compiled = plan.compile()
+        quota = np.full(6, 1000.0)
+        actual_sales = np.array([400.0, 900.0, 950.0, 1100.0, 1300.0, np.nan])
+        out = np.empty(6)
+
+        commission = compiled.commission(quota, actual_sales, out=out)
+
+        assert commission is out
+        assert compiled.breakpoints.tolist() == [0.5, 0.9, 1.0, 1.2, 1.5]
+        assert compiled.cumulative.tolist() == pytest.approx([0, 0.008, 0.008, 0.008, 0.008])
+        assert commission.tolist() == pytest.approx([0, 8, 8, 508, 18, 0])
+
+    def test_compiled_schedule_is_cached_until_tiers_change(self, sample_compensation_plan):
+        """Test repeated compiles reuse one schedule and tier edits rebuild it."""
+        plan = sample_compensation_plan
+        compiled = plan.compile()
+        assert plan.compile() is compiled
+
+        plan.commission_tiers[3].rate_value = 0.08
+        edited = plan.compile()
+        assert edited is not compiled
+        assert edited.slope[-2] == pytest.approx(0.08)
+
+        plan.add_commission_tier(10, 20, rate=0.1)
+        assert plan.compile() is not edited
+
+    def test_retroactive_and_incremental_tiers(self):
+        """Test a retroactive tier pays on all sales and a kicker on its band."""
+        plan = CompensationPlan('TEST_PLAN')
+        plan.add_commission_tier(0, 1.0, rate=0.02)
+        plan.add_commission_tier(1.0, 10, rate=0.05, retroactive=True)
+        plan.add_commission_tier(1.2, 10, rate=0.01, applies_to='incremental_sales')
+
+        commission = plan.compile().commission(
+            np.full(3, 1000.0), np.array([900.0, 1100.0, 1300.0])
+        )
+
+        assert commission.tolist() == pytest.approx([18, 20 + 55, 20 + 65 + 1])
+        with pytest.raises(ValueError, match="retroactive"):
+            plan.add_commission_tier(0, 1, rate=0.01, applies_to='quota', retroactive=True)
+
+    def test_compiled_schedule_matches_tier_loop(self, sample_compensation_plan):
+        """Test the compiled kernel reproduces per-tier marginal evaluation."""
+        rng = np.random.default_rng(0)
+        quota = rng.uniform(50_000, 150_000, 1000)
+        actual_sales = quota * rng.uniform(0, 2, 1000)
+
+        commission = sample_compensation_plan.compile().commission(quota, actual_sales)
+
+        expected = np.zeros(1000)
+        for tier in sample_compensation_plan.commission_tiers:
+            expected += tier.rate_value * np.clip(
+                actual_sales - quota * tier.quota_min,
+                0, quota * (tier.quota_max - tier.quota_min)
+            )
+        assert np.allclose(commission, expected)
+
+
+class TestFormula:
+    """Test suite for formula payouts."""
+
+    def test_formula_bonus_pays_per_row(self):
+        """Test a formula bonus is evaluated on each triggered row's metrics."""
+        plan = CompensationPlan('TEST_PLAN')
+        plan.add_bonus(
+            'Overachievement', 'quota_attainment >= 1.0',
+            '0.05 * min(actual_sales - quota, 20000) + 10 * deal_count',
+            payout_type='formula'
+        )
+        performance = pd.DataFrame({
+            'rep_id': ['REP001', 'REP002', 'REP003'],
+            'actual_sales': [90000.0, 110000.0, 150000.0],
+            'quota': [100000.0, 100000.0, 100000.0],
+            'deal_count': [5, 8, 12]
+        })
+
+        results = CompensationEngine(plan).calculate(performance)
+
+        assert results['bonuses'].tolist() == pytest.approx([0, 580, 1120])
+
+    @pytest.mark.parametrize('expression', [
+        '__import__("os").system("ls")',
+        'actual_sales.sum()',
+        'quota if actual_sales else 0',
+        'round(actual_sales)',
+        'min(quota)'
+    ])
+    def test_unsafe_or_invalid_formula_rejected(self, expression):
+        """Test formulas outside the expression language fail when added."""
+        plan = CompensationPlan('TEST_PLAN')
+        with pytest.raises(ValueError, match="Invalid formula"):
+            plan.add_bonus('Bad', 'quota_attainment >= 1.0', expression, payout_type='formula')
+
+    def test_unsupported_formula_quotes_source_without_unparse(self, monkeypatch):
+        """Test rejection names the offending expression on Pythons without ast.unparse."""
+        import ast
+
+        monkeypatch.delattr(ast, 'unparse', raising=False)
+
+        with pytest.raises(ValueError, match="'quota if actual_sales else 0' is not supported"):
+            Formula('quota if actual_sales else 0')
+
+    def test_blank_excel_payout_type_loads_as_flat(self, monkeypatch):
+        """Test a bonus row with an empty payout_type cell loads as flat."""
+        from spm_monte_carlo.data.loader import ExcelDataLoader
+
+        sheets = {
+            'overview': pd.DataFrame([{'plan_id': 'P1', 'plan_name': 'Plan'}]),
+            'bonuses': pd.DataFrame([{
+                'bonus_name': 'Club', 'trigger_metric': 'quota_attainment',
+                'trigger_condition': '>=', 'trigger_value': 1.0,
+                'payout_type': np.nan, 'payout_value': 5000, 'frequency': 'annual'
+            }])
+        }
+        monkeypatch.setattr(
+            ExcelDataLoader, 'load_compensation_plan',
+            staticmethod(lambda file_path, plan_id=None: sheets)
+        )
+
+        plan = CompensationPlan.from_excel('plan.xlsx')
+
+        assert plan.bonuses[0].payout_type == 'flat'
+
+    @pytest.mark.parametrize('cell, expected', [
+        (True, True), (np.bool_(False), False), (1, True), (0.0, False),
+        ('TRUE', True), ('FALSE', False), ('yes', True), ('no', False),
+        ('0', False), (np.nan, False), ('maybe', ValueError)
+    ])
+    def test_excel_retroactive_cell_parsing(self, monkeypatch, cell, expected):
+        """Test retroactive cells parse explicitly instead of by truthiness."""
+        from spm_monte_carlo.data.loader import ExcelDataLoader
+
+        sheets = {
+            'overview': pd.DataFrame([{'plan_id': 'P1', 'plan_name': 'Plan'}]),
+            'commission_tiers': pd.DataFrame([{
+                'tier_name': 'Tier 1', 'quota_min': 0.0, 'quota_max': 10.0,
+                'rate_type': 'percentage', 'rate_value': 0.05,
+                'applies_to': 'total_sales', 'retroactive': cell
+            }], dtype=object)
+        }
+        monkeypatch.setattr(
+            ExcelDataLoader, 'load_compensation_plan',
+            staticmethod(lambda file_path, plan_id=None: sheets)
+        )
+
+        if expected is ValueError:
+            with pytest.raises(ValueError, match="retroactive"):
+                CompensationPlan.from_excel('plan.xlsx')
+        else:
+            plan = CompensationPlan.from_excel('plan.xlsx')
+            assert plan.commission_tiers[0].retroactive is expected
+
+
+class TestPeriodicEngine:
+    """Test suite for multi-period evaluation."""
+
+    def test_quarterly_bonus_uses_quarter_totals(self):
+        """Test a quarterly bonus pays in the quarter's last month on summed sales."""
+        plan = CompensationPlan('TEST_PLAN')
+        plan.add_bonus('Quarter Club', 'quota_attainment >= 1.0', 3000, frequency='quarterly')
+
+        # One rep: a strong first quarter, a weak rest of the year
+        sales = np.array([[[120, 90, 95] + [80] * 9]], dtype=float)
+        tensors = {'quota': np.full(sales.shape, 100.0), 'actual_sales': sales}
+
+        payouts = PeriodicEngine(plan, periods_per_year=12).calculate(tensors)
+
+        expected = np.zeros(12)
+        expected[2] = 3000
+        assert np.array_equal(payouts['bonuses'][0, 0], expected)
+
+    def test_commission_paid_at_plan_frequency(self):
+        """Test tiers evaluate per window and matching totals for monthly and annual."""
+        sales = np.random.default_rng(0).uniform(50, 150, size=(5, 3, 12))
+        tensors = {'quota': np.full(sales.shape, 100.0), 'actual_sales': sales}
+        totals = {}
+
+        for frequency in ['monthly', 'annual']:
+            plan = CompensationPlan('TEST_PLAN', frequency=frequency)
+            plan.add_commission_tier(0, 10, rate=0.05)
+            payouts = PeriodicEngine(plan).calculate(tensors)
+            totals[frequency] = payouts['commission'].sum(axis=-1)
+
+            if frequency == 'annual':
+                assert np.all(payouts['commission'][..., :-1] == 0)
+
+        assert np.allclose(totals['monthly'], totals['annual'])
+        assert np.allclose(totals['annual'], 0.05 * sales.sum(axis=-1))
+
+    def test_frequency_finer_than_periods_rejected(self):
+        """Test monthly payouts cannot be evaluated on quarterly periods."""
+        plan = CompensationPlan('TEST_PLAN')
+        with pytest.raises(ValueError, match="Cannot pay monthly"):
+            PeriodicEngine(plan, periods_per_year=4).window('monthly')
+
+
+class TestTierSweep:
+    """Test suite for broadcast tier sweeps."""
+
+    def test_sweep_matches_tier_calculator(self, sample_compensation_plan):
+        """Test every variant equals the row-wise calculator on that plan."""
+        rng = np.random.default_rng(0)
+        performance = pd.DataFrame({
+            'quota': np.full(200, 100000.0),
+            'actual_sales': rng.uniform(30000, 160000, 200)
+        })
+        points = TierSweep.grid({'Tier 4.rate_value': [0.06, 0.08]})
+
+        commission = TierSweep(sample_compensation_plan.commission_tiers).calculate(
+            performance['quota'], performance['actual_sales'], points
+        )
+
+        for i, rate in enumerate([0.06, 0.08]):
+            tiers = copy.deepcopy(sample_compensation_plan.commission_tiers)
+            tiers[3].rate_value = rate
+            expected = TierCalculator.calculate(performance, tiers)
+            assert np.allclose(commission[i], expected)
+
+    def test_grid_links_shared_breakpoints(self):
+        """Test a tuple key moves several parameters together."""
+        points = TierSweep.grid({
+            ('Tier 3.quota_max', 'Tier 4.quota_min'): [1.2, 1.3],
+            'Tier 4.rate_value': [0.05, 0.06, 0.07]
+        })
+
+        assert len(points) == 6
+        assert (points['Tier 3.quota_max'] == points['Tier 4.quota_min']).all()
+
+    def test_unknown_parameter_rejected(self, sample_compensation_plan):
+        """Test a misspelled tier parameter raises."""
+        sweep = TierSweep(sample_compensation_plan.commission_tiers)
+        with pytest.raises(ValueError, match="Unknown sweep parameter"):
+            sweep.parameter_arrays(pd.DataFrame({'Tier 9.rate_value': [0.1]}))
+
+    def test_inverted_band_matches_compiled_engine(self, sample_compensation_plan):
+        """Test a swept point with quota_max < quota_min pays nothing for that tier."""
+        rng = np.random.default_rng(0)
+        quota = rng.uniform(50_000, 150_000, 500)
+        actual_sales = quota * rng.uniform(0, 2, 500)
+        sweep = TierSweep(sample_compensation_plan.commission_tiers)
+
+        commission = sweep.calculate(
+            quota, actual_sales, pd.DataFrame({'Tier 3.quota_max': [0.9]})
+        )[0]
+
+        inverted = copy.deepcopy(sample_compensation_plan)
+        inverted.commission_tiers[2].quota_max = 0.9
+        assert (commission >= 0).all()
+        assert np.allclose(commission, inverted.compile().commission(quota, actual_sales))
+
+    def test_sweep_parity_with_tier_calculator(self):
+        """Test swept variants of mixed tier types pay what TierCalculator pays, NaN rows included."""
+        plan = CompensationPlan('MIXED')
+        plan.add_commission_tier(0, 1.0, rate=0.02, tier_name='Base')
+        plan.add_commission_tier(1.0, 1.5, rate=0.03, tier_name='Growth',
+                                 applies_to='incremental_sales')
+        plan.add_commission_tier(1.5, 10, rate=0.05, tier_name='Club', retroactive=True)
+        plan.add_commission_tier(0.8, 1.2, rate=0.01, tier_name='Quota', applies_to='quota')
+        plan.add_commission_tier(1.2, 10, rate=500, tier_name='Kicker', rate_type='flat')
+
+        rng = np.random.default_rng(3)
+        performance = pd.DataFrame({
+            'quota': rng.uniform(50_000, 150_000, 400),
+            'actual_sales': rng.uniform(0, 250_000, 400)
+        })
+        performance.loc[:9, 'actual_sales'] = np.nan
+        performance.loc[10:19, 'quota'] = np.nan
+
+        points = TierSweep.grid({
+            ('Base.quota_max', 'Growth.quota_min'): [0.9, 1.1],
+            'Club.rate_value': [0.04, 0.07],
+            'Kicker.quota_min': [1.1, 1.3]
+        })
+        commission = TierSweep(plan.commission_tiers).calculate(
+            performance['quota'], performance['actual_sales'], points
+        )
+
+        for i, point in points.iterrows():
+            tiers = copy.deepcopy(plan.commission_tiers)
+            by_name = {tier.tier_name: tier for tier in tiers}
+            for column, value in point.items():
+                tier_name, _, field = column.rpartition('.')
+                setattr(by_name[tier_name], field, value)
+
+            expected = TierCalculator.calculate(performance, tiers).to_numpy()
+            assert np.array_equal(commission[i], expected)
+            assert not np.isnan(commission[i]).any()
@@ -54,3 +54,44 @@ class TestDistributionFitter:
 
         # Without outliers should have better fit (lower std dev)
         assert result_without_outliers.params['scale'] < result_with_outliers.params['scale']
+
+    @pytest.mark.parametrize('family, source, ceiling', [
+        ('beta', stats.beta(5, 3, 0, 2), 1e-6),
+        ('gamma', stats.gamma(2, 0, 5), 1e-6),
+        ('lognormal', stats.lognorm(0.5, 0, 20000), 5e-6),
+        ('lognormal', stats.lognorm(1.0, 0, 20000), 2e-5)
+    ])
+    def test_inverse_cdf_table_within_reported_error(self, family, source, ceiling):
+        """Test table lookups match scipy's ppf within the measured bound and a fixed ceiling."""
+        data = source.rvs(500, random_state=0)
+
+        result = DistributionFitter().fit(data, family, inverse_cdf_table=True)
+        table = result.inverse_cdf
+
+        u = np.random.default_rng(1).uniform(1e-6, 1 - 1e-6, 10_000)
+        exact = result.distribution.ppf(u)
+        approx = table.ppf(u)
+        error = np.abs(approx - exact)
+
+        assert result.sampling_distribution is table
+        assert table.max_rel_error < ceiling
+        assert error.max() / result.distribution.std() < ceiling
+        assert np.all(error <= table.max_abs_error * 1.01 + 1e-12)
+
+    def test_inverse_cdf_table_mean_matches_interpolated_draws(self):
+        """Test the table reports the mean of what it draws, not scipy's mean."""
+        from scipy.special import ndtr
+        from spm_monte_carlo.statistics import InverseCDFTable
+
+        distribution = stats.lognorm(1.0, 0, 20000)
+        table = InverseCDFTable(distribution)
+
+        # Dense quadrature of the interpolated values over the normal scores
+        z = np.linspace(-table.z_max, table.z_max, 2_000_001)
+        density = stats.norm.pdf(z)
+        shift = np.trapezoid(
+            (table.ppf_normal(z) - distribution.ppf(ndtr(z))) * density, z
+        )
+
+        assert table.mean() != distribution.mean()
+        assert table.mean() - distribution.mean() == pytest.approx(shift, rel=1e-3)
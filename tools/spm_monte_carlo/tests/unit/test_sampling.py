@@ -0,0 +1,127 @@
+"""Unit tests for sampling strategies and random streams."""
+
+import pytest
+import numpy as np
+from scipy import stats
+
+from spm_monte_carlo.simulation.sampling import (
+    get_sampling_strategy,
+    MultivariateSampler
+)
+from spm_monte_carlo.simulation.streams import RandomStreams
+
+
+class TestRandomStreams:
+    """Test suite for RandomStreams."""
+
+    def test_keyed_streams_are_reproducible(self):
+        """Test same key gives the same stream, different keys differ."""
+        a = RandomStreams(42).generator(3, 1).random(5)
+        b = RandomStreams(42).generator(3, 1).random(5)
+        c = RandomStreams(42).generator(3, 2).random(5)
+
+        assert np.array_equal(a, b)
+        assert not np.array_equal(a, c)
+
+    def test_child_matches_seed_sequence_spawn(self):
+        """Test child i is the i-th spawned SeedSequence child."""
+        spawned = np.random.SeedSequence(42).spawn(3)[2]
+        expected = np.random.default_rng(spawned).random(4)
+
+        assert np.array_equal(RandomStreams(42).generator(2).random(4), expected)
+
+
+class TestSamplingStrategies:
+    """Test suite for sampling strategies."""
+
+    @pytest.mark.parametrize('strategy', ['monte_carlo', 'lhs', 'sobol', 'antithetic'])
+    def test_global_random_state_untouched(self, strategy):
+        """Test sampling does not reseed the global numpy state."""
+        np.random.seed(0)
+        expected = np.random.random(3)
+
+        np.random.seed(0)
+        get_sampling_strategy(strategy).sample(
+            stats.norm(), 16, np.random.default_rng(1)
+        )
+
+        assert np.array_equal(np.random.random(3), expected)
+
+    def test_multivariate_sampler_reproducible(self):
+        """Test multivariate draws repeat for the same streams."""
+        sampler = MultivariateSampler({'a': stats.norm(), 'b': stats.gamma(2)})
+
+        first = sampler.sample(100, RandomStreams(5))
+        second = sampler.sample(100, RandomStreams(5))
+
+        assert first.shape == (100, 2)
+        assert np.array_equal(first, second)
+
+    @pytest.mark.parametrize('strategy', ['monte_carlo', 'lhs'])
+    def test_multivariate_sampler_applies_correlation(self, strategy):
+        """Test the copula reproduces the target rank correlation and marginals."""
+        target = np.array([[1.0, 0.7], [0.7, 1.0]])
+        sampler = MultivariateSampler(
+            {'a': stats.norm(10, 2), 'b': stats.gamma(3)},
+            correlation_matrix=target,
+            sampling_strategy=get_sampling_strategy(strategy)
+        )
+
+        samples = sampler.sample(20000, RandomStreams(3))
+
+        # Spearman rho of a Gaussian copula: 6/pi * arcsin(r/2)
+        expected_rho = 6 / np.pi * np.arcsin(0.7 / 2)
+        rho = stats.spearmanr(samples[:, 0], samples[:, 1]).statistic
+        assert abs(rho - expected_rho) < 0.02
+        assert abs(samples[:, 0].mean() - 10) < 0.1
+        assert (samples[:, 1] > 0).all()
+
+    def test_antithetic_draws_are_mirrored(self):
+        """Test the second half of antithetic uniforms mirrors the first."""
+        u = get_sampling_strategy('antithetic').uniform(10, np.random.default_rng(4))
+        samples = get_sampling_strategy('antithetic').sample(
+            stats.norm(5, 2), 10, np.random.default_rng(4)
+        )
+
+        assert np.allclose(u[:5] + u[5:], 1.0)
+        assert np.allclose(samples[:5] + samples[5:], 10.0)
+
+    @pytest.mark.parametrize('strategy', ['lhs', 'sobol'])
+    def test_design_stratifies_every_dimension(self, strategy):
+        """Test one QMC design covers every dimension evenly."""
+        design = get_sampling_strategy(strategy).uniform_design(
+            64, 30, np.random.default_rng(8)
+        )
+
+        assert design.shape == (64, 30)
+        strata = np.floor(design * 64).astype(int)
+        for column in strata.T:
+            assert sorted(column) == list(range(64))
+
+    def test_grouped_samples_use_one_design(self):
+        """Test grouped sampling maps each (row in group, variable) to a dimension."""
+        sampler = MultivariateSampler(
+            {'a': stats.uniform(), 'b': stats.uniform()},
+            sampling_strategy=get_sampling_strategy('lhs')
+        )
+
+        samples = sampler.sample(16 * 5, RandomStreams(2), group_size=5)
+        per_dimension = samples.reshape(16, 5 * 2)
+
+        for column in np.floor(per_dimension * 16).astype(int).T:
+            assert sorted(column) == list(range(16))
+
+    def test_sobol_groups_past_max_dimensions_fall_back_to_rows(self, caplog):
+        """Test thousands of reps per design point stay within Sobol's dimension limit."""
+        sampler = MultivariateSampler(
+            {'a': stats.uniform(), 'b': stats.uniform(), 'c': stats.uniform()},
+            sampling_strategy=get_sampling_strategy('sobol')
+        )
+
+        # 8192 reps x 3 variables is above Sobol's 21201 dimensions
+        samples = sampler.sample(4 * 8192, RandomStreams(3), group_size=8192)
+
+        assert samples.shape == (4 * 8192, 3)
+        assert 'stratifying rows individually' in caplog.text
+        for column in np.floor(samples * len(samples)).astype(int).T:
+            assert sorted(column) == list(range(len(samples)))
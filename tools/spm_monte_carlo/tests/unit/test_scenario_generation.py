@@ -0,0 +1,166 @@
+"""Unit tests for scenario generation."""
+
+import pickle
+import pytest
+import numpy as np
+import pandas as pd
+
+from spm_monte_carlo.simulation import ScenarioGenerator, ScenarioCache
+from spm_monte_carlo.statistics import DistributionFitter
+
+
+@pytest.fixture
+def fitted_distributions(sample_historical_data):
+    """Fit normal distributions to the sample data."""
+    fitter = DistributionFitter()
+    return {
+        var: fitter.fit(sample_historical_data[var].values, distribution_type='normal')
+        for var in ['quota_attainment', 'deal_count', 'avg_deal_size']
+    }
+
+
+class TestScenarioGenerator:
+    """Test suite for ScenarioGenerator."""
+
+    def test_scenario_frame_layout(self, sample_historical_data, fitted_distributions):
+        """Test one row per scenario-rep, scenario-major order."""
+        generator = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=42
+        )
+        scenarios = generator.generate(25)
+
+        n_reps = sample_historical_data['rep_id'].nunique()
+        assert len(scenarios) == 25 * n_reps
+        assert scenarios['scenario_id'].is_monotonic_increasing
+        assert list(scenarios['rep_id'].iloc[:n_reps]) == list(generator.rep_ids)
+        assert np.allclose(
+            scenarios['actual_sales'], scenarios['quota'] * scenarios['quota_attainment']
+        )
+        for var in ['deal_count', 'avg_deal_size']:
+            assert var in scenarios.columns
+
+    def test_seeded_generation_is_reproducible(self, sample_historical_data, fitted_distributions):
+        """Test same seed gives identical draws."""
+        first = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=7
+        ).generate(10)
+        second = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=7
+        ).generate(10)
+
+        assert np.array_equal(first['quota_attainment'], second['quota_attainment'])
+        assert np.array_equal(first['deal_count'], second['deal_count'])
+
+    def test_sharded_generation_matches_single_pass(self, sample_historical_data, fitted_distributions):
+        """Test generating blocks separately gives the same scenarios."""
+        generator = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=11, block_size=8
+        )
+        whole = generator.generate(30)
+        shards = [generator.generate(30, blocks=range(b, b + 1)) for b in range(4)]
+
+        stitched = pd.concat(shards, ignore_index=True)
+        pd.testing.assert_frame_equal(whole, stitched)
+
+    def test_correlation_matrix_applied(self, sample_historical_data, fitted_distributions):
+        """Test correlated variables are drawn jointly, unlisted ones independently."""
+        correlation = pd.DataFrame(
+            [[1.0, 0.8], [0.8, 1.0]],
+            index=['quota_attainment', 'deal_count'],
+            columns=['quota_attainment', 'deal_count']
+        )
+        generator = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=3,
+            correlation_matrix=correlation
+        )
+        scenarios = generator.generate(2000)
+
+        corr = scenarios[['quota_attainment', 'deal_count', 'avg_deal_size']].corr()
+        assert abs(corr.loc['quota_attainment', 'deal_count'] - 0.8) < 0.02
+        assert abs(corr.loc['quota_attainment', 'avg_deal_size']) < 0.02
+
+
+class TestScenarioStore:
+    """Test suite for the compact scenario store."""
+
+    def test_store_uses_integer_codes(self, sample_historical_data, fitted_distributions):
+        """Test ids are int32 codes and reps decode through the lookup."""
+        generator = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=1
+        )
+        store = generator.generate_store(20)
+        frame = store.to_frame()
+
+        assert store['scenario_id'].dtype == np.int32
+        assert store['rep_code'].dtype == np.int32
+        assert isinstance(frame['rep_id'].dtype, pd.CategoricalDtype)
+        assert list(frame['rep_id'].iloc[:generator.n_reps]) == list(generator.rep_ids)
+        assert np.shares_memory(frame['quota_attainment'].to_numpy(), store['quota_attainment'])
+
+    def test_float32_precision(self, sample_historical_data, fitted_distributions):
+        """Test float32 mode halves metric storage and keeps the draws."""
+        full = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=1
+        ).generate_store(20)
+        compact = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=1, precision='float32'
+        ).generate_store(20)
+
+        assert compact['actual_sales'].dtype == np.float32
+        assert compact['actual_sales'].nbytes * 2 == full['actual_sales'].nbytes
+        assert np.allclose(compact['quota_attainment'], full['quota_attainment'], rtol=1e-6)
+
+    def test_unknown_precision_rejected(self, sample_historical_data, fitted_distributions):
+        """Test unsupported precision raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown precision"):
+            ScenarioGenerator.from_history(
+                sample_historical_data, fitted_distributions, precision='float16'
+            )
+
+
+class TestScenarioCache:
+    """Test suite for ScenarioCache."""
+
+    def test_cached_blocks_match_fresh_draws(self, sample_historical_data, fitted_distributions, tmp_path):
+        """Test a second generator with the same fingerprint reads the cache."""
+        cache = ScenarioCache(directory=tmp_path)
+        fresh = ScenarioGenerator.from_history(
+            sample_historical_data, fitted_distributions, seed=5, block_size=16
+        ).generate(40)
+
+        for _ in range(2):
+            cached = ScenarioGenerator.from_history(
+                sample_historical_data, fitted_distributions, seed=5, block_size=16, cache=cache
+            ).generate(40)
+            assert np.array_equal(cached['quota_attainment'], fresh['quota_attainment'])
+
+        assert cache.misses == 3
+        assert cache.hits == 3
+        assert len(list(tmp_path.glob('*.npz'))) == 3
+
+        # A new process sees only the disk tier
+        reloaded = pickle.loads(pickle.dumps(cache))
+        assert reloaded.memory_bytes == 0
+        assert reloaded.get(next(iter(cache._memory))) is not None
+
+    def test_fingerprint_tracks_seed(self, sample_historical_data, fitted_distributions):
+        """Test generators that draw differently never share cache entries."""
+        fingerprints = {
+            ScenarioGenerator.from_history(
+                sample_historical_data, fitted_distributions, seed=seed
+            ).fingerprint
+            for seed in [1, 1, 2]
+        }
+        assert len(fingerprints) == 2
+
+    def test_disk_tier_evicts_past_budget(self, tmp_path):
+        """Test the disk tier keeps the newest files within its budget."""
+        cache = ScenarioCache(max_memory_mb=0, directory=tmp_path, max_disk_mb=0.02)
+        block = {'values': np.zeros(1000)}
+
+        for i in range(5):
+            cache.put(f"block{i}", block)
+
+        assert len(list(tmp_path.glob('*.npz'))) == 2
+        assert cache.get('block4') is not None
+        assert cache.get('block0') is None
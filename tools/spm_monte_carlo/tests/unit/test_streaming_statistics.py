@@ -0,0 +1,88 @@
+"""Unit tests for streaming statistics."""
+
+import pytest
+import numpy as np
+
+from spm_monte_carlo.statistics import RunningMoments, QuantileSketch
+
+
+class TestRunningMoments:
+    """Test suite for RunningMoments."""
+
+    def test_batched_moments_match_numpy(self):
+        """Test folding batches gives the full-sample moments."""
+        rng = np.random.default_rng(0)
+        data = rng.lognormal(10, 1, 10_000)
+
+        moments = RunningMoments()
+        for batch in np.array_split(data, 7):
+            moments.update(batch)
+
+        assert moments.count == len(data)
+        assert moments.mean == pytest.approx(data.mean(), rel=1e-12)
+        assert moments.std == pytest.approx(data.std(ddof=1), rel=1e-10)
+        assert moments.min == data.min()
+        assert moments.max == data.max()
+
+    def test_integer_weights_match_repeated_values(self):
+        """Test weighted moments equal moments of the repeated sample."""
+        rng = np.random.default_rng(2)
+        values = rng.normal(5, 2, 500)
+        weights = rng.integers(1, 4, 500)
+        repeated = np.repeat(values, weights)
+
+        moments = RunningMoments()
+        for v, w in zip(np.array_split(values, 3), np.array_split(weights, 3)):
+            moments.update(v, w)
+
+        assert moments.count == len(values)
+        assert moments.weight == weights.sum()
+        assert moments.mean == pytest.approx(repeated.mean(), rel=1e-12)
+        assert moments.m2 == pytest.approx(((repeated - repeated.mean()) ** 2).sum(), rel=1e-10)
+
+
+class TestQuantileSketch:
+    """Test suite for QuantileSketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test sketch quantiles stay within the configured error."""
+        rng = np.random.default_rng(1)
+        data = np.concatenate([np.zeros(2_000), rng.gamma(2, 5_000, 50_000)])
+
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.update(data)
+
+        for q in [0.5, 0.9, 0.95, 0.99]:
+            exact = np.quantile(data, q)
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    def test_merged_sketch_equals_single_sketch(self):
+        """Test sketches built on separate batches merge exactly."""
+        rng = np.random.default_rng(2)
+        data = rng.normal(0, 100, 20_000)
+
+        whole = QuantileSketch()
+        whole.update(data)
+
+        merged = QuantileSketch()
+        for batch in np.array_split(data, 4):
+            part = QuantileSketch()
+            part.update(batch)
+            merged.merge(part)
+
+        for q in [0.01, 0.5, 0.99]:
+            assert merged.quantile(q) == whole.quantile(q)
+
+    def test_weighted_sketch_matches_repeated_values(self):
+        """Test weights act as repeat counts in the sketch."""
+        rng = np.random.default_rng(3)
+        values = rng.gamma(2, 1_000, 2_000)
+        weights = rng.integers(1, 5, 2_000)
+
+        weighted = QuantileSketch()
+        weighted.update(values, weights)
+        repeated = QuantileSketch()
+        repeated.update(np.repeat(values, weights))
+
+        for q in [0.5, 0.95, 0.99]:
+            assert weighted.quantile(q) == repeated.quantile(q)